@@ -0,0 +1,44 @@
+import sys
+import multiprocessing
+import argparse
+
+from controllers.batch_report_controller import BatchReportController
+from utils.logging import setup_logging
+from utils.tracing import setup_tracing
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate accuracy reports for many Wisdom jobs without the GUI.")
+    parser.add_argument("jobs", nargs="+", help="Job numbers or paths to Wisdom .MDB files")
+    parser.add_argument("-o", "--output-dir", required=True, help="Directory the PDF reports are written to")
+    parser.add_argument("--hours", help="CSV of employee hours with emp_id,hours and an optional job column")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk Wisdom query cache")
+
+    return parser.parse_args(argv)
+
+
+def print_result(result):
+    status = "ok" if result.succeeded else "FAILED"
+    detail = result.pdf_path if result.succeeded else result.error
+
+    print(f"{result.job:<24} {status:<7} load {result.load_seconds:7.2f}s  report {result.report_seconds:7.2f}s  save {result.save_seconds:7.2f}s  total {result.total_seconds:7.2f}s  {detail}", flush=True)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    args = parse_args()
+
+    setup_logging()
+    setup_tracing()
+
+    controller = BatchReportController(args.output_dir, args.hours, args.workers, use_cache=not args.no_cache)
+    results = controller.run(args.jobs, on_result=print_result)
+
+    failed = [r for r in results if not r.succeeded]
+    total = sum(r.total_seconds for r in results)
+
+    print(f"\n{len(results) - len(failed)}/{len(results)} jobs succeeded, {total:.2f}s of job time")
+
+    sys.exit(1 if failed else 0)
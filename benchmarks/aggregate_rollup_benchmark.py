@@ -0,0 +1,93 @@
+import tempfile
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from factories.base_connection_factory import BaseConnectionFactory
+from repositories.local.local_schema_repository import LocalSchemaRepository
+from repositories.local.local_employee_repository import LocalEmployeeRepository
+from repositories.local.local_zone_repository import LocalZoneRepository
+
+STORE_COUNTS = [1_000, 5_000]
+EMPS_PER_STORE = 40
+ZONES_PER_STORE = 30
+YEARS = 5
+REPEATS = 5
+
+RANGES = {
+    "1 month": (date(2024, 3, 1), date(2024, 3, 31)),
+    "6 months, ragged": (date(2023, 11, 17), date(2024, 5, 9)),
+    "5 years": (date(2021, 1, 1), date(2025, 12, 31)),
+}
+
+
+def build_database(path: Path, stores: int):
+    rng = np.random.default_rng(seed=stores)
+    conn = BaseConnectionFactory()._connect_sqlite(str(path))
+    schema_repo = LocalSchemaRepository(conn)
+    schema_repo.create_tables_if_not_exists()
+
+    start = datetime(2021, 1, 1)
+    offsets = rng.integers(0, YEARS * 365 * 24, stores)
+
+    conn.executemany(
+        "INSERT INTO tblInventory (StoreNo, StoreName, JobDateTime, Address) VALUES (?, ?, ?, ?)",
+        [(f"S{i}", f"Store S{i}", start + timedelta(hours=int(offset)), "") for i, offset in enumerate(offsets)]
+    )
+    conn.executemany(
+        "INSERT INTO tblEmps VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (f"E{emp}", f"S{i}", f"Employee {emp}", int(tags), int(tags * 9), float(tags * 21.5), float(tags % 7), int(tags % 3), float(tags % 9))
+            for i in range(stores)
+            for emp, tags in zip(rng.choice(400, EMPS_PER_STORE, replace=False), rng.integers(20, 400, EMPS_PER_STORE))
+        ]
+    )
+    conn.executemany(
+        "INSERT INTO tblZones VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (f"Z{zone}", f"S{i}", f"Zone {zone}", int(tags), int(tags * 9), float(tags * 21.5), float(tags % 7), int(tags % 3))
+            for i in range(stores)
+            for zone, tags in zip(rng.choice(200, ZONES_PER_STORE, replace=False), rng.integers(20, 400, ZONES_PER_STORE))
+        ]
+    )
+    conn.commit()
+
+    schema_repo.rebuild_rollups()
+
+    return conn
+
+
+def measure(fn):
+    best = float("inf")
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def run():
+    print(f"{'stores':>8} {'range':<18} {'raw (ms)':>10} {'rollup (ms)':>12} {'speedup':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for stores in STORE_COUNTS:
+            conn = build_database(Path(tmp) / f"local_{stores}.sqlite3", stores)
+            repos = [LocalEmployeeRepository(conn), LocalZoneRepository(conn)]
+
+            for label, (start_date, end_date) in RANGES.items():
+                date_range = [datetime.combine(start_date, dt_time.min), datetime.combine(end_date, dt_time.max)]
+
+                raw = measure(lambda: [repo._combine([repo._read(repo.RAW_READ_QUERY, date_range)]) for repo in repos])
+                rollup = measure(lambda: [repo._read_aggregate(date_range) for repo in repos])
+
+                print(f"{stores:>8} {label:<18} {raw * 1000:>10.1f} {rollup * 1000:>12.1f} {raw / rollup:>7.1f}x")
+
+            conn.close()
+
+
+if __name__ == "__main__":
+    run()
\ No newline at end of file
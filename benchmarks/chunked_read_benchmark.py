@@ -0,0 +1,74 @@
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from repositories.wisdom.wisdom_employee_repository import WisdomEmployeeRepository
+from mappers.wisdom.wisdom_employee_mapper import WisdomEmployeeMapper
+
+ROW_COUNTS = [100_000, 1_000_000]
+CHUNK_SIZE = 50_000
+
+
+def build_database(path: Path, rows: int):
+    rng = np.random.default_rng(seed=rows)
+    conn = sqlite3.connect(path)
+
+    conn.execute("CREATE TABLE tblDetails (tag INTEGER, empno TEXT, price DOUBLE, qty INTEGER)")
+    conn.executemany(
+        "INSERT INTO tblDetails (tag, empno, price, qty) VALUES (?, ?, ?, ?)",
+        zip(
+            rng.integers(1, rows // 20 + 2, rows).tolist(),
+            [f"E{i:04d}" for i in rng.integers(0, 500, rows)],
+            rng.uniform(0.5, 200, rows).round(2).tolist(),
+            rng.integers(1, 50, rows).tolist(),
+        )
+    )
+    conn.commit()
+    conn.close()
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    fn()
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / 1_048_576
+
+
+def run():
+    mapper = WisdomEmployeeMapper()
+
+    print(f"{'rows':>10} {'mode':<22} {'time (s)':>10} {'peak (MiB)':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in ROW_COUNTS:
+            db_path = Path(tmp) / f"details_{rows}.db"
+            build_database(db_path, rows)
+
+            conn = sqlite3.connect(db_path)
+            repo = WisdomEmployeeRepository(conn)
+
+            modes = {
+                "fetchall": lambda: repo._read(repo.DETAILS_QUERY),
+                "fetchmany frame": lambda: repo.get_details(chunk_size=CHUNK_SIZE),
+                "fetchmany summarize": lambda: mapper.summarize_details(repo.iter_details(chunk_size=CHUNK_SIZE)),
+            }
+
+            for mode, fn in modes.items():
+                elapsed, peak = measure(fn)
+                print(f"{rows:>10} {mode:<22} {elapsed:>10.3f} {peak:>12.1f}")
+
+            conn.close()
+
+
+if __name__ == "__main__":
+    run()
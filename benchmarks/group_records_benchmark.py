@@ -0,0 +1,63 @@
+import time
+import numpy as np
+import pandas as pd
+
+from mappers.base_mapper import BaseMapper
+from domain.constants.wisdom.rename_map import WISDOM_DISCREPANCY_RENAME_MAP
+
+SCENARIOS = [
+    ("employees", 1_000, 20_000),
+    ("employees", 5_000, 100_000),
+    ("zones", 2_000, 50_000),
+    ("zones", 10_000, 200_000),
+]
+REPEATS = 3
+
+
+def build_frame(key: str, groups: int, rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=groups + rows)
+
+    return pd.DataFrame({
+        key: [f"{key[0].upper()}{i:05d}" for i in rng.integers(0, groups, rows)],
+        "Tag": rng.integers(1, 50_000, rows),
+        "ZoneID": rng.integers(1, 500, rows).astype(str),
+        "UPC": [f"{i:012d}" for i in rng.integers(0, 10**12, rows)],
+        "Price": rng.uniform(0.5, 500, rows).round(2),
+        "Quantity": rng.integers(0, 100, rows),
+        "CountedQty": rng.integers(0, 100, rows),
+        "LineError": rng.uniform(50, 5_000, rows).round(2),
+    })
+
+
+def group_with_apply(df: pd.DataFrame, key: str):
+    columns = ['Tag', 'ZoneID', 'UPC', 'Price', 'Quantity', 'CountedQty', 'LineError']
+
+    return df.groupby(key)[columns].apply(lambda g: g.rename(columns={'Quantity': 'NewQty'}).to_dict('records')).to_dict()
+
+
+def best_of(fn, *args) -> float:
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def run():
+    print(f"{'key':<10} {'groups':>8} {'rows':>9} {'apply (s)':>11} {'kernel (s)':>11} {'speedup':>9}")
+
+    for label, groups, rows in SCENARIOS:
+        key = "TerminalUser" if label == "employees" else "ZoneKey"
+        df = build_frame(key, groups, rows)
+
+        legacy = best_of(group_with_apply, df, key)
+        kernel = best_of(BaseMapper._group_records, df, key, WISDOM_DISCREPANCY_RENAME_MAP)
+
+        print(f"{label:<10} {groups:>8} {rows:>9} {legacy:>11.4f} {kernel:>11.4f} {legacy / kernel:>8.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,68 @@
+import time
+import numpy as np
+import pandas as pd
+
+from mappers.base_mapper import BaseMapper
+from domain.dto.employee import Employee
+from domain.constants.local.rename_map import EMP_RENAME_MAP
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+REPEATS = 3
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=rows)
+
+    return pd.DataFrame({
+        "EmpID": [f"E{i:06d}" for i in range(rows)],
+        "EmpName": [f"Employee {i}" for i in range(rows)],
+        "TotalPrice": rng.uniform(0, 50_000, rows),
+        "TotalTags": rng.integers(0, 500, rows),
+        "TotalQty": rng.integers(0, 20_000, rows),
+        "ZoneErrorTotal": rng.uniform(0, 500, rows),
+        "ZoneErrorTags": rng.integers(0, 20, rows),
+        "ZoneErrorPercent": rng.uniform(0, 5, rows),
+        "ZoneErrors": [[] for _ in range(rows)],
+        "Hours": rng.uniform(1, 10, rows),
+        "UPH": rng.uniform(0, 2_000, rows),
+    })
+
+
+def map_with_iterrows(df: pd.DataFrame, model, field_map: dict):
+    results = []
+
+    for _, row in df.iterrows():
+        kwargs = {
+            model_field: row.get(df_column)
+            for df_column, model_field in field_map.items()
+        }
+        results.append(model(**kwargs))
+
+    return results
+
+
+def best_of(fn, *args) -> float:
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def run():
+    print(f"{'rows':>10} {'iterrows (s)':>14} {'columnar (s)':>14} {'speedup':>9}")
+
+    for rows in ROW_COUNTS:
+        df = build_frame(rows)
+
+        legacy = best_of(map_with_iterrows, df, Employee, EMP_RENAME_MAP)
+        columnar = best_of(BaseMapper._map_dataframe, df, Employee, EMP_RENAME_MAP)
+
+        print(f"{rows:>10} {legacy:>14.4f} {columnar:>14.4f} {legacy / columnar:>8.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,289 @@
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic_wisdom import SCALES, build_wisdom_job
+from factories.base_connection_factory import BaseConnectionFactory
+from mappers.wisdom.wisdom_employee_mapper import WisdomEmployeeMapper
+from mappers.wisdom.wisdom_zone_mapper import WisdomZoneMapper
+from services.wisdom.wisdom_load_service import WisdomLoadService
+from services.local.local_data_save_service import LocalDataSaveService
+from services.reporting.report_generator_service import ReportGeneratorService
+from services.reporting.report_template_service import ReportTemplateService
+from services.reporting.report_data_service import ReportDataService
+from services.reporting.report_rendering_service import ReportRenderingService
+from services.reporting.report_pagination_service import ReportPaginationService
+from services.reporting.pdf_export_service import PdfExportService
+from repositories.local.local_store_repository import LocalStoreRepository
+from repositories.local.local_employee_repository import LocalEmployeeRepository
+from repositories.local.local_zone_repository import LocalZoneRepository
+from repositories.local.local_discrepancy_repository import LocalDiscrepancyRepository
+from repositories.local.local_schema_repository import LocalSchemaRepository
+from repositories.unit_of_work import UnitOfWork
+from utils.paths import resource_path
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SCALES = ["small", "medium"]
+DEFAULT_REPEATS = 3
+REGRESSION_THRESHOLD = 0.10
+
+
+class SqliteConnectionFactory(BaseConnectionFactory):
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+
+    def create(self):
+        return self._connect_sqlite(str(self.db_path))
+
+    def close_pool(self):
+        pass
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the load, save and report pipeline against a synthetic Wisdom job.")
+    parser.add_argument("--scale", nargs="+", choices=sorted(SCALES), default=DEFAULT_SCALES, help="Synthetic job sizes to run")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Timed runs per stage; the fastest is compared")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic data generator")
+    parser.add_argument("--skip-pdf", action="store_true", help="Skip the PDF export stage")
+    parser.add_argument("--output", type=Path, help="Result JSON path (default: benchmarks/results/pipeline_<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, help="Earlier result JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Slowdown ratio reported as a regression")
+
+    return parser.parse_args(argv)
+
+
+def time_stage(fn, repeats: int, setup=None) -> dict:
+    timings = []
+    result = None
+
+    for _ in range(repeats):
+        args = setup() if setup else ()
+
+        start = time.perf_counter()
+        result = fn(*args)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "best_s": round(min(timings), 6),
+        "median_s": round(statistics.median(timings), 6),
+        "runs_s": [round(t, 6) for t in timings],
+        "result": result,
+    }
+
+
+def fetch_frames(factory: SqliteConnectionFactory) -> dict:
+    conn = factory.create()
+
+    try:
+        return {
+            name: getattr(repo_class(conn), method)()
+            for name, (repo_class, method) in WisdomLoadService.QUERIES.items()
+        }
+
+    finally:
+        conn.close()
+
+
+def save_local(factory: SqliteConnectionFactory, report_data):
+    conn = factory.create()
+
+    try:
+        unit_of_work = UnitOfWork(conn)
+
+        LocalDataSaveService(
+            LocalStoreRepository(conn, unit_of_work=unit_of_work),
+            LocalEmployeeRepository(conn, unit_of_work=unit_of_work),
+            LocalZoneRepository(conn, unit_of_work=unit_of_work),
+            LocalDiscrepancyRepository(conn, unit_of_work=unit_of_work),
+            LocalSchemaRepository(conn),
+            unit_of_work=unit_of_work,
+        ).save_all(report_data)
+
+    finally:
+        conn.close()
+
+
+def render_html(generator: ReportGeneratorService, report_data) -> int:
+    templates = generator.templates.get_standard_templates()
+    view_model = generator.data.build_view_model(report_data.employees, report_data.zones)
+    pagination = generator.pagination.paginate(templates, view_model)
+
+    return sum(len(html) for html in generator.renderer.render_sections(templates, report_data.context, pagination))
+
+
+def run_scale(name: str, args, workdir: Path) -> dict:
+    job_path = workdir / f"{name}.db"
+    rows = build_wisdom_job(job_path, SCALES[name], seed=args.seed)
+    wisdom = SqliteConnectionFactory(job_path)
+
+    stages = {}
+    stages["wisdom_load"] = time_stage(lambda: WisdomLoadService(wisdom).load(), args.repeats)
+    report_data = stages["wisdom_load"]["result"]
+
+    frames = fetch_frames(wisdom)
+    emp_mapper = WisdomEmployeeMapper()
+    zone_mapper = WisdomZoneMapper()
+
+    stages["employee_mapper"] = time_stage(
+        lambda: emp_mapper.to_employee_models_from_summary(
+            frames["terminals"],
+            frames["employees"],
+            frames["detail_summary"],
+            frames["detail_tags"],
+            frames["zone_errors"],
+            frames["manual_adjustments"],
+        ),
+        args.repeats,
+    )
+    stages["zone_mapper"] = time_stage(lambda: zone_mapper.to_zone_models(frames["zones"], frames["totals"], frames["zone_errors"]), args.repeats)
+
+    hours = np.random.default_rng(args.seed).uniform(2, 10, len(report_data.employees)).round(2).tolist()
+
+    for emp, emp_hours in zip(report_data.employees, hours):
+        emp.hours = emp_hours
+
+    local_paths = iter(workdir / f"{name}_local_{i}.sqlite3" for i in range(args.repeats * 2))
+
+    stages["local_save_insert"] = time_stage(
+        save_local,
+        args.repeats,
+        setup=lambda: (SqliteConnectionFactory(next(local_paths)), report_data),
+    )
+
+    existing = SqliteConnectionFactory(next(local_paths))
+    save_local(existing, report_data)
+    stages["local_save_update"] = time_stage(lambda: save_local(existing, report_data), args.repeats)
+
+    generator = ReportGeneratorService(
+        template_service=ReportTemplateService(),
+        data_service=ReportDataService(),
+        rendering_service=ReportRenderingService(),
+        pdf_service=PdfExportService(output_dir=workdir / "reports"),
+        pagination_service=ReportPaginationService(),
+    )
+
+    render_html(generator, report_data)
+    stages["report_html"] = time_stage(lambda: render_html(generator, report_data), args.repeats)
+
+    if not args.skip_pdf:
+        stages["report_pdf"] = time_stage(lambda: generator.generate_report(report_data, f"{name}.pdf"), args.repeats)
+
+    for stage in stages.values():
+        stage.pop("result")
+
+    return {
+        "rows": {
+            **rows,
+            "employees_loaded": len(report_data.employees),
+            "zones_loaded": len(report_data.zones),
+            "discrepancy_lines": sum(len(emp.zone_errors) for emp in report_data.employees),
+            "manual_lines": sum(len(emp.manual_adjustments) for emp in report_data.employees),
+        },
+        "stages": stages,
+    }
+
+
+def app_version() -> str | None:
+    try:
+        with open(resource_path("assets/resources/config.json"), "r") as file:
+            return json.load(file).get("version")
+
+    except Exception:
+        return None
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+
+    except Exception:
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+
+    print(f"\nCompared with {baseline.get('revision') or baseline.get('version')} ({baseline.get('timestamp')}):")
+    print(f"{'scale':<8} {'stage':<20} {'baseline (s)':>13} {'current (s)':>12} {'change':>9}")
+
+    for scale, current in results["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+
+        if previous is None:
+            continue
+
+        for stage, timing in current["stages"].items():
+            before = previous["stages"].get(stage)
+
+            if before is None or not before["best_s"]:
+                continue
+
+            change = timing["best_s"] / before["best_s"] - 1
+            flag = "  REGRESSION" if change > threshold else ""
+
+            if flag:
+                regressions.append(f"{scale}/{stage}")
+
+            print(f"{scale:<8} {stage:<20} {before['best_s']:>13.4f} {timing['best_s']:>12.4f} {change:>+8.1%}{flag}")
+
+    return regressions
+
+
+def run(argv=None) -> int:
+    args = parse_args(argv)
+
+    results = {
+        "benchmark": "pipeline",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "version": app_version(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeats": args.repeats,
+        "scales": {},
+    }
+
+    print(f"{'scale':<8} {'stage':<20} {'best (s)':>10} {'median (s)':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.scale:
+            results["scales"][name] = run_scale(name, args, Path(tmp))
+
+            for stage, timing in results["scales"][name]["stages"].items():
+                print(f"{name:<8} {stage:<20} {timing['best_s']:>10.4f} {timing['median_s']:>11.4f}")
+
+    output = args.output or RESULTS_DIR / f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) slower than the baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
\ No newline at end of file
@@ -0,0 +1,174 @@
+import time
+import numpy as np
+from jinja2 import Environment, DictLoader
+
+from domain.dto.employee import Employee
+from domain.dto.discrepancy import Discrepancy
+from services.reporting.report_data_service import ReportDataService
+
+SCENARIOS = [
+    (50, 2_000),
+    (200, 10_000),
+    (500, 50_000),
+]
+REPEATS = 3
+
+LEGACY_TEMPLATES = {
+    "emp": (
+        "<table>{% for emp in emps %}"
+        "{% if emp.zone_error_percent >= 1.5 %}<tr style=\"background-color: #ffcccc;\">"
+        "{% elif emp.zone_error_percent >= 1.0 %}<tr style=\"background-color: #ffffcc;\">"
+        "{% else %}<tr>{% endif %}"
+        "<td>{{ \"%s\"|format(emp.emp_id) }}</td><td>{{ \"%s\"|format(emp.emp_name) }}</td>"
+        "<td>${{ \"%.2f\"|format(emp.zone_error_total) }}</td><td>{{ \"%i\"|format(emp.zone_error_tags) }}</td>"
+        "<td>{{ \"%.2f\"|format(emp.zone_error_percent) }}%</td><td>${{ \"%.2f\"|format(emp.total_price) }}</td>"
+        "<td>{{ \"%i\"|format(emp.total_tags) }}</td><td>{{ \"%i\"|format(emp.total_qty) }}</td>"
+        "<td>{{ \"%i\"|format(emp.uph) }}</td></tr>"
+        "{% endfor %}</table>"
+    ),
+    "emp_man": (
+        "<table>{% for emp in emps %}"
+        "{% if (emp.zone_error_percent + emp.manual_adjustment_percent) >= 1.5 %}<tr style=\"background-color: #ffcccc;\">"
+        "{% elif (emp.zone_error_percent + emp.manual_adjustment_percent) >= 1.0 %}<tr style=\"background-color: #ffffcc;\">"
+        "{% else %}<tr>{% endif %}"
+        "<td>{{ \"%s\"|format(emp.emp_id) }}</td><td>{{ \"%s\"|format(emp.emp_name) }}</td>"
+        "<td>${{ \"%.2f\"|format(emp.zone_error_total + emp.manual_adjustment_total) }}</td>"
+        "<td>{{ \"%i\"|format(emp.total_error_tags) }}</td>"
+        "<td>{{ \"%.2f\"|format(emp.zone_error_percent + emp.manual_adjustment_percent) }}%</td>"
+        "<td>${{ \"%.2f\"|format(emp.total_price) }}</td><td>{{ \"%i\"|format(emp.total_tags) }}</td>"
+        "<td>{{ \"%i\"|format(emp.total_qty) }}</td><td>{{ \"%i\"|format(emp.uph) }}</td></tr>"
+        "{% endfor %}</table>"
+    ),
+    "disc": (
+        "<table>{% for emp in emps %}{% for line in emp.zone_errors %}<tr>"
+        "<td>{{ \"%s\"|format(emp.emp_id) }}</td><td>{{ \"%s\"|format(line.zone_id) }}</td>"
+        "<td>{{ \"%s\"|format(line.tag) }}</td><td>{{ \"%s\"|format(line.upc) }}</td>"
+        "<td>${{ \"%.2f\"|format(line.price) }}</td><td>{{ \"%i\"|format(line.counted_qty) }}</td>"
+        "<td>{{ \"%i\"|format(line.new_qty) }}</td><td>${{ \"%.2f\"|format(line.line_error) }}</td>"
+        "</tr>{% endfor %}{% endfor %}</table>"
+    ),
+    "man": (
+        "<table>{% for emp in emps %}{% for line in emp.manual_adjustments %}<tr>"
+        "<td>{{ \"%s\"|format(emp.emp_id) }}</td><td>{{ \"%s\"|format(line.zone_id) }}</td>"
+        "<td>{{ \"%s\"|format(line.tag) }}</td><td>{{ \"%s\"|format(line.upc) }}</td>"
+        "<td>${{ \"%.2f\"|format(line.price) }}</td><td>{{ \"%i\"|format(line.counted_qty) }}</td>"
+        "<td>{{ \"%i\"|format(line.new_qty) }}</td><td>${{ \"%.2f\"|format(line.line_error) }}</td>"
+        "</tr>{% endfor %}{% endfor %}</table>"
+    ),
+}
+
+EMPLOYEE_ROW_TEMPLATE = (
+    "<table>{% for row in rows %}<tr{{ row.row_style }}>"
+    "<td>{{ row.emp_id }}</td><td>{{ row.emp_name }}</td><td>{{ row.error_total }}</td>"
+    "<td>{{ row.error_tags }}</td><td>{{ row.error_percent }}%</td><td>{{ row.total_price }}</td>"
+    "<td>{{ row.total_tags }}</td><td>{{ row.total_qty }}</td><td>{{ row.uph }}</td></tr>"
+    "{% endfor %}</table>"
+)
+LINE_ROW_TEMPLATE = (
+    "<table>{% for row in rows %}<tr>"
+    "<td>{{ row.emp_id }}</td><td>{{ row.zone_id }}</td><td>{{ row.tag }}</td><td>{{ row.upc }}</td>"
+    "<td>{{ row.price }}</td><td>{{ row.counted_qty }}</td><td>{{ row.new_qty }}</td><td>{{ row.line_error }}</td>"
+    "</tr>{% endfor %}</table>"
+)
+
+VIEW_MODEL_TEMPLATES = {
+    "emp": EMPLOYEE_ROW_TEMPLATE,
+    "emp_man": EMPLOYEE_ROW_TEMPLATE,
+    "disc": LINE_ROW_TEMPLATE,
+    "man": LINE_ROW_TEMPLATE,
+}
+
+
+def build_employees(employees: int, lines: int) -> list[Employee]:
+    rng = np.random.default_rng(seed=employees + lines)
+    owners = rng.integers(0, employees, lines)
+    discrepancies = [[] for _ in range(employees)]
+    adjustments = [[] for _ in range(employees)]
+    manual = rng.random(lines) < 0.25
+
+    for owner, is_manual, tag, zone, upc, price, counted, new, error in zip(
+        owners,
+        manual,
+        rng.integers(1, 50_000, lines),
+        rng.integers(1, 500, lines),
+        rng.integers(0, 10**12, lines),
+        rng.uniform(0.5, 500, lines).round(2),
+        rng.integers(0, 100, lines),
+        rng.integers(0, 100, lines),
+        rng.uniform(50, 5_000, lines).round(2),
+    ):
+        (adjustments if is_manual else discrepancies)[owner].append(Discrepancy(
+            tag=str(tag),
+            zone_id=str(zone),
+            upc=f"{upc:012d}",
+            price=float(price),
+            counted_qty=int(counted),
+            new_qty=int(new),
+            line_error=float(error),
+        ))
+
+    return [
+        Employee(
+            emp_id=f"{i:04d}",
+            emp_name=f"Employee {i}",
+            total_price=float(rng.uniform(1_000, 100_000)),
+            total_tags=int(rng.integers(10, 500)),
+            total_qty=int(rng.integers(100, 20_000)),
+            zone_error_total=float(rng.uniform(0, 5_000)),
+            zone_error_tags=len(discrepancies[i]),
+            zone_error_percent=float(rng.uniform(0, 3)),
+            zone_errors=discrepancies[i],
+            manual_adjustment_total=float(sum(line.line_error for line in adjustments[i])),
+            manual_adjustment_tags=len(adjustments[i]),
+            manual_adjustment_percent=float(rng.uniform(0, 1)),
+            manual_adjustments=adjustments[i],
+            total_error_tags=len(discrepancies[i]) + len(adjustments[i]),
+            hours=float(rng.uniform(1, 10)),
+        )
+        for i in range(employees)
+    ]
+
+
+def render_legacy(env: Environment, employees: list[Employee]) -> int:
+    for e in employees:
+        e.uph = (e.total_qty / e.hours) if e.hours > 0 else 0
+
+    emps = sorted(employees, key=lambda x: (-x.uph, -x.total_qty))
+
+    return sum(len(env.get_template(name).render(emps=emps)) for name in LEGACY_TEMPLATES)
+
+
+def render_view_model(env: Environment, employees: list[Employee]) -> int:
+    view_model = ReportDataService.build_view_model(employees, [])
+
+    return sum(len(env.get_template(name).render(rows=view_model.sections[name])) for name in VIEW_MODEL_TEMPLATES)
+
+
+def best_of(fn, *args) -> float:
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def run():
+    legacy_env = Environment(loader=DictLoader(LEGACY_TEMPLATES))
+    view_model_env = Environment(loader=DictLoader(VIEW_MODEL_TEMPLATES))
+
+    print(f"{'employees':>10} {'lines':>9} {'legacy (s)':>11} {'view model (s)':>15} {'speedup':>9}")
+
+    for employees, lines in SCENARIOS:
+        emp_data = build_employees(employees, lines)
+
+        legacy = best_of(render_legacy, legacy_env, emp_data)
+        view_model = best_of(render_view_model, view_model_env, emp_data)
+
+        print(f"{employees:>10} {lines:>9} {legacy:>11.4f} {view_model:>15.4f} {legacy / view_model:>8.1f}x")
+
+
+if __name__ == "__main__":
+    run()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import sys
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from pypdf import PdfReader
+
+from benchmarks.report_render_benchmark import build_employees
+from domain.dto.zone import Zone
+from domain.dto.report_context import StoreReportContext
+from domain.dto.report_data import StoreReportData
+from services.reporting.report_generator_service import ReportGeneratorService
+from services.reporting.report_template_service import ReportTemplateService
+from services.reporting.report_data_service import ReportDataService
+from services.reporting.report_rendering_service import ReportRenderingService
+from services.reporting.pdf_export_service import PdfExportService
+from services.reporting.report_section_cache import ReportSectionCache
+
+SCENARIOS = [
+    (50, 500),
+    (100, 2_000),
+]
+HOURS_SECTIONS = {"emp_report.html", "emp_man_report.html"}
+
+
+class RecordingRenderingService(ReportRenderingService):
+
+    def __init__(self):
+        self.rendered = []
+
+    def render_sections(self, templates, store_data, pagination):
+        self.rendered.append({template.name for template in templates})
+
+        return ReportRenderingService.render_sections(templates, store_data, pagination)
+
+
+def build_report(employees: int, lines: int) -> StoreReportData:
+    context = StoreReportContext(
+        print_date="01/01/2026",
+        print_time="09:00:00AM",
+        store_name="Store 1234",
+        store_address="1 Main St",
+        job_datetime="2026-01-01 08:00:00",
+    )
+    zones = [
+        Zone(
+            zone_id=str(i),
+            zone_desc=f"Zone {i}",
+            total_tags=40,
+            total_price=5_000.0,
+            total_qty=350,
+            zone_error_total=125.0,
+            zone_error_tags=3,
+            zone_error_percent=2.5,
+        )
+        for i in range(1, 41)
+    ]
+
+    return StoreReportData(context, build_employees(employees, lines), zones)
+
+
+def page_text(path: Path) -> list[str]:
+    return [page.extract_text() for page in PdfReader(path).pages]
+
+
+def run() -> int:
+    failures = 0
+    templates = ReportTemplateService()
+
+    print(f"{'employees':>10} {'lines':>7} {'first (s)':>10} {'reprint (s)':>12} {'sections':>9}  check")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = PdfExportService(tmp)
+        fresh = ReportGeneratorService(templates, ReportDataService(), ReportRenderingService(), pdf)
+
+        for employees, lines in SCENARIOS:
+            renderer = RecordingRenderingService()
+            cached = ReportGeneratorService(templates, ReportDataService(), renderer, pdf, section_cache=ReportSectionCache())
+            report = build_report(employees, lines)
+
+            start = time.perf_counter()
+            cached.generate_report(report, f"first_{employees}.pdf")
+            first = time.perf_counter() - start
+
+            for emp in report.employees[::3]:
+                emp.hours = (emp.hours or 0) + 1.5
+
+            start = time.perf_counter()
+            reprint = cached.generate_report(report, f"reprint_{employees}.pdf")
+            second = time.perf_counter() - start
+
+            reference = fresh.generate_report(report, f"fresh_{employees}.pdf")
+            rendered = renderer.rendered[-1]
+            ok = rendered == HOURS_SECTIONS and page_text(reprint) == page_text(reference)
+            failures += not ok
+
+            print(f"{employees:>10} {lines:>7} {first:>10.2f} {second:>12.2f} {len(rendered):>9}  {'ok' if ok else 'FAILED: ' + ', '.join(sorted(rendered))}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    logging.getLogger("xhtml2pdf").setLevel(logging.ERROR)
+    sys.exit(run())
\ No newline at end of file
@@ -0,0 +1,132 @@
+import sqlite3
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import numpy as np
+
+EXCLUDED_EMPLOYEE = "ZZ9999"
+TAGS_PER_RANGE = 25
+MISCOUNT_REASON = "SERVICE_MISCOUNTED"
+OTHER_REASONS = ["CUSTOMER_RECOUNT", "SERVICE_SKIPPED"]
+
+
+@dataclass(frozen=True, slots=True)
+class WisdomJobScale:
+    employees: int
+    zones: int
+    tags: int
+    details: int
+    zone_errors: int
+    manual_adjustments: int
+
+
+SCALES = {
+    "small": WisdomJobScale(employees=25, zones=20, tags=2_000, details=20_000, zone_errors=80, manual_adjustments=40),
+    "medium": WisdomJobScale(employees=80, zones=60, tags=10_000, details=200_000, zone_errors=400, manual_adjustments=200),
+    "large": WisdomJobScale(employees=250, zones=150, tags=40_000, details=1_000_000, zone_errors=2_000, manual_adjustments=1_000),
+}
+
+SCHEMA = """
+    CREATE TABLE tblWISEInfo (JobDateTime DATETIME, Name TEXT, Address TEXT);
+    CREATE TABLE tblTerminalControl (TerminalUser TEXT);
+    CREATE TABLE tblEmpNames (EmpNo TEXT, Name TEXT);
+    CREATE TABLE tblDetails (DetailsID INTEGER PRIMARY KEY, tag INTEGER, empno TEXT, price DOUBLE, qty INTEGER);
+    CREATE TABLE tblZone (ZoneID TEXT, ZoneDesc TEXT);
+    CREATE TABLE tblTagRange (ZoneID TEXT, TagValFrom INTEGER, TagValTo INTEGER, TotalEXTPRICE DOUBLE, TotalQty INTEGER);
+    CREATE TABLE tblZoneChangeQueue (ZoneQueueID INTEGER PRIMARY KEY, Tag INTEGER, ZoneID TEXT, UPC TEXT, Price DOUBLE, Quantity INTEGER, Reason TEXT);
+    CREATE TABLE tblZoneChangeInfo (ZoneQueueID INTEGER PRIMARY KEY, CountedQty INTEGER);
+    CREATE TABLE tblDetailsOrg (DetailsID INTEGER PRIMARY KEY, ZoneID TEXT, qty INTEGER);
+    CREATE TABLE tblDetailsEdit (EditID INTEGER PRIMARY KEY, DetailsID INTEGER, tag INTEGER, sku TEXT, price DOUBLE, qty INTEGER, Errors INTEGER, AdjustmentTypeID INTEGER);
+    CREATE INDEX idx_details_edit_details_id ON tblDetailsEdit (DetailsID);
+"""
+
+
+def build_wisdom_job(path: Path, scale: WisdomJobScale, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+
+    emp_ids = np.array([f"{i:04d}" for i in range(1, scale.employees + 1)])
+    zone_ids = np.array([str(i) for i in range(1, scale.zones + 1)])
+
+    range_starts = np.arange(1, scale.tags + 1, TAGS_PER_RANGE)
+    range_ends = np.minimum(range_starts + TAGS_PER_RANGE - 1, scale.tags)
+    range_zones = zone_ids[np.arange(len(range_starts)) % scale.zones]
+    tag_zones = np.repeat(range_zones, range_ends - range_starts + 1)
+    tag_owners = rng.integers(0, scale.employees, scale.tags)
+
+    detail_tags = rng.integers(1, scale.tags + 1, scale.details)
+    detail_emps = emp_ids[tag_owners[detail_tags - 1]]
+    detail_emps[rng.random(scale.details) < 0.01] = EXCLUDED_EMPLOYEE
+    detail_prices = rng.uniform(0.5, 200, scale.details).round(2)
+    detail_qtys = rng.integers(1, 25, scale.details)
+
+    range_index = (detail_tags - 1) // TAGS_PER_RANGE
+    range_prices = np.bincount(range_index, weights=detail_prices * detail_qtys, minlength=len(range_starts)).round(2)
+    range_qtys = np.bincount(range_index, weights=detail_qtys, minlength=len(range_starts)).astype(int)
+
+    error_tags = rng.integers(1, scale.tags + 1, scale.zone_errors)
+    error_qtys = rng.integers(0, 30, scale.zone_errors)
+    error_deltas = rng.choice([-1, 1], scale.zone_errors) * rng.integers(1, 10, scale.zone_errors)
+    error_reasons = np.where(rng.random(scale.zone_errors) < 0.85, MISCOUNT_REASON, rng.choice(OTHER_REASONS, scale.zone_errors))
+
+    adjusted_details = rng.choice(scale.details, min(scale.manual_adjustments, scale.details), replace=False) + 1
+    edit_details = np.concatenate([adjusted_details, rng.choice(adjusted_details, len(adjusted_details) // 4)])
+
+    conn = sqlite3.connect(path)
+
+    try:
+        conn.executescript(SCHEMA)
+
+        conn.execute(
+            "INSERT INTO tblWISEInfo (JobDateTime, Name, Address) VALUES (?, ?, ?)",
+            ["2026-01-01 08:00:00", f"Synthetic Store {seed + 1:04d}", "1 Benchmark Way"],
+        )
+        conn.executemany("INSERT INTO tblTerminalControl (TerminalUser) VALUES (?)", [(emp,) for emp in [*emp_ids.tolist(), EXCLUDED_EMPLOYEE]])
+        conn.executemany("INSERT INTO tblEmpNames (EmpNo, Name) VALUES (?, ?)", [(emp, f"Employee {emp}") for emp in emp_ids.tolist()])
+        conn.executemany(
+            "INSERT INTO tblDetails (tag, empno, price, qty) VALUES (?, ?, ?, ?)",
+            zip(detail_tags.tolist(), detail_emps.tolist(), detail_prices.tolist(), detail_qtys.tolist()),
+        )
+        conn.executemany("INSERT INTO tblZone (ZoneID, ZoneDesc) VALUES (?, ?)", [(zone, f"Zone {zone}") for zone in zone_ids.tolist()])
+        conn.executemany(
+            "INSERT INTO tblTagRange (ZoneID, TagValFrom, TagValTo, TotalEXTPRICE, TotalQty) VALUES (?, ?, ?, ?, ?)",
+            zip(range_zones.tolist(), range_starts.tolist(), range_ends.tolist(), range_prices.tolist(), range_qtys.tolist()),
+        )
+        conn.executemany(
+            "INSERT INTO tblZoneChangeQueue (Tag, ZoneID, UPC, Price, Quantity, Reason) VALUES (?, ?, ?, ?, ?, ?)",
+            zip(
+                error_tags.tolist(),
+                tag_zones[error_tags - 1].tolist(),
+                [f"{upc:012d}" for upc in rng.integers(0, 10**12, scale.zone_errors).tolist()],
+                rng.uniform(5, 150, scale.zone_errors).round(2).tolist(),
+                error_qtys.tolist(),
+                error_reasons.tolist(),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO tblZoneChangeInfo (ZoneQueueID, CountedQty) VALUES (?, ?)",
+            zip(range(1, scale.zone_errors + 1), np.maximum(error_qtys + error_deltas, 0).tolist()),
+        )
+        conn.executemany(
+            "INSERT INTO tblDetailsOrg (DetailsID, ZoneID, qty) VALUES (?, ?, ?)",
+            zip(
+                adjusted_details.tolist(),
+                tag_zones[detail_tags[adjusted_details - 1] - 1].tolist(),
+                detail_qtys[adjusted_details - 1].tolist(),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO tblDetailsEdit (DetailsID, tag, sku, price, qty, Errors, AdjustmentTypeID) VALUES (?, ?, ?, ?, ?, 6, 3)",
+            zip(
+                edit_details.tolist(),
+                detail_tags[edit_details - 1].tolist(),
+                [f"{sku:012d}" for sku in rng.integers(0, 10**12, len(edit_details)).tolist()],
+                detail_prices[edit_details - 1].tolist(),
+                rng.integers(0, 40, len(edit_details)).tolist(),
+            ),
+        )
+        conn.commit()
+
+    finally:
+        conn.close()
+
+    return {**asdict(scale), "detail_edits": len(edit_details)}
\ No newline at end of file
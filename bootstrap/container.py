@@ -1,23 +1,63 @@
-from controllers.local_store_data_controller import LocalStoreDataController
-from controllers.wisdom_data_controller import WisdomDataController
-from controllers.local_aggregate_data_controller import LocalAggregateDataController
-from controllers.employee_report_controller import EmpReportController
+import time
+import logging
+import importlib
+import threading
 
 
 class AppContainer:
 
+    CONTROLLER_MODULES = (
+        "controllers.local_store_data_controller",
+        "controllers.wisdom_data_controller",
+        "controllers.local_aggregate_data_controller",
+        "controllers.employee_report_controller",
+    )
+
+    @staticmethod
+    def preload():
+        threading.Thread(target=AppContainer._import_controllers, name="controller-preload", daemon=True).start()
+
     @staticmethod
     def local_store_data_controller():
+        from controllers.local_store_data_controller import LocalStoreDataController
+
         return LocalStoreDataController()
 
     @staticmethod
     def source_data_controller():
+        from controllers.wisdom_data_controller import WisdomDataController
+
         return WisdomDataController()
 
     @staticmethod
     def aggregate_data_controller():
+        from controllers.local_aggregate_data_controller import LocalAggregateDataController
+
         return LocalAggregateDataController()
 
     @staticmethod
     def emp_report_controller():
-        return EmpReportController()
\ No newline at end of file
+        from controllers.employee_report_controller import EmpReportController
+
+        return EmpReportController()
+
+    @staticmethod
+    def current_report_controller():
+        from controllers.employee_report_controller import EmpReportController
+        from services.reporting.report_section_cache import ReportSectionCache
+
+        return EmpReportController(section_cache=ReportSectionCache.from_config())
+
+    @staticmethod
+    def _import_controllers():
+        start = time.perf_counter()
+
+        try:
+            for module in AppContainer.CONTROLLER_MODULES:
+                importlib.import_module(module)
+
+        except Exception:
+            logging.exception("Failed to preload controllers")
+            return
+
+        logging.info(f"Controllers preloaded in {time.perf_counter() - start:.2f}s")
\ No newline at end of file
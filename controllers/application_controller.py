@@ -1,5 +1,5 @@
 import logging
-from PyQt6 import QtWidgets
+from PyQt6 import QtWidgets, QtCore
 
 from ui.dialogs.stats_source_dialog import StatsSourceDialog
 from ui.dialogs.load_local_data_dialog import LoadLocalDataDialog
@@ -24,6 +24,7 @@ class ApplicationController:
     def run(self):
         try:
             source_dialog = StatsSourceDialog()
+            QtCore.QTimer.singleShot(0, self.container.preload)
 
             if not source_dialog.exec():
                 return
@@ -77,7 +78,6 @@ class ApplicationController:
 
     def run_current(self):
         controller = self.container.source_data_controller()
-        generator = self.container.emp_report_controller()
         dialog = LoadWisdomDataDynamicDialog(controller)
 
         if not dialog.exec():
@@ -88,12 +88,14 @@ class ApplicationController:
 
         data = dialog.result_data
 
+        generator = self.container.current_report_controller()
+        generator.warm_up()
+
         self.window = EmployeeHoursInputWindow(data, generator)
         self.window.show()
 
     def run_aggregate(self):
         controller = self.container.aggregate_data_controller()
-        generator = self.container.emp_report_controller()
         dialog = LoadAggregateDataDialog(controller)
 
         if not dialog.exec():
@@ -101,5 +103,8 @@ class ApplicationController:
 
         data = dialog.result_data
 
+        generator = self.container.emp_report_controller()
+        generator.warm_up()
+
         self.window = EmployeeSelectWindow(data, generator)
         self.window.show()
\ No newline at end of file
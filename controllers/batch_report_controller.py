@@ -0,0 +1,140 @@
+import os
+import time
+import logging
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from controllers.wisdom_data_controller import WisdomDataController
+from controllers.employee_report_controller import EmpReportController
+from domain.dto.batch_job_result import BatchJobResult
+from utils.tracing import setup_tracing
+from exceptions.file_exceptions import FileLoadError, InvalidFileFormatError
+
+
+REQUIRED_HOURS_COLUMNS = {"emp_id", "hours"}
+
+
+def _run_job(job: str, hours: dict, output_dir: str, use_cache: bool) -> BatchJobResult:
+    start = time.perf_counter()
+
+    try:
+        controller = WisdomDataController(use_cache=use_cache)
+
+        if Path(job).suffix.lower() in (".mdb", ".accdb"):
+            report_data = controller.load_from_path(job)
+
+        else:
+            report_data = controller.load_from_job_number(job)
+
+        loaded = time.perf_counter()
+
+        for emp in report_data.employees:
+            emp.hours = hours.get(str(emp.emp_id), emp.hours)
+
+        pdf_path = EmpReportController(output_dir).render_current_report(report_data, f"{Path(job).stem}.pdf")
+        finished = time.perf_counter()
+
+        return BatchJobResult(
+            job=job,
+            succeeded=True,
+            pdf_path=pdf_path,
+            load_seconds=loaded - start,
+            report_seconds=finished - loaded,
+            total_seconds=finished - start,
+            report_data=report_data,
+        )
+
+    except Exception as e:
+        logging.exception(f"Batch job {job} failed")
+
+        return BatchJobResult(job=job, succeeded=False, total_seconds=time.perf_counter() - start, error=str(e))
+
+
+class BatchReportController:
+
+    def __init__(self, output_dir, hours_path=None, max_workers=None, use_cache: bool = True):
+        self.output_dir = str(output_dir)
+        self.hours = self._read_hours(hours_path) if hours_path else {}
+        self.max_workers = max_workers or os.cpu_count()
+        self.use_cache = use_cache
+
+        self._report_controller = None
+
+    def run(self, jobs, on_result=None) -> list[BatchJobResult]:
+        results = []
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(jobs)) or 1, initializer=setup_tracing) as executor:
+            futures = [
+                executor.submit(_run_job, job, self._hours_for(job), self.output_dir, self.use_cache)
+                for job in jobs
+            ]
+
+            for future in as_completed(futures):
+                result = self._save(future.result())
+                results.append(result)
+
+                if on_result:
+                    on_result(result)
+
+        order = {job: i for i, job in enumerate(jobs)}
+
+        return sorted(results, key=lambda r: order[r.job])
+
+    def _save(self, result: BatchJobResult) -> BatchJobResult:
+        report_data, result.report_data = result.report_data, None
+
+        if report_data is None:
+            return result
+
+        start = time.perf_counter()
+
+        try:
+            if self._report_controller is None:
+                self._report_controller = EmpReportController(self.output_dir)
+
+            self._report_controller.save_report_data(report_data)
+
+        except Exception as e:
+            logging.exception(f"Batch job {result.job} failed to save")
+            result.succeeded = False
+            result.error = f"Report written but not saved: {e}"
+
+        result.save_seconds = time.perf_counter() - start
+        result.total_seconds += result.save_seconds
+
+        return result
+
+    def _hours_for(self, job):
+        hours = dict(self.hours.get(None, {}))
+        hours.update(self.hours.get(job, {}))
+        hours.update(self.hours.get(Path(job).stem, {}))
+
+        return hours
+
+    @staticmethod
+    def _read_hours(hours_path) -> dict:
+        try:
+            df = pd.read_csv(hours_path, dtype={"job": str, "emp_id": str})
+
+        except Exception as e:
+            logging.exception("Failed to read hours file")
+            raise FileLoadError(f"Failed to read hours file: {hours_path}") from e
+
+        missing = REQUIRED_HOURS_COLUMNS - set(df.columns)
+
+        if missing:
+            raise InvalidFileFormatError(f"Hours file missing columns: {', '.join(sorted(missing))}")
+
+        if "job" not in df.columns:
+            df["job"] = None
+
+        df["hours"] = pd.to_numeric(df["hours"], errors="coerce")
+        df = df.dropna(subset=["emp_id", "hours"])
+
+        hours = {}
+
+        for job, emp_id, emp_hours in zip(df["job"].tolist(), df["emp_id"].str.strip().tolist(), df["hours"].tolist()):
+            hours.setdefault(None if pd.isna(job) else str(job).strip(), {})[emp_id] = float(emp_hours)
+
+        return hours
@@ -6,29 +6,40 @@ from services.reporting.report_template_service import ReportTemplateService
 from services.reporting.report_data_service import ReportDataService
 from services.reporting.report_rendering_service import ReportRenderingService
 from services.reporting.pdf_export_service import PdfExportService
+from services.reporting.report_pagination_service import ReportPaginationService
 from services.local.local_data_save_service import LocalDataSaveService
+from services.local.local_database_setup_service import LocalDatabaseSetupService
 from repositories.local.local_store_repository import LocalStoreRepository
 from repositories.local.local_employee_repository import LocalEmployeeRepository
 from repositories.local.local_zone_repository import LocalZoneRepository
 from repositories.local.local_discrepancy_repository import LocalDiscrepancyRepository
 from repositories.local.local_schema_repository import LocalSchemaRepository
+from repositories.unit_of_work import UnitOfWork
+from utils.task_progress import TaskProgress
+from domain.enums.task_stage import TaskStage
 from domain.dto.report_data import StoreReportData, AggregateReportData
 from exceptions.report_exceptions import ReportGenerationError
+from exceptions.task_exceptions import TaskCancelledError
 from exceptions.database_exceptions import DatabaseConnectionError, DatabaseQueryError
 from exceptions.wisdom_exceptions import WisdomDataError
 
 
 class EmpReportController:
 
-    def __init__(self):
+    def __init__(self, output_dir=None, section_cache=None):
         self.factory = LocalConnectionFactory()
         self.generator = ReportGeneratorService(
             template_service=ReportTemplateService(),
             data_service=ReportDataService(),
             rendering_service=ReportRenderingService(),
-            pdf_service=PdfExportService(),
+            pdf_service=PdfExportService.from_config(output_dir),
+            pagination_service=ReportPaginationService.from_config(),
+            section_cache=section_cache,
         )
 
+    def warm_up(self):
+        self.generator.pdf.warm_up()
+
     def generate_historical_report(self, report_data: StoreReportData):
         try:
             self.generator.generate_report(report_data)
@@ -41,35 +52,78 @@ class EmpReportController:
             logging.exception("Unexpected error generating historical report")
             raise ReportGenerationError(str(e)) from e
 
-    def generate_current_report(self, report_data: StoreReportData):
+    def generate_current_report(self, report_data: StoreReportData, filename: str | None = None, progress: TaskProgress | None = None):
+        progress = progress or TaskProgress()
+        progress.check_cancelled()
+
+        with progress.shielded():
+            path = self.render_current_report(report_data, filename, progress)
+            self.save_report_data(report_data, progress)
+
+        return path
+
+    def render_current_report(self, report_data: StoreReportData, filename: str | None = None, progress: TaskProgress | None = None):
+        progress = progress or TaskProgress()
+
+        try:
+            progress.update(TaskStage.RENDER)
+
+            return self.generator.generate_report(report_data, filename)
+
+        except TaskCancelledError:
+            logging.info("Current report cancelled")
+            raise
+
+        except Exception as e:
+            logging.exception("Unexpected error generating current report")
+            raise ReportGenerationError(str(e)) from e
+
+    def save_report_data(self, report_data: StoreReportData, progress: TaskProgress | None = None):
+        progress = progress or TaskProgress()
+        progress.update(TaskStage.CONNECT)
+
+        LocalDatabaseSetupService(self.factory).ensure_database()
         conn = self.factory.create()
 
         try:
-            store_repo = LocalStoreRepository(conn)
-            emp_repo = LocalEmployeeRepository(conn)
-            zone_repo = LocalZoneRepository(conn)
-            disc_repo = LocalDiscrepancyRepository(conn)
+            unit_of_work = UnitOfWork(conn, fast_executemany=self.factory.SUPPORTS_FAST_EXECUTEMANY)
+
+            store_repo = LocalStoreRepository(conn, unit_of_work=unit_of_work)
+            emp_repo = LocalEmployeeRepository(conn, unit_of_work=unit_of_work)
+            zone_repo = LocalZoneRepository(conn, unit_of_work=unit_of_work)
+            disc_repo = LocalDiscrepancyRepository(conn, unit_of_work=unit_of_work)
             schema_repo = LocalSchemaRepository(conn)
-            save_service = LocalDataSaveService(store_repo, emp_repo, zone_repo, disc_repo, schema_repo)
+            save_service = LocalDataSaveService(store_repo, emp_repo, zone_repo, disc_repo, schema_repo, unit_of_work=unit_of_work)
 
-            self.generator.generate_report(report_data)
+            progress.update(TaskStage.SAVE)
             save_service.save_all(report_data)
 
+        except TaskCancelledError:
+            logging.info("Report data save cancelled")
+            raise
+
         except (DatabaseConnectionError, DatabaseQueryError) as e:
-            logging.exception("Current report DB failure")
+            logging.exception("Report data save DB failure")
             raise e
 
         except Exception as e:
-            logging.exception("Unexpected error generating current report")
+            logging.exception("Unexpected error saving report data")
             raise ReportGenerationError(str(e)) from e
 
         finally:
             conn.close()
 
-    def generate_aggregate_report(self, report_data: AggregateReportData):
+    def generate_aggregate_report(self, report_data: AggregateReportData, progress: TaskProgress | None = None):
+        progress = progress or TaskProgress()
+
         try:
+            progress.update(TaskStage.RENDER)
             self.generator.generate_aggregate_report(report_data)
 
+        except TaskCancelledError:
+            logging.info("Aggregate report cancelled")
+            raise
+
         except (DatabaseConnectionError, DatabaseQueryError, WisdomDataError) as e:
             logging.exception("Aggregate report failure")
             raise e
@@ -8,14 +8,19 @@ from mappers.local.local_zone_mapper import LocalZoneMapper
 from services.local.local_store_service import LocalStoreService
 from services.local.local_employee_service import LocalEmployeeService
 from services.local.local_zone_service import LocalZoneService
+from services.local.local_database_setup_service import LocalDatabaseSetupService
 from repositories.local.local_store_repository import LocalStoreRepository
 from repositories.local.local_employee_repository import LocalEmployeeRepository
 from repositories.local.local_discrepancy_repository import LocalDiscrepancyRepository
 from repositories.local.local_zone_repository import LocalZoneRepository
+from repositories.local.local_schema_repository import LocalSchemaRepository
+from utils.task_progress import TaskProgress
+from domain.enums.task_stage import TaskStage
 from domain.dto.report_data import AggregateReportData
 from exceptions.database_exceptions import DatabaseConnectionError, DatabaseQueryError
 from exceptions.wisdom_exceptions import WisdomDataError
 from exceptions.report_exceptions import ReportGenerationError
+from exceptions.task_exceptions import TaskCancelledError
 
 
 class LocalAggregateDataController:
@@ -23,12 +28,18 @@ class LocalAggregateDataController:
     def __init__(self):
         self.factory = LocalConnectionFactory()
 
-    def load(self, start_date, end_date) -> AggregateReportData | None:
+    def load(self, start_date, end_date, progress: TaskProgress | None = None) -> AggregateReportData | None:
+        progress = progress or TaskProgress()
+        progress.update(TaskStage.CONNECT)
+
+        LocalDatabaseSetupService(self.factory).ensure_database()
         conn = self.factory.create()
 
         try:
             date_range = [datetime.combine(start_date, time.min), datetime.combine(end_date, time.max),]
 
+            LocalSchemaRepository(conn).create_tables_if_not_exists()
+
             store_repo = LocalStoreRepository(conn)
             emp_repo = LocalEmployeeRepository(conn)
             zone_err_repo = LocalDiscrepancyRepository(conn)
@@ -42,12 +53,21 @@ class LocalAggregateDataController:
             emp_service = LocalEmployeeService(emp_repo, zone_err_repo, emp_mapper)
             zone_service = LocalZoneService(zone_repo, zone_mapper)
 
+            progress.update(TaskStage.FETCH, 0, 3)
             context = store_service.fetch_aggregate_store_data(date_range)
+
+            progress.update(TaskStage.FETCH, 1, 3)
             employees = emp_service.fetch_aggregate_employee_data(date_range)
+
+            progress.update(TaskStage.FETCH, 2, 3)
             zones = zone_service.fetch_aggregate_zone_data(date_range)
 
             return AggregateReportData(context, employees, zones)
 
+        except TaskCancelledError:
+            logging.info("Aggregate data load cancelled")
+            raise
+
         except (DatabaseConnectionError, DatabaseQueryError, WisdomDataError) as e:
             logging.exception("Aggregate data load failure")
             raise e
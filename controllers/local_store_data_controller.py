@@ -7,14 +7,18 @@ from mappers.local.local_zone_mapper import LocalZoneMapper
 from services.local.local_store_service import LocalStoreService
 from services.local.local_employee_service import LocalEmployeeService
 from services.local.local_zone_service import LocalZoneService
+from services.local.local_database_setup_service import LocalDatabaseSetupService
 from repositories.local.local_store_repository import LocalStoreRepository
 from repositories.local.local_employee_repository import LocalEmployeeRepository
 from repositories.local.local_discrepancy_repository import LocalDiscrepancyRepository
 from repositories.local.local_zone_repository import LocalZoneRepository
+from utils.task_progress import TaskProgress
+from domain.enums.task_stage import TaskStage
 from domain.dto.report_data import StoreReportData
 from exceptions.database_exceptions import DatabaseConnectionError, DatabaseQueryError
 from exceptions.wisdom_exceptions import WisdomDataError
 from exceptions.report_exceptions import ReportGenerationError
+from exceptions.task_exceptions import TaskCancelledError
 
 
 class LocalStoreDataController:
@@ -22,7 +26,11 @@ class LocalStoreDataController:
     def __init__(self):
         self.factory = LocalConnectionFactory()
 
-    def load(self, store_number) -> StoreReportData | None:
+    def load(self, store_number, progress: TaskProgress | None = None) -> StoreReportData | None:
+        progress = progress or TaskProgress()
+        progress.update(TaskStage.CONNECT)
+
+        LocalDatabaseSetupService(self.factory).ensure_database()
         conn = self.factory.create()
 
         try:
@@ -39,12 +47,21 @@ class LocalStoreDataController:
             emp_service = LocalEmployeeService(emp_repo, zone_err_repo, emp_mapper)
             zone_service = LocalZoneService(zone_repo, zone_mapper)
 
+            progress.update(TaskStage.FETCH, 0, 3)
             context = store_service.fetch_store_data(store_number)
+
+            progress.update(TaskStage.FETCH, 1, 3)
             employees = emp_service.fetch_employee_data(store_number)
+
+            progress.update(TaskStage.FETCH, 2, 3)
             zones = zone_service.fetch_zone_data(store_number)
 
             return StoreReportData(context, employees, zones)
 
+        except TaskCancelledError:
+            logging.info("Store data load cancelled")
+            raise
+
         except (DatabaseConnectionError, DatabaseQueryError, WisdomDataError) as e:
             logging.exception("Store data load failure")
             raise e
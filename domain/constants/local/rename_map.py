@@ -79,6 +79,16 @@ ZONE_RENAME_MAP = {
     "ZoneErrorPercent": "zone_error_percent",
 }
 
+DISCREPANCY_RENAME_MAP = {
+    "Tag": "tag",
+    "ZoneID": "zone_id",
+    "UPC": "upc",
+    "Price": "price",
+    "NewQty": "new_qty",
+    "CountedQty": "counted_qty",
+    "LineError": "line_error",
+}
+
 AGGREGATE_EMP_RENAME_MAP = {
     "EmpID": "emp_id",
     "EmpName": "emp_name",
@@ -32,4 +32,14 @@ WISDOM_ZONE_RENAME_MAP = {
     'ZoneErrorTotal': 'zone_error_total',
     'ZoneErrorTags': 'zone_error_tags',
     'ZoneErrorPercent': 'zone_error_percent',
+}
+
+WISDOM_DISCREPANCY_RENAME_MAP = {
+    'Tag': 'tag',
+    'ZoneID': 'zone_id',
+    'UPC': 'upc',
+    'Price': 'price',
+    'Quantity': 'new_qty',
+    'CountedQty': 'counted_qty',
+    'LineError': 'line_error',
 }
\ No newline at end of file
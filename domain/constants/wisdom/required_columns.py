@@ -8,7 +8,10 @@ REQUIRED_WISDOM_EMP_COLUMNS = {
     "df_term": {"TerminalUser"},
     "df_emp": {"EmpNo", "Name"},
     "df_details": {"empno", "price", "qty", "tag"},
+    "df_details_summary": {"empno", "TotalPrice", "TotalTags", "TotalQty"},
+    "df_detail_tags": {"tag", "empno"},
     "df_zone_errors_raw": {"Tag", "UPC", "LineError", "ZoneID"},
+    "df_manual_adjustments_raw": {"Tag", "ZoneID", "UPC", "Price", "Quantity", "CountedQty", "LineError"},
 }
 
 REQUIRED_WISDOM_ZONE_COLUMNS = {
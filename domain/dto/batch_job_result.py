@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from domain.dto.report_data import StoreReportData
+
+
+@dataclass
+class BatchJobResult:
+    job: str
+    succeeded: bool
+    pdf_path: Path | None = None
+    load_seconds: float = 0
+    report_seconds: float = 0
+    save_seconds: float = 0
+    total_seconds: float = 0
+    error: str | None = None
+    report_data: StoreReportData | None = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Discrepancy:
+    tag: str
+    zone_id: str
+    upc: str
+    price: float
+    counted_qty: int
+    new_qty: int
+    line_error: float
\ No newline at end of file
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Optional
+
+from domain.dto.discrepancy import Discrepancy
 
 
 @dataclass(kw_only=True)
@@ -12,7 +14,12 @@ class Employee:
     zone_error_total: float
     zone_error_tags: int
     zone_error_percent: float
-    zone_errors: list[Any]
+    zone_errors: list[Discrepancy]
+    manual_adjustment_total: float = 0
+    manual_adjustment_tags: int = 0
+    manual_adjustment_percent: float = 0
+    manual_adjustments: list[Discrepancy] = field(default_factory=list)
+    total_error_tags: int = 0
     hours: float | None = None
     uph: float | None = None
 
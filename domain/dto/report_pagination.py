@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+@dataclass
+class ReportPage:
+    number: int
+    rows: List[Any]
+
+
+@dataclass
+class ReportSection:
+    pages: List[ReportPage]
+    total_rows: int
+    shown_rows: int
+    overflow_path: Path | None = None
+
+
+@dataclass
+class ReportPagination:
+    sections: Dict[str, ReportSection] = field(default_factory=dict)
+    page_count: int = 0
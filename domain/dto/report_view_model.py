@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True)
+class EmployeeRow:
+    emp_id: str
+    emp_name: str
+    row_style: str
+    error_total: str
+    error_tags: str
+    error_percent: str
+    total_price: str
+    total_tags: str
+    total_qty: str
+    uph: str
+    total_stores: str
+
+
+@dataclass(slots=True)
+class ZoneRow:
+    zone_id: str
+    zone_desc: str
+    error_total: str
+    error_tags: str
+    error_percent: str
+    total_price: str
+    total_tags: str
+    total_qty: str
+    total_stores: str
+
+
+LINE_COLUMNS = ["EmpID", "ZoneID", "Tag", "UPC", "Price", "CountedQty", "NewQty", "LineError"]
+
+
+@dataclass(slots=True)
+class DiscrepancyRow:
+    emp_id: str
+    zone_id: str
+    tag: str
+    upc: str
+    price: str
+    counted_qty: str
+    new_qty: str
+    line_error: str
+
+
+@dataclass
+class ReportViewModel:
+    sections: Dict[str, List[Any]] = field(default_factory=dict)
+    line_records: Dict[str, List[tuple]] = field(default_factory=dict)
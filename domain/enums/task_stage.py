@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TaskStage(Enum):
+
+    CONNECT = "Connecting to database..."
+    FETCH = "Fetching data..."
+    MAP = "Processing data..."
+    RENDER = "Generating report..."
+    SAVE = "Saving local data..."
\ No newline at end of file
@@ -1,15 +1,50 @@
-import pyodbc
+import sqlite3
 import logging
+import pandas as pd
+from datetime import datetime
 from pathlib import Path
 
+from factories.connection_pool import ConnectionPool
+from utils.db_drivers import pyodbc, DRIVER_ERRORS
 from exceptions.database_exceptions import DatabaseConnectionError
 
 
+def _convert_sqlite_datetime(value: bytes):
+    try:
+        return datetime.fromisoformat(value.decode()) if value else None
+
+    except ValueError:
+        return value.decode()
+
+
 class BaseConnectionFactory:
 
     DRIVER = r"Microsoft Access Driver (*.mdb, *.accdb)"
+    SUPPORTS_FAST_EXECUTEMANY = False
+
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+    }
+
+    _sqlite_types_registered = False
+
+    @staticmethod
+    def _pool_key(backend: str, db_path) -> str:
+        return f"{backend}:{Path(db_path).resolve()}"
+
+    @staticmethod
+    def _acquire(backend: str, db_path, connect):
+        return ConnectionPool.for_key(BaseConnectionFactory._pool_key(backend, db_path), connect).acquire()
 
-    def _connect(self, db_path: str) -> pyodbc.Connection:
+    @staticmethod
+    def _close_pool(backend: str, db_path):
+        ConnectionPool.close_key(BaseConnectionFactory._pool_key(backend, db_path))
+
+    def _connect(self, db_path: str):
         try:
             if not db_path:
                 raise DatabaseConnectionError("Database path is empty or invalid")
@@ -17,6 +52,9 @@ class BaseConnectionFactory:
             if not Path(db_path).exists():
                 raise DatabaseConnectionError(f"Database not found: {db_path}")
 
+            if pyodbc is None:
+                raise DatabaseConnectionError("pyodbc is not available on this system")
+
             conn_str = (
                 rf"DRIVER={{{self.DRIVER}}};"
                 rf"DBQ={db_path};"
@@ -24,10 +62,50 @@ class BaseConnectionFactory:
 
             return pyodbc.connect(conn_str, autocommit=False)
 
-        except pyodbc.Error as e:
+        except DatabaseConnectionError:
+            raise
+
+        except DRIVER_ERRORS as e:
             logging.exception("ODBC connection failure")
             raise DatabaseConnectionError("Failed to connect to database") from e
 
         except Exception as e:
             logging.exception("Unexpected database connection error")
-            raise DatabaseConnectionError("Unexpected database connection failure") from e
\ No newline at end of file
+            raise DatabaseConnectionError("Unexpected database connection failure") from e
+
+    def _connect_sqlite(self, db_path: str) -> sqlite3.Connection:
+        try:
+            if not db_path:
+                raise DatabaseConnectionError("Database path is empty or invalid")
+
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+            self._register_sqlite_types()
+            conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+
+            for pragma, value in self.SQLITE_PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+
+            return conn
+
+        except DatabaseConnectionError:
+            raise
+
+        except sqlite3.Error as e:
+            logging.exception("SQLite connection failure")
+            raise DatabaseConnectionError("Failed to connect to database") from e
+
+        except Exception as e:
+            logging.exception("Unexpected database connection error")
+            raise DatabaseConnectionError("Unexpected database connection failure") from e
+
+    @classmethod
+    def _register_sqlite_types(cls):
+        if cls._sqlite_types_registered:
+            return
+
+        sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+        sqlite3.register_adapter(pd.Timestamp, lambda value: value.isoformat(" "))
+        sqlite3.register_converter("DATETIME", _convert_sqlite_datetime)
+
+        BaseConnectionFactory._sqlite_types_registered = True
\ No newline at end of file
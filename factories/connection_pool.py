@@ -0,0 +1,187 @@
+import os
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+
+from utils.paths import read_config_file
+from utils.db_drivers import DRIVER_ERRORS
+
+
+class PooledConnection:
+
+    def __init__(self, pool: "ConnectionPool", connection):
+        self.pool = pool
+        self.raw_connection = connection
+
+    def __getattr__(self, name):
+        connection = self.__dict__.get("raw_connection")
+
+        if connection is None:
+            raise AttributeError(f"Pooled connection is closed: {name}")
+
+        return getattr(connection, name)
+
+    def close(self):
+        connection, self.raw_connection = self.raw_connection, None
+
+        if connection is not None:
+            self.pool.release(connection)
+
+
+class ConnectionPool:
+
+    DEFAULT_MAX_SIZE = 4
+    DEFAULT_IDLE_TIMEOUT = 300.0
+    HEALTH_CHECK_QUERY = "SELECT 1"
+
+    _pools: dict[str, "ConnectionPool"] = {}
+    _pools_lock = threading.Lock()
+    _pools_pid = os.getpid()
+
+    def __init__(self, key: str, connect, max_size: int = DEFAULT_MAX_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.key = key
+        self.connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._idle: deque[tuple[object, float]] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def for_key(cls, key: str, connect) -> "ConnectionPool":
+        with cls._pools_lock:
+            if cls._pools_pid != os.getpid():
+                cls._pools = {}
+                cls._pools_pid = os.getpid()
+
+            pool = cls._pools.get(key)
+
+            if pool is None:
+                max_size, idle_timeout = cls._config()
+                pool = cls._pools[key] = cls(key, connect, max_size, idle_timeout)
+
+            return pool
+
+    @classmethod
+    def close_all(cls, backend: str | None = None):
+        with cls._pools_lock:
+            if cls._pools_pid != os.getpid():
+                cls._pools = {}
+                cls._pools_pid = os.getpid()
+
+            keys = [key for key in cls._pools if backend is None or key.startswith(f"{backend}:")]
+            pools = [cls._pools.pop(key) for key in keys]
+
+        for pool in pools:
+            pool.close()
+
+    @classmethod
+    def close_key(cls, key: str):
+        with cls._pools_lock:
+            pool = cls._pools.pop(key, None) if cls._pools_pid == os.getpid() else None
+
+        if pool is not None:
+            pool.close()
+
+    def acquire(self) -> PooledConnection:
+        now = time.monotonic()
+
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+
+                connection, released_at = self._idle.pop()
+
+            if now - released_at <= self.idle_timeout and self._is_healthy(connection):
+                return PooledConnection(self, connection)
+
+            self._discard(connection)
+
+        return PooledConnection(self, self.connect())
+
+    def release(self, connection):
+        try:
+            connection.rollback()
+
+        except DRIVER_ERRORS:
+            self._discard(connection)
+            return
+
+        now = time.monotonic()
+        expired = []
+
+        with self._lock:
+            while self._idle and now - self._idle[0][1] > self.idle_timeout:
+                expired.append(self._idle.popleft()[0])
+
+            if not self._closed and len(self._idle) < self.max_size:
+                self._idle.append((connection, now))
+                connection = None
+
+        for stale in expired:
+            self._discard(stale)
+
+        if connection is not None:
+            self._discard(connection)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            connections = [connection for connection, _ in self._idle]
+            self._idle.clear()
+
+        for connection in connections:
+            self._discard(connection)
+
+    def _is_healthy(self, connection) -> bool:
+        try:
+            cursor = connection.cursor()
+
+            try:
+                cursor.execute(self.HEALTH_CHECK_QUERY)
+                cursor.fetchone()
+
+            finally:
+                cursor.close()
+
+            return True
+
+        except DRIVER_ERRORS:
+            logging.warning(f"Discarding unhealthy pooled connection to {self.key}")
+            return False
+
+    @staticmethod
+    def _discard(connection):
+        try:
+            connection.close()
+
+        except DRIVER_ERRORS:
+            logging.exception("Failed to close pooled connection")
+
+    @classmethod
+    def _config(cls) -> tuple[int, float]:
+        try:
+            config = read_config_file()
+
+        except Exception:
+            config = {}
+
+        max_size = config.get("connection_pool_size")
+        idle_timeout = config.get("connection_pool_idle_seconds")
+
+        return (
+            cls.DEFAULT_MAX_SIZE if max_size is None else int(max_size),
+            cls.DEFAULT_IDLE_TIMEOUT if idle_timeout is None else float(idle_timeout),
+        )
+
+
+atexit.register(ConnectionPool.close_all)
\ No newline at end of file
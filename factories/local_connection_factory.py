@@ -1,7 +1,7 @@
 import logging
 
 from factories.base_connection_factory import BaseConnectionFactory
-from utils.paths import get_db_path
+from utils.paths import get_db_path, get_local_backend, get_sqlite_db_path
 from exceptions.database_exceptions import DatabaseConnectionError
 
 
@@ -9,7 +9,13 @@ class LocalConnectionFactory(BaseConnectionFactory):
 
     def __init__(self):
         try:
-            self.db_path = get_db_path()
+            self.backend = get_local_backend()
+
+            if self.backend == "sqlite":
+                self.db_path = get_sqlite_db_path()
+
+            else:
+                self.db_path = get_db_path()
 
         except Exception as e:
             logging.exception("Failed to resolve local database path")
@@ -17,11 +23,20 @@ class LocalConnectionFactory(BaseConnectionFactory):
 
     def create(self):
         try:
-            return self._connect(str(self.db_path))
+            if self.backend == "sqlite":
+                return self._acquire("sqlite", self.db_path, lambda: self._connect_sqlite(str(self.db_path)))
+
+            return self._acquire("access", self.db_path, lambda: self._connect(str(self.db_path)))
 
         except DatabaseConnectionError:
             raise
 
         except Exception as e:
             logging.exception("Failed to create database connection")
-            raise DatabaseConnectionError("Database connection failed") from e
\ No newline at end of file
+            raise DatabaseConnectionError("Database connection failed") from e
+
+    def connect_sqlite(self, db_path):
+        return self._connect_sqlite(str(db_path))
+
+    def connect_access(self, db_path):
+        return self._connect(str(db_path))
\ No newline at end of file
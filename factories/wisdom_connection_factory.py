@@ -6,6 +6,8 @@ from exceptions.database_exceptions import DatabaseConnectionError
 
 class WisdomConnectionFactory(BaseConnectionFactory):
 
+    POOL_BACKEND = "wisdom"
+
     def __init__(self, db_path: str):
         if not db_path:
             raise DatabaseConnectionError("Wisdom database path is empty")
@@ -14,11 +16,14 @@ class WisdomConnectionFactory(BaseConnectionFactory):
 
     def create(self):
         try:
-            return self._connect(self.db_path)
+            return self._acquire(self.POOL_BACKEND, self.db_path, lambda: self._connect(self.db_path))
 
         except DatabaseConnectionError:
             raise
 
         except Exception as e:
             logging.exception("Failed to create Wisdom database connection")
-            raise DatabaseConnectionError("Wisdom database connection failed") from e
\ No newline at end of file
+            raise DatabaseConnectionError("Wisdom database connection failed") from e
+
+    def close_pool(self):
+        self._close_pool(self.POOL_BACKEND, self.db_path)
\ No newline at end of file
@@ -1,25 +1,47 @@
 import sys
+import multiprocessing
 import logging
-from PyQt6 import QtWidgets
 
-from bootstrap.container import AppContainer
-from controllers.application_controller import ApplicationController
 from utils.logging import setup_logging
+from utils.tracing import setup_tracing
+from utils.startup_profiler import StartupProfiler
+
+
+def run_application(profiler: StartupProfiler | None = None) -> int:
+    from PyQt6 import QtWidgets, QtCore
+    from bootstrap.container import AppContainer
+    from controllers.application_controller import ApplicationController
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    if profiler is not None:
+        QtCore.QTimer.singleShot(0, profiler.report)
+
+    container = AppContainer()
+    controller = ApplicationController(container)
+    controller.run()
+
+    if controller.window:
+        return app.exec()
+
+    return 0
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    profiler = StartupProfiler.install() if "--profile-startup" in sys.argv else None
+
     setup_logging()
+    setup_tracing()
 
     try:
-        app = QtWidgets.QApplication(sys.argv)
-        container = AppContainer()
-        controller = ApplicationController(container)
-        controller.run()
+        if "--precompile-templates" in sys.argv:
+            from services.reporting.report_template_service import ReportTemplateService
 
-        if controller.window:
-            sys.exit(app.exec())
+            ReportTemplateService.precompile()
+            sys.exit(0)
 
-        sys.exit(0)
+        sys.exit(run_application(profiler))
 
     except Exception:
         logging.exception("Unhandled application error")
\ No newline at end of file
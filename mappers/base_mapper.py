@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import TypeVar, Type, List, Any
 
@@ -45,13 +46,35 @@ class BaseMapper:
         if df is None or df.empty:
             return []
 
-        results: List[T] = []
+        fields = list(field_map.values())
+        columns = [
+            df[df_column].tolist() if df_column in df.columns else [None] * len(df)
+            for df_column in field_map
+        ]
 
-        for _, row in df.iterrows():
-            kwargs = {
-                model_field: row.get(df_column)
-                for df_column, model_field in field_map.items()
-            }
-            results.append(model(**kwargs))
+        return [model(**dict(zip(fields, values))) for values in zip(*columns)]
 
-        return results
\ No newline at end of file
+    @staticmethod
+    def _group_records(df: pd.DataFrame, key: str, field_map: dict, model: Type[T] = dict) -> dict[Any, List[T]]:
+        if df is None or df.empty:
+            return {}
+
+        codes, uniques = pd.factorize(df[key])
+
+        order = np.argsort(codes, kind="stable")
+        order = order[codes[order] >= 0]
+
+        if not len(order):
+            return {}
+
+        sorted_codes = codes[order]
+        records = BaseMapper._map_dataframe(df.iloc[order], model, field_map)
+
+        bounds = (np.flatnonzero(np.diff(sorted_codes)) + 1).tolist()
+        starts = [0] + bounds
+        ends = bounds + [len(records)]
+
+        return {
+            uniques[sorted_codes[start]]: records[start:end]
+            for start, end in zip(starts, ends)
+        }
\ No newline at end of file
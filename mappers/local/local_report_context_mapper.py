@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import List
 
 from mappers.base_mapper import BaseMapper
+from utils.tracing import traced
 from domain.dto.report_context import StoreReportContext, AggregateReportContext
 from domain.constants.local.required_columns import REQUIRED_LOCAL_CONTEXT_COLUMNS
 from domain.constants.local.rename_map import LOCAL_CONTEXT_RENAME_MAP, LOCAL_AGGREGATE_CONTEXT_RENAME_MAP
@@ -10,6 +11,7 @@ from domain.constants.local.rename_map import LOCAL_CONTEXT_RENAME_MAP, LOCAL_AG
 
 class LocalReportContextMapper(BaseMapper):
 
+    @traced("mapper.LocalReportContextMapper.to_store_context")
     def to_store_context(self, df: pd.DataFrame) -> StoreReportContext:
         self._validate(df, required_columns=REQUIRED_LOCAL_CONTEXT_COLUMNS)
 
@@ -23,6 +25,7 @@ class LocalReportContextMapper(BaseMapper):
 
         return self._map_dataframe(df.head(1), StoreReportContext, LOCAL_CONTEXT_RENAME_MAP)[0]
 
+    @traced("mapper.LocalReportContextMapper.to_aggregate_context")
     def to_aggregate_context(self, date_range: List[datetime]) -> AggregateReportContext:
         df = pd.DataFrame()
 
@@ -2,6 +2,7 @@ import pandas as pd
 from typing import List
 
 from mappers.base_mapper import BaseMapper
+from utils.tracing import traced
 from domain.dto.zone import Zone, AggregateZone
 from domain.constants.local.required_columns import REQUIRED_LOCAL_ZONE_COLUMNS, REQUIRED_AGGREGATE_ZONE_COLUMNS
 from domain.constants.local.rename_map import LOCAL_ZONE_RENAME_MAP, LOCAL_AGGREGATE_ZONE_RENAME_MAP, ZONE_RENAME_MAP, AGGREGATE_ZONE_RENAME_MAP
@@ -9,6 +10,7 @@ from domain.constants.local.rename_map import LOCAL_ZONE_RENAME_MAP, LOCAL_AGGRE
 
 class LocalZoneMapper(BaseMapper):
 
+    @traced("mapper.LocalZoneMapper.to_zone_models")
     def to_zone_models(self, df: pd.DataFrame) -> List[Zone]:
         df = self._prepare(df, required_columns=REQUIRED_LOCAL_ZONE_COLUMNS, rename_map=LOCAL_ZONE_RENAME_MAP)
         df = self._fill(df, ["ZoneID", "ZoneDesc", "TotalPrice", "TotalTags", "TotalQty", "ZoneErrorTotal", "ZoneErrorTags"], 0)
@@ -19,6 +21,7 @@ class LocalZoneMapper(BaseMapper):
 
         return self._map_dataframe(df, Zone, ZONE_RENAME_MAP)
 
+    @traced("mapper.LocalZoneMapper.to_aggregate_zone_models")
     def to_aggregate_zone_models(self, df: pd.DataFrame) -> List[AggregateZone]:
         df = self._prepare(df, required_columns=REQUIRED_AGGREGATE_ZONE_COLUMNS, rename_map=LOCAL_AGGREGATE_ZONE_RENAME_MAP)
         df = self._fill(df, ["TotalStores"], 0)
@@ -2,53 +2,59 @@ import pandas as pd
 from typing import List
 
 from mappers.base_mapper import BaseMapper
+from utils.tracing import traced
+from domain.dto.discrepancy import Discrepancy
 from domain.dto.employee import Employee
 from domain.constants.wisdom.required_columns import REQUIRED_WISDOM_EMP_COLUMNS
-from domain.constants.wisdom.rename_map import WISDOM_EMP_RENAME_MAP
+from domain.constants.wisdom.rename_map import WISDOM_EMP_RENAME_MAP, WISDOM_DISCREPANCY_RENAME_MAP
+from exceptions.validation_exceptions import ValidationError
 
 
 class WisdomEmployeeMapper(BaseMapper):
 
+    @traced("mapper.WisdomEmployeeMapper.to_employee_models")
     def to_employee_models(self, df_term, df_emp, df_details, df_zone_errors_raw, df_manual_adjustments_raw) -> List[Employee]:
         self._validate(df_term, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_term"])
         self._validate(df_emp, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_emp"])
-        self._validate(df_details, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_details"])
         self._validate(df_zone_errors_raw, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_zone_errors_raw"])
         self._validate(df_manual_adjustments_raw, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_manual_adjustments_raw"])
 
-        df_details_summary = df_details.groupby('empno').apply(
-            lambda g: pd.Series({
-                "TotalPrice": (g["price"] * g["qty"]).sum(),
-                "TotalTags": g["tag"].nunique(),
-                "TotalQty": g["qty"].sum()
-            })
-        ).reset_index()
+        df_details_summary, df_detail_tags = self.summarize_details(df_details)
+        df_tag_owners = df_detail_tags.rename(columns={"tag": "Tag", "empno": "TerminalUser"})
 
+        return self._build_employee_models(df_term, df_emp, df_details_summary, df_tag_owners, df_zone_errors_raw, df_manual_adjustments_raw)
+
+    @traced("mapper.WisdomEmployeeMapper.to_employee_models_from_summary")
+    def to_employee_models_from_summary(self, df_term, df_emp, df_details_summary, df_detail_tags, df_zone_errors_raw, df_manual_adjustments_raw) -> List[Employee]:
+        self._validate(df_term, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_term"])
+        self._validate(df_emp, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_emp"])
+        self._validate(df_details_summary, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_details_summary"])
+        self._validate(df_detail_tags, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_detail_tags"])
+        self._validate(df_zone_errors_raw, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_zone_errors_raw"])
+        self._validate(df_manual_adjustments_raw, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_manual_adjustments_raw"])
+
+        df_tag_owners = df_detail_tags[["tag", "empno"]].rename(columns={"tag": "Tag", "empno": "TerminalUser"})
+
+        return self._build_employee_models(df_term, df_emp, df_details_summary, df_tag_owners, df_zone_errors_raw, df_manual_adjustments_raw)
+
+    def _build_employee_models(self, df_term, df_emp, df_details_summary, df_tag_owners, df_zone_errors_raw, df_manual_adjustments_raw) -> List[Employee]:
         df_emp_zone_errors = df_zone_errors_raw.merge(
-            df_details[df_details['empno'] != 'ZZ9999'][['tag', 'empno']].rename(columns={'tag': 'Tag', 'empno': 'TerminalUser'}),
+            df_tag_owners,
             on='Tag',
             how='inner'
         )
         df_emp_zone_deduped = df_emp_zone_errors.drop_duplicates(subset=['TerminalUser', 'Tag', 'UPC', 'LineError'])
         df_emp_zone_summary = df_emp_zone_deduped.groupby('TerminalUser').agg(ZoneErrorTotal=('LineError', 'sum'), ZoneErrorTags=('Tag', 'nunique')).reset_index()
-        df_emp_zone_errors_list = df_emp_zone_deduped.groupby('TerminalUser').apply(
-            lambda x: x[['Tag', 'ZoneID', 'UPC', 'Price', 'Quantity', 'CountedQty', 'LineError']]
-            .rename(columns={'Quantity': 'NewQty'})
-            .to_dict('records')
-        ).reset_index(name='ZoneErrors')
+        df_emp_zone_errors_list = self._group_records(df_emp_zone_deduped, "TerminalUser", WISDOM_DISCREPANCY_RENAME_MAP, Discrepancy)
 
         df_emp_manual_adjustments = df_manual_adjustments_raw.merge(
-            df_details[df_details['empno'] != 'ZZ9999'][['tag', 'empno']].rename(columns={'tag': 'Tag', 'empno': 'TerminalUser'}),
+            df_tag_owners,
             on='Tag',
             how='inner'
         )
         df_emp_manual_deduped = df_emp_manual_adjustments.drop_duplicates(subset=['TerminalUser', 'Tag', 'UPC', 'LineError'])
         df_emp_manual_summary = df_emp_manual_deduped.groupby('TerminalUser').agg(ManualAdjustmentTotal=('LineError', 'sum'), ManualAdjustmentTags=('Tag', 'nunique')).reset_index()
-        df_emp_manual_list = df_emp_manual_deduped.groupby('TerminalUser').apply(
-            lambda x: x[['Tag', 'ZoneID', 'UPC', 'Price', 'Quantity', 'CountedQty', 'LineError']]
-            .rename(columns={'Quantity': 'NewQty'})
-            .to_dict('records')
-        ).reset_index(name='ManualAdjustments')
+        df_emp_manual_list = self._group_records(df_emp_manual_deduped, "TerminalUser", WISDOM_DISCREPANCY_RENAME_MAP, Discrepancy)
 
         df_combined_error_tags = pd.concat([df_emp_zone_deduped[['TerminalUser', 'Tag']], df_emp_manual_deduped[['TerminalUser', 'Tag']]])
         df_combined_error_summary = (
@@ -62,9 +68,7 @@ class WisdomEmployeeMapper(BaseMapper):
         df = df_term.merge(df_emp, left_on='TerminalUser', right_on='EmpNo', how='inner')
         df = df.merge(df_details_summary, left_on='TerminalUser', right_on='empno', how='left').drop(columns=['empno'])
         df = df.merge(df_emp_zone_summary, on='TerminalUser', how='left')
-        df = df.merge(df_emp_zone_errors_list, on='TerminalUser', how='left')
         df = df.merge(df_emp_manual_summary, on='TerminalUser', how='left')
-        df = df.merge(df_emp_manual_list, on='TerminalUser', how='left')
         df = df.merge(df_combined_error_summary, on='TerminalUser', how='left')
 
         df['TerminalUser'] = df['TerminalUser'].fillna('')
@@ -75,13 +79,43 @@ class WisdomEmployeeMapper(BaseMapper):
         df['ZoneErrorTotal'] = df['ZoneErrorTotal'].fillna(0)
         df['ZoneErrorTags'] = df['ZoneErrorTags'].fillna(0)
         df['ZoneErrorPercent'] = df['ZoneErrorTotal'].div(df['TotalPrice'].replace(0, pd.NA)).fillna(0) * 100
-        df['ZoneErrors'] = df['ZoneErrors'].apply(lambda x: x if isinstance(x, list) else [])
+        df['ZoneErrors'] = df['TerminalUser'].map(lambda emp_id: df_emp_zone_errors_list.get(emp_id, []))
         df['ManualAdjustmentTotal'] = df['ManualAdjustmentTotal'].fillna(0)
         df['ManualAdjustmentTags'] = df['ManualAdjustmentTags'].fillna(0)
         df['ManualAdjustmentPercent'] = df['ManualAdjustmentTotal'].div(df['TotalPrice'].replace(0, pd.NA)).fillna(0) * 100
-        df['ManualAdjustments'] = df['ManualAdjustments'].apply(lambda x: x if isinstance(x, list) else [])
+        df['ManualAdjustments'] = df['TerminalUser'].map(lambda emp_id: df_emp_manual_list.get(emp_id, []))
         df['TotalErrorTags'] = df['TotalErrorTags'].fillna(0)
 
-        df = df.sort_values(["UPH", "TotalQty"], ascending=[False, False])
+        df = df.sort_values("TotalQty", ascending=False)
+
+        return self._map_dataframe(df, Employee, WISDOM_EMP_RENAME_MAP)
+
+    @traced("mapper.WisdomEmployeeMapper.summarize_details")
+    def summarize_details(self, details) -> tuple[pd.DataFrame, pd.DataFrame]:
+        chunks = [details] if details is None or isinstance(details, pd.DataFrame) else details
+        partials = []
+
+        for chunk in chunks:
+            if not partials:
+                self._validate(chunk, required_columns=REQUIRED_WISDOM_EMP_COLUMNS["df_details"], name="df_details")
+
+            partials.append(self._aggregate_tag_totals(chunk.assign(TagPrice=chunk["price"] * chunk["qty"], TagQty=chunk["qty"])))
+
+        if not partials:
+            raise ValidationError("df_details is empty")
+
+        df_tag_totals = partials[0] if len(partials) == 1 else self._aggregate_tag_totals(pd.concat(partials, ignore_index=True))
+
+        df_details_summary = df_tag_totals.groupby("empno", as_index=False).agg(
+            TotalPrice=("TagPrice", "sum"),
+            TotalTags=("tag", "count"),
+            TotalQty=("TagQty", "sum"),
+        )
+
+        df_detail_tags = df_tag_totals.loc[df_tag_totals["empno"] != "ZZ9999", ["tag", "empno"]]
+
+        return df_details_summary, df_detail_tags
 
-        return self._map_dataframe(df, Employee, WISDOM_EMP_RENAME_MAP)
\ No newline at end of file
+    @staticmethod
+    def _aggregate_tag_totals(df: pd.DataFrame) -> pd.DataFrame:
+        return df.groupby(["empno", "tag"], sort=False, dropna=False, as_index=False).agg(TagPrice=("TagPrice", "sum"), TagQty=("TagQty", "sum"))
\ No newline at end of file
@@ -2,6 +2,7 @@ import pandas as pd
 from datetime import datetime
 
 from mappers.base_mapper import BaseMapper
+from utils.tracing import traced
 from domain.dto.report_context import StoreReportContext
 from domain.constants.wisdom.required_columns import REQUIRED_WISDOM_STORE_COLUMNS
 from domain.constants.wisdom.rename_map import WISDOM_CONTEXT_RENAME_MAP
@@ -9,6 +10,7 @@ from domain.constants.wisdom.rename_map import WISDOM_CONTEXT_RENAME_MAP
 
 class WisdomStoreMapper(BaseMapper):
 
+    @traced("mapper.WisdomStoreMapper.to_store_context")
     def to_store_context(self, df: pd.DataFrame) -> StoreReportContext | None:
         if df is None or df.empty:
             return None
@@ -2,13 +2,16 @@ import pandas as pd
 from typing import List
 
 from mappers.base_mapper import BaseMapper
+from utils.tracing import traced
+from domain.dto.discrepancy import Discrepancy
 from domain.dto.zone import Zone
 from domain.constants.wisdom.required_columns import REQUIRED_WISDOM_ZONE_COLUMNS
-from domain.constants.wisdom.rename_map import WISDOM_ZONE_RENAME_MAP
+from domain.constants.wisdom.rename_map import WISDOM_ZONE_RENAME_MAP, WISDOM_DISCREPANCY_RENAME_MAP
 
 
 class WisdomZoneMapper(BaseMapper):
 
+    @traced("mapper.WisdomZoneMapper.to_zone_models")
     def to_zone_models(self, df_zone: pd.DataFrame, df_totals: pd.DataFrame, df_zone_errors_raw: pd.DataFrame) -> List[Zone]:
         self._validate(df_zone, required_columns=REQUIRED_WISDOM_ZONE_COLUMNS["df_zone"])
         self._validate(df_totals, required_columns=REQUIRED_WISDOM_ZONE_COLUMNS["df_totals"])
@@ -20,14 +23,10 @@ class WisdomZoneMapper(BaseMapper):
         df_zone_deduped = df_zone_errors_raw.drop_duplicates(subset=['ZoneID', 'Tag', 'UPC', 'LineError'])
         df_zone_summary = df_zone_deduped.groupby("ZoneID").agg(ZoneErrorTotal=("LineError", "sum"), ZoneErrorTags=("Tag", "nunique")).reset_index()
 
-        df_zone_errors = (
-            df_zone_deduped.groupby("ZoneID")[['Tag', 'ZoneID', 'UPC', 'Price', 'Quantity', 'CountedQty', 'LineError']]
-            .apply(lambda g: g.to_dict('records'))
-            .reset_index(name='ZoneErrors')
-        )
+        df_zone_errors = self._group_records(df_zone_deduped, "ZoneID", WISDOM_DISCREPANCY_RENAME_MAP, Discrepancy)
 
         df = df_totals.merge(df_zone_summary, on="ZoneID", how="left")
-        df = df.merge(df_zone_errors, on="ZoneID", how="left")
+        df["ZoneErrors"] = df["ZoneID"].map(lambda zone_id: df_zone_errors.get(zone_id, []))
 
         df['ZoneID'] = df['ZoneID'].fillna('')
         df['ZoneDesc'] = df['ZoneDesc'].fillna('')
@@ -1,16 +1,46 @@
-import pyodbc
 import logging
 import pandas as pd
 
+from utils.tracing import trace_span
+from utils.db_drivers import DRIVER_ERRORS, INTEGRITY_ERRORS, PROGRAMMING_ERRORS
 from exceptions.database_exceptions import DatabaseConnectionError, DatabaseQueryError, DatabaseInsertError, DatabaseUpdateError
 
 
 class BaseRepository:
 
-    def __init__(self, connection):
+    FETCH_BATCH_SIZE = 10_000
+
+    def __init__(self, connection, cache=None, unit_of_work=None):
         self.connection = connection
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    def _read(self, query, params=None, chunk_size=None):
+        with trace_span("repository.read", repository=type(self).__name__, query=query) as span:
+            if self.cache is not None:
+                cached = self.cache.get(query, params)
+
+                if cached is not None:
+                    span.set(rows=len(cached), cached=True)
+                    return cached
+
+            df = self._fetch(query, params, chunk_size)
+            span.set(rows=len(df))
+
+            if self.cache is not None:
+                self.cache.put(query, params, df)
+
+            return df
+
+    def _fetch(self, query, params=None, chunk_size=None):
+        if chunk_size:
+            chunks = list(self._read_chunks(query, params, chunk_size))
+
+            if len(chunks) == 1:
+                return chunks[0]
+
+            return pd.concat(chunks, ignore_index=True)
 
-    def _read(self, query, params=None):
         cursor = self.connection.cursor()
 
         try:
@@ -21,14 +51,55 @@ class BaseRepository:
 
             return pd.DataFrame.from_records(rows, columns=columns)
 
-        except pyodbc.Error as e:
+        except DRIVER_ERRORS as e:
             logging.exception("Database read/query failed")
             raise DatabaseQueryError(str(e)) from e
 
         finally:
             cursor.close()
 
+    def _read_chunks(self, query, params=None, chunk_size=None):
+        chunk_size = chunk_size or self.FETCH_BATCH_SIZE
+        cursor = self.connection.cursor()
+
+        try:
+            cursor.execute(query, params or [])
+
+            columns = [col[0] for col in cursor.description]
+            emitted = False
+
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+
+                if not rows:
+                    break
+
+                chunk = pd.DataFrame.from_records(rows, columns=columns)
+                del rows
+
+                emitted = True
+                yield chunk
+
+            if not emitted:
+                yield pd.DataFrame(columns=columns)
+
+        except DRIVER_ERRORS as e:
+            logging.exception("Database chunked read failed")
+            raise DatabaseQueryError(str(e)) from e
+
+        finally:
+            cursor.close()
+
     def _execute(self, query, params=None):
+        with trace_span("repository.execute", repository=type(self).__name__, query=query, rows=1) as span:
+            if self.unit_of_work is not None and self.unit_of_work.active:
+                span.set(staged=True)
+                self.unit_of_work.add(query, params)
+                return
+
+            self._execute_statement(query, params)
+
+    def _execute_statement(self, query, params=None):
         cursor = self.connection.cursor()
 
         try:
@@ -36,17 +107,17 @@ class BaseRepository:
 
             self.connection.commit()
 
-        except pyodbc.IntegrityError as e:
+        except INTEGRITY_ERRORS as e:
             self.connection.rollback()
             logging.exception("Database insert/update integrity error")
             raise DatabaseInsertError(str(e)) from e
 
-        except pyodbc.ProgrammingError as e:
+        except PROGRAMMING_ERRORS as e:
             self.connection.rollback()
             logging.exception("Database update/query programming error")
             raise DatabaseUpdateError(str(e)) from e
 
-        except pyodbc.Error as e:
+        except DRIVER_ERRORS as e:
             self.connection.rollback()
             logging.exception("Database execute failed")
             raise DatabaseQueryError(str(e)) from e
@@ -55,6 +126,15 @@ class BaseRepository:
             cursor.close()
 
     def _executemany(self, query, params_list):
+        with trace_span("repository.executemany", repository=type(self).__name__, query=query, rows=len(params_list)) as span:
+            if self.unit_of_work is not None and self.unit_of_work.active:
+                span.set(staged=True)
+                self.unit_of_work.add_many(query, params_list)
+                return
+
+            self._executemany_statement(query, params_list)
+
+    def _executemany_statement(self, query, params_list):
         cursor = self.connection.cursor()
 
         try:
@@ -62,12 +142,12 @@ class BaseRepository:
 
             self.connection.commit()
 
-        except pyodbc.IntegrityError as e:
+        except INTEGRITY_ERRORS as e:
             self.connection.rollback()
             logging.exception("Database batch insert integrity error")
             raise DatabaseInsertError(str(e)) from e
 
-        except pyodbc.Error as e:
+        except DRIVER_ERRORS as e:
             self.connection.rollback()
             logging.exception("Database batch execute failed")
             raise DatabaseQueryError(str(e)) from e
@@ -83,7 +163,7 @@ class BaseRepository:
 
             return cursor.fetchone() is not None
 
-        except pyodbc.Error as e:
+        except DRIVER_ERRORS as e:
             logging.exception("Database exists check failed")
             raise DatabaseQueryError(str(e)) from e
 
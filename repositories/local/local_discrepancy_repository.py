@@ -45,13 +45,13 @@ class LocalDiscrepancyRepository(BaseRepository):
             [
                 store_number,
                 emp_number,
-                d["ZoneID"],
-                d["Tag"],
-                d["UPC"],
-                d["Price"],
-                d["CountedQty"],
-                d["NewQty"],
-                d["LineError"]
+                d.zone_id,
+                d.tag,
+                d.upc,
+                d.price,
+                d.counted_qty,
+                d.new_qty,
+                d.line_error
             ]
             for d in emp_data.zone_errors
         ]
@@ -61,4 +61,12 @@ class LocalDiscrepancyRepository(BaseRepository):
     def replace_employee_discrepancies(self, store_number, emp_number, emp_data):
         self.delete_employee_discrepancies(store_number, emp_number)
         if emp_data.zone_errors:
-            self.insert_discrepancy_data(store_number, emp_number, emp_data)
\ No newline at end of file
+            self.insert_discrepancy_data(store_number, emp_number, emp_data)
+
+    def replace_discrepancies(self, store_number, employees):
+        for emp in employees:
+            self.delete_employee_discrepancies(store_number, emp.emp_id)
+
+        for emp in employees:
+            if emp.zone_errors:
+                self.insert_discrepancy_data(store_number, emp.emp_id, emp)
\ No newline at end of file
@@ -1,7 +1,105 @@
-from repositories.base_repository import BaseRepository
+from repositories.local.local_rollup_repository import LocalRollupRepository
 
 
-class LocalEmployeeRepository(BaseRepository):
+class LocalEmployeeRepository(LocalRollupRepository):
+
+    ROLLUP_KEY = "EmpNo"
+    ROLLUP_NAME = "EmployeeName"
+    ROLLUP_MEASURES = ("Tags", "Qty", "Price", "ZoneErrorTotal", "ZoneErrorTags", "Hours")
+
+    ROLLUP_DELETE_QUERY = """
+        DELETE FROM tblEmpMonthly
+        WHERE MonthStart = ?
+    """
+
+    ROLLUP_REFRESH_QUERY = """
+        INSERT INTO tblEmpMonthly (
+            MonthStart,
+            EmpNo,
+            EmpName,
+            SumTags,
+            CountTags,
+            SumQty,
+            CountQty,
+            SumPrice,
+            CountPrice,
+            SumZoneErrorTotal,
+            CountZoneErrorTotal,
+            SumZoneErrorTags,
+            CountZoneErrorTags,
+            SumHours,
+            CountHours,
+            StoreCount
+        )
+        SELECT
+            ?,
+            e.EmpNo,
+            MAX(e.EmpName),
+            SUM(e.TotalTags),
+            COUNT(e.TotalTags),
+            SUM(e.TotalQty),
+            COUNT(e.TotalQty),
+            SUM(e.TotalEXTPRICE),
+            COUNT(e.TotalEXTPRICE),
+            SUM(e.DiscrepancyDollars),
+            COUNT(e.DiscrepancyDollars),
+            SUM(e.DiscrepancyTags),
+            COUNT(e.DiscrepancyTags),
+            SUM(e.Hours),
+            COUNT(e.Hours),
+            COUNT(*)
+        FROM tblEmps AS e
+        INNER JOIN tblInventory AS i
+            ON e.StoreNo = i.StoreNo
+        WHERE i.JobDateTime BETWEEN ? AND ?
+        GROUP BY e.EmpNo
+    """
+
+    ROLLUP_READ_QUERY = """
+        SELECT
+            EmpNo,
+            MAX(EmpName) AS EmployeeName,
+            SUM(SumTags) AS SumTags,
+            SUM(CountTags) AS CountTags,
+            SUM(SumQty) AS SumQty,
+            SUM(CountQty) AS CountQty,
+            SUM(SumPrice) AS SumPrice,
+            SUM(CountPrice) AS CountPrice,
+            SUM(SumZoneErrorTotal) AS SumZoneErrorTotal,
+            SUM(CountZoneErrorTotal) AS CountZoneErrorTotal,
+            SUM(SumZoneErrorTags) AS SumZoneErrorTags,
+            SUM(CountZoneErrorTags) AS CountZoneErrorTags,
+            SUM(SumHours) AS SumHours,
+            SUM(CountHours) AS CountHours,
+            SUM(StoreCount) AS TotalStores
+        FROM tblEmpMonthly
+        WHERE MonthStart BETWEEN ? AND ?
+        GROUP BY EmpNo
+    """
+
+    RAW_READ_QUERY = """
+        SELECT
+            e.EmpNo,
+            MAX(e.EmpName) AS EmployeeName,
+            SUM(e.TotalTags) AS SumTags,
+            COUNT(e.TotalTags) AS CountTags,
+            SUM(e.TotalQty) AS SumQty,
+            COUNT(e.TotalQty) AS CountQty,
+            SUM(e.TotalEXTPRICE) AS SumPrice,
+            COUNT(e.TotalEXTPRICE) AS CountPrice,
+            SUM(e.DiscrepancyDollars) AS SumZoneErrorTotal,
+            COUNT(e.DiscrepancyDollars) AS CountZoneErrorTotal,
+            SUM(e.DiscrepancyTags) AS SumZoneErrorTags,
+            COUNT(e.DiscrepancyTags) AS CountZoneErrorTags,
+            SUM(e.Hours) AS SumHours,
+            COUNT(e.Hours) AS CountHours,
+            COUNT(*) AS TotalStores
+        FROM tblEmps AS e
+        INNER JOIN tblInventory AS i
+            ON e.StoreNo = i.StoreNo
+        WHERE i.JobDateTime BETWEEN ? AND ?
+        GROUP BY e.EmpNo
+    """
 
     def get_emp_data(self, store_number):
         return self._read("""
@@ -19,34 +117,36 @@ class LocalEmployeeRepository(BaseRepository):
         """, [store_number])
 
     def get_aggregate_emp_data(self, date_range):
-        return self._read("""
-            SELECT
-                e.EmpNo,
-                MAX(e.EmpName) AS EmployeeName,
-                AVG(e.TotalTags) AS AverageTags,
-                AVG(e.TotalQty) AS AverageQty,
-                AVG(e.TotalEXTPRICE) AS AveragePrice,
-                AVG(e.DiscrepancyDollars) AS AverageZoneErrorTotal,
-                AVG(e.DiscrepancyTags) AS AverageZoneErrorTags,
-                AVG(e.Hours) AS AverageHours,
-                COUNT(*) AS TotalStores
-            FROM tblEmps AS e
-            INNER JOIN tblInventory AS i
-                ON e.StoreNo = i.StoreNo
-            WHERE i.JobDateTime BETWEEN ? AND ?
-            GROUP BY e.EmpNo
-        """, [date_range[0], date_range[1]])
+        return self._read_aggregate(date_range)
 
     def employee_exists(self, store_number, emp_number):
         return self._exists("""
-            SELECT TOP 1 1
+            SELECT 1
             FROM tblEmps
             WHERE StoreNo = ?
               AND EmpNo = ?
         """, [store_number, emp_number])
 
+    def get_employee_keys(self, store_number):
+        df = self._read("""
+            SELECT DISTINCT EmpNo
+            FROM tblEmps
+            WHERE StoreNo = ?
+        """, [store_number])
+
+        return set(df["EmpNo"].astype(str)) if not df.empty else set()
+
     def insert_employee(self, store_number, emp_data):
-        self._execute("""
+        self.insert_employees(store_number, [emp_data])
+
+    def update_employee(self, store_number, emp_data):
+        self.update_employees(store_number, [emp_data])
+
+    def insert_employees(self, store_number, employees):
+        if not employees:
+            return
+
+        self._executemany("""
             INSERT INTO tblEmps (
                 StoreNo,
                 EmpNo,
@@ -60,19 +160,25 @@ class LocalEmployeeRepository(BaseRepository):
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, [
-            store_number,
-            emp_data.emp_id,
-            emp_data.emp_name,
-            emp_data.total_tags,
-            emp_data.total_qty,
-            emp_data.total_price,
-            emp_data.zone_error_total,
-            emp_data.zone_error_tags,
-            emp_data.hours
+            [
+                store_number,
+                emp_data.emp_id,
+                emp_data.emp_name,
+                emp_data.total_tags,
+                emp_data.total_qty,
+                emp_data.total_price,
+                emp_data.zone_error_total,
+                emp_data.zone_error_tags,
+                emp_data.hours
+            ]
+            for emp_data in employees
         ])
 
-    def update_employee(self, store_number, emp_data):
-        self._execute("""
+    def update_employees(self, store_number, employees):
+        if not employees:
+            return
+
+        self._executemany("""
             UPDATE tblEmps
             SET
                 TotalTags = ?,
@@ -84,12 +190,15 @@ class LocalEmployeeRepository(BaseRepository):
             WHERE StoreNo = ?
               AND EmpNo = ?
         """, [
-            emp_data.total_tags,
-            emp_data.total_qty,
-            emp_data.total_price,
-            emp_data.zone_error_total,
-            emp_data.zone_error_tags,
-            emp_data.hours,
-            store_number,
-            emp_data.emp_id
+            [
+                emp_data.total_tags,
+                emp_data.total_qty,
+                emp_data.total_price,
+                emp_data.zone_error_total,
+                emp_data.zone_error_tags,
+                emp_data.hours,
+                store_number,
+                emp_data.emp_id
+            ]
+            for emp_data in employees
         ])
\ No newline at end of file
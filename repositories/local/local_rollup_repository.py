@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+
+from repositories.base_repository import BaseRepository
+
+
+class LocalRollupRepository(BaseRepository):
+
+    ROLLUP_KEY = ""
+    ROLLUP_NAME = ""
+    ROLLUP_MEASURES: tuple[str, ...] = ()
+
+    ROLLUP_DELETE_QUERY = ""
+    ROLLUP_REFRESH_QUERY = ""
+    ROLLUP_READ_QUERY = ""
+    RAW_READ_QUERY = ""
+
+    RESOLUTION = timedelta(microseconds=1)
+
+    def refresh_monthly_rollup(self, job_datetimes):
+        months = sorted({month for month in map(self._month_start, job_datetimes) if month is not None})
+
+        if not months:
+            return
+
+        self._executemany(self.ROLLUP_DELETE_QUERY, [[month] for month in months])
+        self._executemany(self.ROLLUP_REFRESH_QUERY, [[month, month, self._month_end(month)] for month in months])
+
+    def _read_aggregate(self, date_range):
+        start, end = date_range[0], date_range[1]
+        first = self._month_start(start)
+
+        if first < start:
+            first = self._next_month(first)
+
+        last = self._month_start(end + self.RESOLUTION)
+
+        if first >= last:
+            return self._combine([self._read(self.RAW_READ_QUERY, [start, end])])
+
+        frames = [self._read(self.ROLLUP_READ_QUERY, [first, last - self.RESOLUTION])]
+
+        if start < first:
+            frames.append(self._read(self.RAW_READ_QUERY, [start, first - self.RESOLUTION]))
+
+        if last <= end:
+            frames.append(self._read(self.RAW_READ_QUERY, [last, end]))
+
+        return self._combine(frames)
+
+    def _combine(self, frames):
+        sums = [f"Sum{measure}" for measure in self.ROLLUP_MEASURES]
+        counts = [f"Count{measure}" for measure in self.ROLLUP_MEASURES]
+        averages = [f"Average{measure}" for measure in self.ROLLUP_MEASURES]
+        frames = [frame for frame in frames if not frame.empty]
+
+        if not frames:
+            return pd.DataFrame(columns=[self.ROLLUP_KEY, self.ROLLUP_NAME, *averages, "TotalStores"])
+
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        totals = df[[*sums, *counts, "TotalStores"]].astype(float).fillna(0)
+
+        if len(frames) > 1:
+            names = df[[self.ROLLUP_KEY, self.ROLLUP_NAME]].dropna().sort_values(self.ROLLUP_NAME).groupby(self.ROLLUP_KEY)[self.ROLLUP_NAME].last()
+            totals = totals.groupby(df[self.ROLLUP_KEY], sort=False).sum()
+            keys, names = totals.index, totals.index.map(names)
+
+        else:
+            keys, names = df[self.ROLLUP_KEY], df[self.ROLLUP_NAME]
+
+        values = totals.to_numpy()
+        sum_values, count_values = values[:, :len(sums)], values[:, len(sums):-1]
+
+        result = pd.DataFrame(
+            np.divide(sum_values, count_values, out=np.full_like(sum_values, np.nan), where=count_values > 0),
+            columns=averages
+        )
+        result.insert(0, self.ROLLUP_KEY, np.asarray(keys))
+        result.insert(1, self.ROLLUP_NAME, np.asarray(names))
+        result["TotalStores"] = values[:, -1].astype(int)
+
+        return result
+
+    @staticmethod
+    def _month_start(value):
+        timestamp = pd.to_datetime(value, errors="coerce")
+
+        if pd.isna(timestamp):
+            return None
+
+        return datetime(timestamp.year, timestamp.month, 1)
+
+    @staticmethod
+    def _next_month(month):
+        return datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    def _month_end(self, month):
+        return self._next_month(month) - self.RESOLUTION
\ No newline at end of file
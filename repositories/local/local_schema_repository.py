@@ -1,16 +1,44 @@
 import logging
+import pandas as pd
+from datetime import datetime
 
 from repositories.base_repository import BaseRepository
+from repositories.unit_of_work import UnitOfWork
+from repositories.local.local_store_repository import LocalStoreRepository
+from repositories.local.local_employee_repository import LocalEmployeeRepository
+from repositories.local.local_zone_repository import LocalZoneRepository
+from utils.db_drivers import DRIVER_ERRORS, is_sqlite_connection
+from exceptions.database_exceptions import DatabaseQueryError
 
 
 class LocalSchemaRepository(BaseRepository):
 
+    SCHEMA_MIGRATIONS = [
+        (1, [
+            ("tblEmps", "idxEmpsStoreEmp", "CREATE INDEX idxEmpsStoreEmp ON tblEmps (StoreNo, EmpNo)"),
+            ("tblZones", "idxZonesStoreZone", "CREATE INDEX idxZonesStoreZone ON tblZones (StoreNo, ZoneID)"),
+            ("tblDiscrepancies", "idxDiscStoreEmp", "CREATE INDEX idxDiscStoreEmp ON tblDiscrepancies (StoreNo, EmpNo)"),
+            ("tblInventory", "idxInventoryJobDateTime", "CREATE INDEX idxInventoryJobDateTime ON tblInventory (JobDateTime)"),
+        ]),
+        (2, [
+            ("tblEmpMonthly", "idxEmpMonthlyMonthEmp", "CREATE INDEX idxEmpMonthlyMonthEmp ON tblEmpMonthly (MonthStart, EmpNo)"),
+            ("tblZoneMonthly", "idxZoneMonthlyMonthZone", "CREATE INDEX idxZoneMonthlyMonthZone ON tblZoneMonthly (MonthStart, ZoneID)"),
+        ]),
+        (3, []),
+    ]
+
+    ROLLUP_BACKFILL_VERSION = 3
+
     def create_tables_if_not_exists(self):
-        existing_tables = [
-            row.table_name for row in self.connection.cursor().tables(tableType='TABLE')
-        ]
+        existing_tables = self._table_names()
 
         create_tables_queries = {
+            "tblSchemaVersion": """
+                CREATE TABLE tblSchemaVersion (
+                    SchemaVersion INTEGER PRIMARY KEY,
+                    AppliedAt DATETIME
+                )
+            """,
             "tblInventory": """
                 CREATE TABLE tblInventory (
                     StoreNo TEXT(50) PRIMARY KEY,
@@ -56,10 +84,128 @@ class LocalSchemaRepository(BaseRepository):
                     NewQty INTEGER,
                     DiscrepancyDollars DOUBLE
                 )
+            """,
+            "tblEmpMonthly": """
+                CREATE TABLE tblEmpMonthly (
+                    MonthStart DATETIME,
+                    EmpNo TEXT(50),
+                    EmpName TEXT(255),
+                    SumTags DOUBLE,
+                    CountTags INTEGER,
+                    SumQty DOUBLE,
+                    CountQty INTEGER,
+                    SumPrice DOUBLE,
+                    CountPrice INTEGER,
+                    SumZoneErrorTotal DOUBLE,
+                    CountZoneErrorTotal INTEGER,
+                    SumZoneErrorTags DOUBLE,
+                    CountZoneErrorTags INTEGER,
+                    SumHours DOUBLE,
+                    CountHours INTEGER,
+                    StoreCount INTEGER
+                )
+            """,
+            "tblZoneMonthly": """
+                CREATE TABLE tblZoneMonthly (
+                    MonthStart DATETIME,
+                    ZoneID TEXT(50),
+                    ZoneDesc TEXT(255),
+                    SumTags DOUBLE,
+                    CountTags INTEGER,
+                    SumQty DOUBLE,
+                    CountQty INTEGER,
+                    SumPrice DOUBLE,
+                    CountPrice INTEGER,
+                    SumZoneErrorTotal DOUBLE,
+                    CountZoneErrorTotal INTEGER,
+                    SumZoneErrorTags DOUBLE,
+                    CountZoneErrorTags INTEGER,
+                    StoreCount INTEGER
+                )
             """
         }
 
         for table_name, create_sql in create_tables_queries.items():
             if table_name not in existing_tables:
                 logging.info(f"Creating table: {table_name}")
-                self._execute(create_sql)
\ No newline at end of file
+                self._execute(create_sql)
+
+        self.migrate_schema()
+
+    def rebuild_rollups(self, unit_of_work=None):
+        job_datetimes = LocalStoreRepository(self.connection).get_job_datetimes()
+
+        logging.info(f"Rebuilding monthly rollups for {len(job_datetimes)} inventory dates")
+
+        LocalEmployeeRepository(self.connection, unit_of_work=unit_of_work).refresh_monthly_rollup(job_datetimes)
+        LocalZoneRepository(self.connection, unit_of_work=unit_of_work).refresh_monthly_rollup(job_datetimes)
+
+    def get_schema_version(self):
+        df = self._read("SELECT MAX(SchemaVersion) AS SchemaVersion FROM tblSchemaVersion")
+
+        if df.empty or pd.isna(df["SchemaVersion"].iloc[0]):
+            return 0
+
+        return int(df["SchemaVersion"].iloc[0])
+
+    def migrate_schema(self):
+        current_version = self.get_schema_version()
+
+        for version, indexes in self.SCHEMA_MIGRATIONS:
+            if version <= current_version:
+                continue
+
+            logging.info(f"Migrating local schema to version {version}")
+
+            for table_name, index_name, create_sql in indexes:
+                if not self._index_exists(table_name, index_name):
+                    self._execute(create_sql)
+
+            with UnitOfWork(self.connection) as unit_of_work:
+                if version == self.ROLLUP_BACKFILL_VERSION:
+                    self.rebuild_rollups(unit_of_work)
+
+                unit_of_work.add("""
+                    INSERT INTO tblSchemaVersion (SchemaVersion, AppliedAt)
+                    VALUES (?, ?)
+                """, [version, datetime.now()])
+
+    def _table_names(self):
+        if is_sqlite_connection(self.connection):
+            df = self._read("SELECT name FROM sqlite_master WHERE type = 'table'")
+
+            return set(df["name"])
+
+        cursor = self.connection.cursor()
+
+        try:
+            return {row.table_name for row in cursor.tables(tableType='TABLE')}
+
+        except DRIVER_ERRORS as e:
+            logging.exception("Table lookup failed")
+            raise DatabaseQueryError(str(e)) from e
+
+        finally:
+            cursor.close()
+
+    def _index_exists(self, table_name, index_name):
+        if is_sqlite_connection(self.connection):
+            return self._exists("""
+                SELECT 1
+                FROM sqlite_master
+                WHERE type = 'index'
+                  AND tbl_name = ?
+                  AND name = ?
+            """, [table_name, index_name])
+
+        cursor = self.connection.cursor()
+
+        try:
+            return any(row.index_name == index_name for row in cursor.statistics(table_name))
+
+        except DRIVER_ERRORS as e:
+            logging.exception("Index lookup failed")
+            raise DatabaseQueryError(str(e)) from e
+
+        finally:
+            cursor.close()
\ No newline at end of file
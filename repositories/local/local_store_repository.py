@@ -13,9 +13,17 @@ class LocalStoreRepository(BaseRepository):
             WHERE StoreNo = ?
         """, [store_number])
 
+    def get_job_datetimes(self):
+        df = self._read("""
+            SELECT DISTINCT JobDateTime
+            FROM tblInventory
+        """)
+
+        return df["JobDateTime"].tolist()
+
     def store_exists(self, store_number):
         return self._exists("""
-            SELECT TOP 1 1
+            SELECT 1
             FROM tblInventory
             WHERE StoreNo = ?
         """, [store_number])
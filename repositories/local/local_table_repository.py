@@ -0,0 +1,30 @@
+import pandas as pd
+
+from repositories.base_repository import BaseRepository
+from exceptions.database_exceptions import DatabaseQueryError
+
+
+class LocalTableRepository(BaseRepository):
+
+    TABLES = ("tblInventory", "tblEmps", "tblZones", "tblDiscrepancies")
+
+    def read_table(self, table_name) -> pd.DataFrame:
+        self._validate_table(table_name)
+
+        return self._read(f"SELECT * FROM {table_name}")
+
+    def insert_rows(self, table_name, df: pd.DataFrame):
+        self._validate_table(table_name)
+
+        if df.empty:
+            return
+
+        columns = ", ".join(df.columns)
+        placeholders = ", ".join("?" for _ in df.columns)
+        rows = df.astype(object).where(df.notna(), None).values.tolist()
+
+        self._executemany(f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})", rows)
+
+    def _validate_table(self, table_name):
+        if table_name not in self.TABLES:
+            raise DatabaseQueryError(f"Unknown local table: {table_name}")
\ No newline at end of file
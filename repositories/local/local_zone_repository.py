@@ -1,7 +1,97 @@
-from repositories.base_repository import BaseRepository
+from repositories.local.local_rollup_repository import LocalRollupRepository
 
 
-class LocalZoneRepository(BaseRepository):
+class LocalZoneRepository(LocalRollupRepository):
+
+    ROLLUP_KEY = "ZoneID"
+    ROLLUP_NAME = "ZoneDescription"
+    ROLLUP_MEASURES = ("Tags", "Qty", "Price", "ZoneErrorTotal", "ZoneErrorTags")
+
+    ROLLUP_DELETE_QUERY = """
+        DELETE FROM tblZoneMonthly
+        WHERE MonthStart = ?
+    """
+
+    ROLLUP_REFRESH_QUERY = """
+        INSERT INTO tblZoneMonthly (
+            MonthStart,
+            ZoneID,
+            ZoneDesc,
+            SumTags,
+            CountTags,
+            SumQty,
+            CountQty,
+            SumPrice,
+            CountPrice,
+            SumZoneErrorTotal,
+            CountZoneErrorTotal,
+            SumZoneErrorTags,
+            CountZoneErrorTags,
+            StoreCount
+        )
+        SELECT
+            ?,
+            z.ZoneID,
+            MAX(z.ZoneDesc),
+            SUM(z.TotalTags),
+            COUNT(z.TotalTags),
+            SUM(z.TotalQty),
+            COUNT(z.TotalQty),
+            SUM(z.TotalEXTPRICE),
+            COUNT(z.TotalEXTPRICE),
+            SUM(z.DiscrepancyDollars),
+            COUNT(z.DiscrepancyDollars),
+            SUM(z.DiscrepancyTags),
+            COUNT(z.DiscrepancyTags),
+            COUNT(*)
+        FROM tblZones AS z
+        INNER JOIN tblInventory AS i
+            ON z.StoreNo = i.StoreNo
+        WHERE i.JobDateTime BETWEEN ? AND ?
+        GROUP BY z.ZoneID
+    """
+
+    ROLLUP_READ_QUERY = """
+        SELECT
+            ZoneID,
+            MAX(ZoneDesc) AS ZoneDescription,
+            SUM(SumTags) AS SumTags,
+            SUM(CountTags) AS CountTags,
+            SUM(SumQty) AS SumQty,
+            SUM(CountQty) AS CountQty,
+            SUM(SumPrice) AS SumPrice,
+            SUM(CountPrice) AS CountPrice,
+            SUM(SumZoneErrorTotal) AS SumZoneErrorTotal,
+            SUM(CountZoneErrorTotal) AS CountZoneErrorTotal,
+            SUM(SumZoneErrorTags) AS SumZoneErrorTags,
+            SUM(CountZoneErrorTags) AS CountZoneErrorTags,
+            SUM(StoreCount) AS TotalStores
+        FROM tblZoneMonthly
+        WHERE MonthStart BETWEEN ? AND ?
+        GROUP BY ZoneID
+    """
+
+    RAW_READ_QUERY = """
+        SELECT
+            z.ZoneID,
+            MAX(z.ZoneDesc) AS ZoneDescription,
+            SUM(z.TotalTags) AS SumTags,
+            COUNT(z.TotalTags) AS CountTags,
+            SUM(z.TotalQty) AS SumQty,
+            COUNT(z.TotalQty) AS CountQty,
+            SUM(z.TotalEXTPRICE) AS SumPrice,
+            COUNT(z.TotalEXTPRICE) AS CountPrice,
+            SUM(z.DiscrepancyDollars) AS SumZoneErrorTotal,
+            COUNT(z.DiscrepancyDollars) AS CountZoneErrorTotal,
+            SUM(z.DiscrepancyTags) AS SumZoneErrorTags,
+            COUNT(z.DiscrepancyTags) AS CountZoneErrorTags,
+            COUNT(*) AS TotalStores
+        FROM tblZones AS z
+        INNER JOIN tblInventory AS i
+            ON z.StoreNo = i.StoreNo
+        WHERE i.JobDateTime BETWEEN ? AND ?
+        GROUP BY z.ZoneID
+    """
 
     def get_zone_data(self, store_number):
         return self._read("""
@@ -18,33 +108,36 @@ class LocalZoneRepository(BaseRepository):
         """, [store_number])
 
     def get_aggregate_zone_data(self, date_range):
-        return self._read("""
-            SELECT 
-                z.ZoneID,
-                MAX(z.ZoneDesc) AS ZoneDescription,
-                AVG(z.TotalTags) AS AverageTags,
-                AVG(z.TotalQty) AS AverageQty,
-                AVG(z.TotalEXTPRICE) AS AveragePrice,
-                AVG(z.DiscrepancyDollars) AS AverageZoneErrorTotal,
-                AVG(z.DiscrepancyTags) AS AverageZoneErrorTags,
-                COUNT(*) as TotalStores
-            FROM tblZones AS z
-            INNER JOIN tblInventory AS i
-                ON z.StoreNo = i.StoreNo
-            WHERE i.JobDateTime BETWEEN ? AND ?
-            GROUP BY z.ZoneID
-        """, [date_range[0], date_range[1]])
+        return self._read_aggregate(date_range)
 
     def zone_exists(self, store_number, zone_id):
         return self._exists("""
-            SELECT TOP 1 1
+            SELECT 1
             FROM tblZones
             WHERE StoreNo = ?
               AND ZoneID = ?
         """, [store_number, zone_id])
 
+    def get_zone_keys(self, store_number):
+        df = self._read("""
+            SELECT DISTINCT ZoneID
+            FROM tblZones
+            WHERE StoreNo = ?
+        """, [store_number])
+
+        return set(df["ZoneID"].astype(str)) if not df.empty else set()
+
     def insert_zone(self, store_number, zone_data):
-        self._execute("""
+        self.insert_zones(store_number, [zone_data])
+
+    def update_zone(self, store_number, zone_data):
+        self.update_zones(store_number, [zone_data])
+
+    def insert_zones(self, store_number, zones):
+        if not zones:
+            return
+
+        self._executemany("""
             INSERT INTO tblZones (
                 StoreNo,
                 ZoneID,
@@ -57,18 +150,24 @@ class LocalZoneRepository(BaseRepository):
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, [
-            store_number,
-            zone_data.zone_id,
-            zone_data.zone_desc,
-            zone_data.total_tags,
-            zone_data.total_qty,
-            zone_data.total_price,
-            zone_data.zone_error_total,
-            zone_data.zone_error_tags
+            [
+                store_number,
+                zone_data.zone_id,
+                zone_data.zone_desc,
+                zone_data.total_tags,
+                zone_data.total_qty,
+                zone_data.total_price,
+                zone_data.zone_error_total,
+                zone_data.zone_error_tags
+            ]
+            for zone_data in zones
         ])
 
-    def update_zone(self, store_number, zone_data):
-        self._execute("""
+    def update_zones(self, store_number, zones):
+        if not zones:
+            return
+
+        self._executemany("""
             UPDATE tblZones
             SET
                 ZoneDesc = ?,
@@ -80,12 +179,15 @@ class LocalZoneRepository(BaseRepository):
             WHERE StoreNo = ?
               AND ZoneID = ?
         """, [
-            zone_data.zone_desc,
-            zone_data.total_tags,
-            zone_data.total_qty,
-            zone_data.total_price,
-            zone_data.zone_error_total,
-            zone_data.zone_error_tags,
-            store_number,
-            zone_data.zone_id
+            [
+                zone_data.zone_desc,
+                zone_data.total_tags,
+                zone_data.total_qty,
+                zone_data.total_price,
+                zone_data.zone_error_total,
+                zone_data.zone_error_tags,
+                store_number,
+                zone_data.zone_id
+            ]
+            for zone_data in zones
         ])
\ No newline at end of file
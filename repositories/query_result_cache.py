@@ -0,0 +1,123 @@
+import os
+import uuid
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from utils.paths import get_appdata_root, read_config_file
+
+
+class QueryResultCache:
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    SUFFIX = ".feather"
+
+    _lock = threading.Lock()
+
+    def __init__(self, db_path: str, cache_dir: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else get_appdata_root() / "query_cache"
+        self.fingerprint = None
+
+        if not enabled:
+            return
+
+        try:
+            resolved = Path(db_path).resolve()
+            stat = resolved.stat()
+
+            self.fingerprint = f"{resolved}|{stat.st_size}|{stat.st_mtime_ns}"
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        except OSError:
+            logging.warning(f"Query cache disabled, unable to fingerprint {db_path}")
+            self.enabled = False
+
+    @classmethod
+    def from_config(cls, db_path: str, enabled: bool = True):
+        try:
+            config = read_config_file()
+
+        except Exception:
+            config = {}
+
+        return cls(
+            db_path,
+            max_bytes=int(config.get("query_cache_max_mb", cls.DEFAULT_MAX_BYTES // (1024 * 1024))) * 1024 * 1024,
+            enabled=enabled and bool(config.get("query_cache_enabled", True)),
+        )
+
+    def get(self, query, params=None) -> pd.DataFrame | None:
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(query, params)
+
+        try:
+            df = pd.read_feather(path)
+            os.utime(path)
+
+            return df
+
+        except FileNotFoundError:
+            return None
+
+        except Exception:
+            logging.warning(f"Discarding unreadable query cache entry: {path.name}")
+            path.unlink(missing_ok=True)
+
+            return None
+
+    def put(self, query, params, df: pd.DataFrame):
+        if not self.enabled:
+            return
+
+        path = self._entry_path(query, params)
+        tmp_path = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            df.reset_index(drop=True).to_feather(tmp_path)
+            os.replace(tmp_path, path)
+
+        except Exception:
+            logging.warning("Query result could not be cached", exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+            return
+
+        self._evict()
+
+    def clear(self):
+        with self._lock:
+            for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+                entry.unlink(missing_ok=True)
+
+    def _entry_path(self, query, params) -> Path:
+        key = hashlib.sha256(f"{self.fingerprint}|{' '.join(query.split())}|{list(params or [])!r}".encode("utf-8")).hexdigest()
+
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+
+            for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+                try:
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry))
+
+                except FileNotFoundError:
+                    continue
+
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, entry in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+
+                entry.unlink(missing_ok=True)
+                total -= size
\ No newline at end of file
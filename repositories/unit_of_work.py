@@ -0,0 +1,102 @@
+import logging
+
+from utils.tracing import trace_span
+from utils.db_drivers import DRIVER_ERRORS, INTEGRITY_ERRORS, PROGRAMMING_ERRORS
+from exceptions.database_exceptions import DatabaseQueryError, DatabaseInsertError, DatabaseUpdateError
+
+
+class UnitOfWork:
+
+    def __init__(self, connection, fast_executemany: bool = False):
+        self.connection = connection
+        self.fast_executemany = fast_executemany
+        self.active = False
+
+        self._statements: list[tuple[str, list]] = []
+
+    def __enter__(self):
+        self.begin()
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+
+        else:
+            self.rollback()
+
+        return False
+
+    def begin(self):
+        self._statements = []
+        self.active = True
+
+    def add(self, query, params=None):
+        self.add_many(query, [params or []])
+
+    def add_many(self, query, params_list):
+        params_list = list(params_list)
+
+        if not params_list:
+            return
+
+        if self._statements and self._statements[-1][0] == query:
+            self._statements[-1][1].extend(params_list)
+
+        else:
+            self._statements.append((query, params_list))
+
+    def commit(self):
+        statements, self._statements = self._statements, []
+        self.active = False
+
+        if not statements:
+            return
+
+        with trace_span("unit_of_work.commit", statements=len(statements), rows=sum(len(params_list) for _, params_list in statements)):
+            self._commit_statements(statements)
+
+    def _commit_statements(self, statements):
+        cursor = self.connection.cursor()
+
+        try:
+            if self.fast_executemany and hasattr(cursor, "fast_executemany"):
+                cursor.fast_executemany = True
+
+            for query, params_list in statements:
+                if len(params_list) == 1:
+                    cursor.execute(query, params_list[0])
+
+                else:
+                    cursor.executemany(query, params_list)
+
+            self.connection.commit()
+
+        except INTEGRITY_ERRORS as e:
+            self.connection.rollback()
+            logging.exception("Unit of work integrity error, transaction rolled back")
+            raise DatabaseInsertError(str(e)) from e
+
+        except PROGRAMMING_ERRORS as e:
+            self.connection.rollback()
+            logging.exception("Unit of work programming error, transaction rolled back")
+            raise DatabaseUpdateError(str(e)) from e
+
+        except DRIVER_ERRORS as e:
+            self.connection.rollback()
+            logging.exception("Unit of work commit failed, transaction rolled back")
+            raise DatabaseQueryError(str(e)) from e
+
+        finally:
+            cursor.close()
+
+    def rollback(self):
+        self._statements = []
+        self.active = False
+
+        try:
+            self.connection.rollback()
+
+        except DRIVER_ERRORS:
+            logging.exception("Unit of work rollback failed")
\ No newline at end of file
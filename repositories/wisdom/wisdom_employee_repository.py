@@ -19,13 +19,47 @@ class WisdomEmployeeRepository(BaseRepository):
             FROM tblEmpNames
         """)
 
-    def get_details(self):
+    DETAILS_QUERY = """
+        SELECT 
+            tag, 
+            empno, 
+            price, 
+            qty
+        FROM tblDetails
+        WHERE empno <> 'ZZ9999'
+    """
+
+    def get_details(self, chunk_size=None):
+        return self._read(self.DETAILS_QUERY, chunk_size=chunk_size or self.FETCH_BATCH_SIZE)
+
+    def iter_details(self, chunk_size=None):
+        return self._read_chunks(self.DETAILS_QUERY, chunk_size=chunk_size)
+
+    def get_detail_summary(self):
         return self._read("""
-            SELECT 
-                tag, 
-                empno, 
-                price, 
-                qty
+            SELECT
+                s.empno,
+                SUM(s.TagPrice) AS TotalPrice,
+                COUNT(s.tag) AS TotalTags,
+                SUM(s.TagQty) AS TotalQty
+            FROM (
+                SELECT
+                    empno,
+                    tag,
+                    SUM(price * qty) AS TagPrice,
+                    SUM(qty) AS TagQty
+                FROM tblDetails
+                WHERE empno <> 'ZZ9999'
+                GROUP BY empno, tag
+            ) AS s
+            GROUP BY s.empno
+        """)
+
+    def get_detail_tags(self):
+        return self._read("""
+            SELECT DISTINCT
+                tag,
+                empno
             FROM tblDetails
             WHERE empno <> 'ZZ9999'
         """)
@@ -1,39 +1,64 @@
+from contextlib import nullcontext
+
+from utils.tracing import traced
 from domain.dto.report_data import StoreReportData
 
 
 class LocalDataSaveService:
 
-    def __init__(self, store_repo, emp_repo, zone_repo, disc_repo, schema_repo):
+    def __init__(self, store_repo, emp_repo, zone_repo, disc_repo, schema_repo, unit_of_work=None):
         self.store_repo = store_repo
         self.emp_repo = emp_repo
         self.zone_repo = zone_repo
         self.disc_repo = disc_repo
         self.schema_repo = schema_repo
+        self.unit_of_work = unit_of_work
 
+    @traced("local.save_all")
     def save_all(self, report_data: StoreReportData):
         store_number = report_data.context.store_name.strip().split()[-1]
 
         self.schema_repo.create_tables_if_not_exists()
 
-        if self.store_repo.store_exists(store_number):
-            is_update = True
+        store_exists = self.store_repo.store_exists(store_number)
+        emp_keys = self.emp_repo.get_employee_keys(store_number) if store_exists else set()
+        zone_keys = self.zone_repo.get_zone_keys(store_number) if store_exists else set()
+
+        job_datetimes = [report_data.context.job_datetime]
 
-        else:
-            self.store_repo.insert_store(store_number, report_data.context)
-            is_update = False
+        if store_exists:
+            job_datetimes.extend(self.store_repo.get_store_info(store_number)["JobDateTime"])
 
-        for emp in report_data.employees:
-            if is_update:
-                self.emp_repo.update_employee(store_number, emp)
+        new_emps, existing_emps = self._split_by_key(report_data.employees, "emp_id", emp_keys)
+        new_zones, existing_zones = self._split_by_key(report_data.zones, "zone_id", zone_keys)
+
+        with self.unit_of_work or nullcontext():
+            if store_exists:
+                self.store_repo.update_store(store_number, report_data.context)
 
             else:
-                self.emp_repo.insert_employee(store_number, emp)
+                self.store_repo.insert_store(store_number, report_data.context)
+
+            self.emp_repo.update_employees(store_number, existing_emps)
+            self.emp_repo.insert_employees(store_number, new_emps)
 
-            self.disc_repo.replace_employee_discrepancies(store_number, emp.emp_id, emp)
+            self.disc_repo.replace_discrepancies(store_number, report_data.employees)
 
-        for zone in report_data.zones:
-            if is_update:
-                self.zone_repo.update_zone(store_number, zone)
+            self.zone_repo.update_zones(store_number, existing_zones)
+            self.zone_repo.insert_zones(store_number, new_zones)
+
+            self.emp_repo.refresh_monthly_rollup(job_datetimes)
+            self.zone_repo.refresh_monthly_rollup(job_datetimes)
+
+    @staticmethod
+    def _split_by_key(rows, attr, existing_keys):
+        new_rows, existing_rows = [], []
+
+        for row in rows:
+            if str(getattr(row, attr)) in existing_keys:
+                existing_rows.append(row)
 
             else:
-                self.zone_repo.insert_zone(store_number, zone)
\ No newline at end of file
+                new_rows.append(row)
+
+        return new_rows, existing_rows
\ No newline at end of file
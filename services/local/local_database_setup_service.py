@@ -0,0 +1,129 @@
+import os
+import time
+import logging
+from pathlib import Path
+
+from repositories.local.local_schema_repository import LocalSchemaRepository
+from repositories.local.local_table_repository import LocalTableRepository
+from repositories.unit_of_work import UnitOfWork
+from services.local.local_migration_service import LocalMigrationService
+from utils.db_drivers import pyodbc
+from utils.paths import get_legacy_db_path
+from exceptions.database_exceptions import DatabaseConnectionError
+
+
+class LocalDatabaseSetupService:
+
+    SQLITE_SIDECARS = ("-wal", "-shm", "-journal")
+    LOCK_TIMEOUT = 300.0
+    LOCK_POLL_INTERVAL = 0.2
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def ensure_database(self):
+        if self.factory.backend != "sqlite" or self.factory.db_path.exists():
+            return
+
+        lock_path = self.factory.db_path.with_name(f"{self.factory.db_path.name}.lock")
+
+        self._acquire_lock(lock_path)
+
+        try:
+            if not self.factory.db_path.exists():
+                self._create_database()
+
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+    def _create_database(self):
+        db_path = self.factory.db_path
+        temp_path = db_path.with_name(f"{db_path.name}.{os.getpid()}.tmp")
+
+        self._remove_database_files(temp_path)
+
+        try:
+            conn = self.factory.connect_sqlite(temp_path)
+
+            try:
+                self._initialize(conn)
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+            finally:
+                conn.close()
+
+            self._remove_sidecars(temp_path)
+            os.replace(temp_path, db_path)
+
+        except Exception as e:
+            self._remove_database_files(temp_path)
+
+            if isinstance(e, DatabaseConnectionError):
+                raise
+
+            logging.exception("Failed to create local SQLite database")
+            raise DatabaseConnectionError("Failed to create local database") from e
+
+        logging.info(f"Created local SQLite database at {db_path}")
+
+    def _initialize(self, conn):
+        legacy_path = get_legacy_db_path()
+
+        if legacy_path is not None and pyodbc is None:
+            logging.warning(f"Skipping migration from {legacy_path}, pyodbc is not available")
+            legacy_path = None
+
+        if legacy_path is None:
+            LocalSchemaRepository(conn).create_tables_if_not_exists()
+            return
+
+        logging.info(f"Migrating local data from {legacy_path} to {self.factory.db_path}")
+
+        legacy_conn = self.factory.connect_access(legacy_path)
+
+        try:
+            unit_of_work = UnitOfWork(conn)
+
+            LocalMigrationService(
+                LocalTableRepository(legacy_conn),
+                LocalTableRepository(conn, unit_of_work=unit_of_work),
+                LocalSchemaRepository(conn),
+                unit_of_work=unit_of_work
+            ).migrate()
+
+        finally:
+            legacy_conn.close()
+
+    def _acquire_lock(self, lock_path: Path):
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return
+
+            except FileExistsError:
+                if self._is_stale(lock_path):
+                    logging.warning(f"Removing stale lock file {lock_path}")
+                    lock_path.unlink(missing_ok=True)
+                    continue
+
+                if time.monotonic() > deadline:
+                    raise DatabaseConnectionError(f"Timed out waiting for {lock_path}")
+
+                time.sleep(self.LOCK_POLL_INTERVAL)
+
+    def _is_stale(self, lock_path: Path) -> bool:
+        try:
+            return time.time() - lock_path.stat().st_mtime > self.LOCK_TIMEOUT
+
+        except FileNotFoundError:
+            return False
+
+    def _remove_database_files(self, path: Path):
+        path.unlink(missing_ok=True)
+        self._remove_sidecars(path)
+
+    def _remove_sidecars(self, path: Path):
+        for suffix in self.SQLITE_SIDECARS:
+            path.with_name(f"{path.name}{suffix}").unlink(missing_ok=True)
\ No newline at end of file
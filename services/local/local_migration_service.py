@@ -0,0 +1,24 @@
+import logging
+from contextlib import nullcontext
+
+
+class LocalMigrationService:
+
+    def __init__(self, source_repo, target_repo, schema_repo, unit_of_work=None):
+        self.source_repo = source_repo
+        self.target_repo = target_repo
+        self.schema_repo = schema_repo
+        self.unit_of_work = unit_of_work
+
+    def migrate(self):
+        self.schema_repo.create_tables_if_not_exists()
+
+        with self.unit_of_work or nullcontext():
+            for table_name in self.target_repo.TABLES:
+                df = self.source_repo.read_table(table_name)
+
+                logging.info(f"Migrating {len(df)} rows from {table_name}")
+
+                self.target_repo.insert_rows(table_name, df)
+
+        self.schema_repo.rebuild_rollups()
\ No newline at end of file
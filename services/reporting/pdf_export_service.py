@@ -1,40 +1,198 @@
-import tempfile
+import os
+import time
+import atexit
+import logging
+import threading
 import webbrowser
 from io import BytesIO
+from datetime import datetime
 from pathlib import Path
-from xhtml2pdf import pisa
+from concurrent.futures import ProcessPoolExecutor
 
+from utils.paths import read_config_file, get_appdata_root
+from utils.tracing import trace_span
 from exceptions.report_exceptions import ReportExportError
 from exceptions.file_exceptions import FileSaveError
 
 
+WARM_UP_HTML = "<html><body><table><tr><td>warm-up</td></tr></table></body></html>"
+
+
+def _render_pdf(html: str) -> bytes:
+    from xhtml2pdf import pisa
+
+    buffer = BytesIO()
+
+    result = pisa.CreatePDF(html, buffer, encoding="utf-8")
+    if result.err:
+        raise ReportExportError("PDF generation failed (xhtml2pdf error)")
+
+    return buffer.getvalue()
+
+
 class PdfExportService:
 
-    @staticmethod
-    def export(html: str):
+    _executor = None
+    _executor_lock = threading.Lock()
+    _warm_up_thread = None
+
+    def __init__(self, output_dir=None, parallel: bool = False, max_workers: int | None = None):
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_config(cls, output_dir=None):
         try:
-            buffer = BytesIO()
+            config = read_config_file()
 
-            result = pisa.CreatePDF(html, buffer)
-            if result.err:
-                raise ReportExportError("PDF generation failed (xhtml2pdf error)")
+        except Exception:
+            config = {}
+
+        return cls(
+            output_dir,
+            parallel=bool(config.get("parallel_pdf_render", False)),
+            max_workers=config.get("pdf_render_workers"),
+        )
+
+    def warm_up(self):
+        with PdfExportService._executor_lock:
+            if PdfExportService._warm_up_thread is not None:
+                return
+
+            PdfExportService._warm_up_thread = threading.Thread(target=self._warm_up, name="pdf-warm-up", daemon=True)
+            PdfExportService._warm_up_thread.start()
+
+    @classmethod
+    def shutdown(cls):
+        with cls._executor_lock:
+            executor, PdfExportService._executor = PdfExportService._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def export(self, source, filename: str | None = None, path: Path | None = None) -> Path:
+        from xhtml2pdf import pisa
+
+        self._wait_for_warm_up()
+
+        try:
+            path = path or self.target_path(filename)
 
             try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                    tmp.write(buffer.getvalue())
-                    tmp.flush()
-                    path = Path(tmp.name).resolve()
+                with trace_span("pdf.export"), open(path, "wb") as pdf_file:
+                    result = pisa.CreatePDF(source, pdf_file, encoding="utf-8")
 
-            except Exception as e:
+            except OSError as e:
                 raise FileSaveError("Failed to write PDF to disk") from e
 
-            if not path.exists():
-                raise FileSaveError("PDF file was not created")
+            if result.err:
+                path.unlink(missing_ok=True)
+                raise ReportExportError("PDF generation failed (xhtml2pdf error)")
 
-            webbrowser.open(f"file://{path}")
+            return self._finish(path)
+
+        except (ReportExportError, FileSaveError):
+            raise
+
+        except Exception as e:
+            raise ReportExportError("Unexpected error during PDF export") from e
+
+    def export_sections(self, sections: list[str], filename: str | None = None, path: Path | None = None) -> Path:
+        return self.merge(self.render_sections(sections), filename, path)
+
+    def render_sections(self, sections: list[str]) -> list[bytes]:
+        self._wait_for_warm_up()
+
+        try:
+            with trace_span("pdf.render_sections", sections=len(sections), parallel=self.parallel):
+                if self.parallel and len(sections) > 1:
+                    return list(self._get_executor().map(_render_pdf, sections))
+
+                return [_render_pdf(html) for html in sections]
+
+        except ReportExportError:
+            raise
+
+        except Exception as e:
+            raise ReportExportError("Unexpected error during PDF export") from e
+
+    def merge(self, pdfs: list[bytes], filename: str | None = None, path: Path | None = None) -> Path:
+        from pypdf import PdfWriter
+
+        try:
+            with trace_span("pdf.merge", sections=len(pdfs)) as span:
+                writer = PdfWriter()
+
+                for pdf_bytes in pdfs:
+                    writer.append(BytesIO(pdf_bytes))
+
+                path = path or self.target_path(filename)
+                span.set(pages=len(writer.pages))
+
+                try:
+                    writer.write(path)
+
+                except OSError as e:
+                    raise FileSaveError("Failed to write PDF to disk") from e
+
+            return self._finish(path)
 
         except (ReportExportError, FileSaveError):
             raise
 
         except Exception as e:
-            raise ReportExportError("Unexpected error during PDF export") from e
\ No newline at end of file
+            raise ReportExportError("Unexpected error during PDF export") from e
+
+    def target_path(self, filename: str | None = None) -> Path:
+        try:
+            output_dir = self.output_dir or get_appdata_root() / "reports"
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            return (output_dir / (filename or f"report_{datetime.now():%Y%m%d_%H%M%S_%f}.pdf")).resolve()
+
+        except Exception as e:
+            raise FileSaveError("Failed to resolve PDF output path") from e
+
+    def _finish(self, path: Path) -> Path:
+        if not path.exists():
+            raise FileSaveError("PDF file was not created")
+
+        if self.output_dir is None:
+            webbrowser.open(f"file://{path}")
+
+        return path
+
+    def _warm_up(self):
+        start = time.perf_counter()
+
+        try:
+            if self.parallel:
+                workers = self.max_workers or min(5, os.cpu_count() or 1)
+                list(self._get_executor().map(_render_pdf, [WARM_UP_HTML] * workers))
+
+            else:
+                _render_pdf(WARM_UP_HTML)
+
+        except Exception:
+            logging.exception("PDF renderer warm-up failed")
+            return
+
+        logging.info(f"PDF renderer warmed up in {time.perf_counter() - start:.2f}s")
+
+    @staticmethod
+    def _wait_for_warm_up():
+        thread = PdfExportService._warm_up_thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with PdfExportService._executor_lock:
+            if PdfExportService._executor is None:
+                PdfExportService._executor = ProcessPoolExecutor(max_workers=self.max_workers or min(5, os.cpu_count() or 1))
+
+            return PdfExportService._executor
+
+
+atexit.register(PdfExportService.shutdown)
\ No newline at end of file
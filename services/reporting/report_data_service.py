@@ -1,21 +1,161 @@
+import numpy as np
 from typing import List
 
+from utils.tracing import traced
 from domain.dto.employee import Employee, AggregateEmployee
 from domain.dto.zone import Zone, AggregateZone
+from domain.dto.report_view_model import ReportViewModel, EmployeeRow, ZoneRow, DiscrepancyRow
+
+
+HIGH_ERROR_STYLE = ' style="background-color: #ffcccc;"'
+WARN_ERROR_STYLE = ' style="background-color: #ffffcc;"'
 
 
 class ReportDataService:
 
     @staticmethod
-    def prepare_emp_data(emp_data: List[Employee | AggregateEmployee]):
-        for e in emp_data:
-            hours = float(e.hours or 0)
-            qty = e.total_qty or 0
+    @traced("report.build_view_model")
+    def build_view_model(emp_data: List[Employee | AggregateEmployee], zone_data: List[Zone | AggregateZone]) -> ReportViewModel:
+        employees = ReportDataService._sorted_employees(emp_data)
+        emp_rows = ReportDataService._employee_rows(employees, with_adjustments=False)
+        zone_rows = ReportDataService._zone_rows(zone_data)
+        line_employees = sorted(emp_data, key=lambda e: str(e.emp_id))
+        disc_records = ReportDataService._line_records(line_employees, "zone_errors")
+        man_records = ReportDataService._line_records(line_employees, "manual_adjustments")
+
+        return ReportViewModel(
+            sections={
+                "emp": emp_rows,
+                "emp_man": ReportDataService._employee_rows(employees, with_adjustments=True),
+                "aggregate_emp": emp_rows,
+                "zone": zone_rows,
+                "aggregate_zone": zone_rows,
+                "disc": ReportDataService._line_rows(disc_records),
+                "man": ReportDataService._line_rows(man_records),
+            },
+            line_records={"disc": disc_records, "man": man_records},
+        )
+
+    @staticmethod
+    def _sorted_employees(emp_data) -> list:
+        qty = np.array([float(e.total_qty or 0) for e in emp_data], dtype=float)
+        hours = np.array([float(e.hours or 0) for e in emp_data], dtype=float)
+
+        uph = np.divide(qty, hours, out=np.zeros_like(qty), where=hours > 0)
+        order = np.lexsort((-qty, -uph))
+
+        return [(emp_data[i], qty[i], uph[i]) for i in order]
+
+    @staticmethod
+    def _employee_rows(employees: list, with_adjustments: bool) -> List[EmployeeRow]:
+        emps = [e for e, _, _ in employees]
+
+        metrics = np.array([
+            (
+                e.zone_error_total,
+                e.zone_error_tags,
+                e.zone_error_percent,
+                e.manual_adjustment_total,
+                e.total_error_tags,
+                e.manual_adjustment_percent,
+                e.total_price,
+                e.total_tags,
+                getattr(e, "total_stores", 0),
+            )
+            for e in emps
+        ], dtype=float).reshape(-1, 9)
+
+        if with_adjustments:
+            error_total = metrics[:, 0] + metrics[:, 3]
+            error_tags = metrics[:, 4]
+            error_percent = metrics[:, 2] + metrics[:, 5]
+
+        else:
+            error_total, error_tags, error_percent = metrics[:, 0], metrics[:, 1], metrics[:, 2]
+
+        row_styles = np.select([error_percent >= 1.5, error_percent >= 1.0], [HIGH_ERROR_STYLE, WARN_ERROR_STYLE], "")
+
+        columns = zip(
+            [str(e.emp_id) for e in emps],
+            [str(e.emp_name) for e in emps],
+            row_styles.tolist(),
+            _money(error_total),
+            _count(error_tags),
+            _decimal(error_percent),
+            _money(metrics[:, 6]),
+            _count(metrics[:, 7]),
+            _count(np.array([qty for _, qty, _ in employees], dtype=float)),
+            _count(np.array([uph for _, _, uph in employees], dtype=float)),
+            _count(metrics[:, 8]),
+        )
+
+        return [EmployeeRow(*values) for values in columns]
+
+    @staticmethod
+    def _zone_rows(zone_data) -> List[ZoneRow]:
+        zones = [z for z in zone_data if z.total_qty > 0]
+        order = np.argsort(np.array([int(z.zone_id) for z in zones], dtype=np.int64), kind="stable")
+        zones = [zones[i] for i in order]
 
-            e.uph = (qty / hours) if hours > 0 else 0
+        metrics = np.array([
+            (
+                z.zone_error_total,
+                z.zone_error_tags,
+                z.zone_error_percent,
+                z.total_price,
+                z.total_tags,
+                z.total_qty,
+                getattr(z, "total_stores", 0),
+            )
+            for z in zones
+        ], dtype=float).reshape(-1, 7)
 
-        return sorted(emp_data, key=lambda x: (-x.uph, -x.total_qty))
+        columns = zip(
+            [str(z.zone_id) for z in zones],
+            [str(z.zone_desc) for z in zones],
+            _money(metrics[:, 0]),
+            _count(metrics[:, 1]),
+            _decimal(metrics[:, 2]),
+            _money(metrics[:, 3]),
+            _count(metrics[:, 4]),
+            _count(metrics[:, 5]),
+            _count(metrics[:, 6]),
+        )
+
+        return [ZoneRow(*values) for values in columns]
+
+    @staticmethod
+    def _line_records(employees: list, attr: str) -> list:
+        return [
+            (e.emp_id, line.zone_id, line.tag, line.upc, line.price, line.counted_qty, line.new_qty, line.line_error)
+            for e in employees
+            for line in getattr(e, attr)
+        ]
 
     @staticmethod
-    def prepare_zone_data(zone_data: List[Zone | AggregateZone]):
-        return sorted(zone_data, key=lambda x: int(x.zone_id))
\ No newline at end of file
+    def _line_rows(records: list) -> List[DiscrepancyRow]:
+        return [
+            DiscrepancyRow(
+                str(emp_id),
+                str(zone_id),
+                str(tag),
+                str(upc),
+                "$%.2f" % price,
+                "%i" % counted_qty,
+                "%i" % new_qty,
+                "$%.2f" % line_error,
+            )
+            for emp_id, zone_id, tag, upc, price, counted_qty, new_qty, line_error in records
+        ]
+
+
+def _money(values: np.ndarray) -> List[str]:
+    return list(map("$%.2f".__mod__, values.tolist()))
+
+
+def _decimal(values: np.ndarray) -> List[str]:
+    return list(map("%.2f".__mod__, values.tolist()))
+
+
+def _count(values: np.ndarray) -> List[str]:
+    return list(map("%i".__mod__, values.tolist()))
\ No newline at end of file
@@ -1,53 +1,113 @@
 import logging
 
+from utils.tracing import traced
+from services.reporting.report_pagination_service import ReportPaginationService
 from exceptions.report_exceptions import ReportGenerationError
 from domain.dto.report_data import StoreReportData, AggregateReportData
 
 
 class ReportGeneratorService:
 
-    def __init__(self, template_service, data_service, rendering_service, pdf_service):
+    def __init__(self, template_service, data_service, rendering_service, pdf_service, pagination_service=None, section_cache=None):
         self.templates = template_service
         self.data = data_service
         self.renderer = rendering_service
         self.pdf = pdf_service
+        self.pagination = pagination_service or ReportPaginationService()
+        self.section_cache = section_cache
 
-    def generate_report(self, report_data: StoreReportData):
+    @traced("report.generate")
+    def generate_report(self, report_data: StoreReportData, filename: str | None = None):
         try:
             templates = self.templates.get_standard_templates()
 
-            emp_data = self.data.prepare_emp_data(report_data.employees)
-            zone_data = self.data.prepare_zone_data(report_data.zones)
+            view_model = self.data.build_view_model(report_data.employees, report_data.zones)
 
-            html = self.renderer.render(
-                templates=templates,
-                store_data=report_data.context,
-                emp_data=emp_data,
-                zone_data=zone_data,
-            )
-
-            self.pdf.export(html)
+            return self._export(templates, report_data.context, view_model, filename)
 
         except Exception as e:
             logging.exception("Failed to generate report")
             raise ReportGenerationError("Store report generation failed") from e
 
-    def generate_aggregate_report(self, report_data: AggregateReportData):
+    @traced("report.generate_aggregate")
+    def generate_aggregate_report(self, report_data: AggregateReportData, filename: str | None = None):
         try:
             templates = self.templates.get_aggregate_templates()
 
-            emp_data = self.data.prepare_emp_data(report_data.employees)
-            zone_data = self.data.prepare_zone_data(report_data.zones)
+            view_model = self.data.build_view_model(report_data.employees, report_data.zones)
+
+            return self._export(templates, report_data.context, view_model, filename)
+
+        except Exception as e:
+            logging.exception("Failed to generate aggregate report")
+            raise ReportGenerationError("Aggregate report generation failed") from e
+
+    def _export(self, templates, store_data, view_model, filename):
+        path = self.pdf.target_path(filename)
+        pagination = None
+
+        try:
+            pagination = self.pagination.paginate(templates, view_model, overflow_base=path)
+
+            if self.section_cache is not None:
+                return self._export_cached(templates, store_data, pagination, path)
+
+            if self.pdf.parallel:
+                sections = self.renderer.render_sections(
+                    templates=templates,
+                    store_data=store_data,
+                    pagination=pagination,
+                )
 
-            html = self.renderer.render(
+                return self.pdf.export_sections(sections, path=path)
+
+            with self.renderer.render_to_file(
                 templates=templates,
-                store_data=report_data.context,
-                emp_data=emp_data,
-                zone_data=zone_data,
+                store_data=store_data,
+                pagination=pagination,
+            ) as html_file:
+                return self.pdf.export(html_file, path=path)
+
+        except Exception:
+            self._remove_outputs(path, pagination)
+            raise
+
+    @staticmethod
+    def _remove_outputs(path, pagination):
+        path.unlink(missing_ok=True)
+
+        if pagination is None:
+            return
+
+        for section in pagination.sections.values():
+            if section.overflow_path is not None:
+                section.overflow_path.unlink(missing_ok=True)
+
+    def _export_cached(self, templates, store_data, pagination, path):
+        keys = [
+            self.section_cache.key(
+                template.name,
+                store_data,
+                pagination.sections[self.pagination.section_key(template.name)],
+                pagination.page_count,
             )
+            for template in templates
+        ]
 
-            self.pdf.export(html)
+        pdfs = [self.section_cache.get(key) for key in keys]
+        missing = [i for i, pdf_bytes in enumerate(pdfs) if pdf_bytes is None]
 
-        except Exception as e:
-            logging.exception("Failed to generate aggregate report")
-            raise ReportGenerationError("Aggregate report generation failed") from e
\ No newline at end of file
+        if missing:
+            sections = self.renderer.render_sections(
+                templates=[templates[i] for i in missing],
+                store_data=store_data,
+                pagination=pagination,
+            )
+
+            for i, pdf_bytes in zip(missing, self.pdf.render_sections(sections)):
+                self.section_cache.put(keys[i], pdf_bytes)
+                pdfs[i] = pdf_bytes
+
+        logging.info(f"Reused {len(templates) - len(missing)} of {len(templates)} cached report sections")
+
+        return self.pdf.merge(pdfs, path=path)
\ No newline at end of file
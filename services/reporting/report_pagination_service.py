@@ -0,0 +1,92 @@
+import math
+import logging
+import pandas as pd
+from pathlib import Path
+
+from utils.paths import read_config_file
+from utils.tracing import traced
+from domain.dto.report_pagination import ReportPage, ReportSection, ReportPagination
+from domain.dto.report_view_model import ReportViewModel, LINE_COLUMNS
+from exceptions.file_exceptions import FileSaveError
+
+
+class ReportPaginationService:
+
+    DEFAULT_ROWS_PER_PAGE = 20
+    SECTION_ROWS_PER_PAGE = {
+        "disc": 36,
+        "man": 36,
+    }
+    CAPPED_SECTIONS = {"disc", "man"}
+    OVERFLOW_FORMATS = {"csv", "parquet"}
+
+    def __init__(self, rows_per_page: int | None = None, row_cap: int | None = None, overflow_format: str = "csv"):
+        self.rows_per_page = rows_per_page
+        self.row_cap = row_cap
+        self.overflow_format = overflow_format if overflow_format in self.OVERFLOW_FORMATS else "csv"
+
+    @classmethod
+    def from_config(cls):
+        try:
+            config = read_config_file()
+
+        except Exception:
+            config = {}
+
+        return cls(
+            rows_per_page=config.get("report_rows_per_page"),
+            row_cap=config.get("report_row_cap"),
+            overflow_format=str(config.get("report_overflow_format", "csv")).lower(),
+        )
+
+    @traced("report.paginate")
+    def paginate(self, templates, view_model: ReportViewModel, overflow_base: Path | None = None) -> ReportPagination:
+        pagination = ReportPagination()
+
+        for template in templates:
+            key = self.section_key(template.name)
+            rows = view_model.sections.get(key, [])
+            total_rows = len(rows)
+            overflow_path = None
+
+            if key in self.CAPPED_SECTIONS and self.row_cap and total_rows > self.row_cap:
+                if overflow_base is not None:
+                    overflow_path = self._write_overflow(view_model.line_records[key], overflow_base, key)
+
+                rows = rows[:self.row_cap]
+
+            per_page = self.rows_per_page or self.SECTION_ROWS_PER_PAGE.get(key, self.DEFAULT_ROWS_PER_PAGE)
+            page_total = max(1, math.ceil(len(rows) / per_page))
+
+            pages = [
+                ReportPage(number=pagination.page_count + i + 1, rows=rows[i * per_page:(i + 1) * per_page])
+                for i in range(page_total)
+            ]
+
+            pagination.sections[key] = ReportSection(pages, total_rows, len(rows), overflow_path)
+            pagination.page_count += page_total
+
+        return pagination
+
+    @staticmethod
+    def section_key(template_name: str) -> str:
+        return template_name.rsplit("/", 1)[-1].removesuffix(".html").removesuffix("_report")
+
+    def _write_overflow(self, records, overflow_base: Path, key) -> Path:
+        path = Path(overflow_base).with_name(f"{Path(overflow_base).stem}_{key}.{self.overflow_format}")
+        df = pd.DataFrame.from_records(records, columns=LINE_COLUMNS)
+
+        try:
+            if self.overflow_format == "parquet":
+                df.to_parquet(path, index=False)
+
+            else:
+                df.to_csv(path, index=False)
+
+        except Exception as e:
+            logging.exception("Failed to write report overflow file")
+            raise FileSaveError(f"Failed to write overflow file: {path}") from e
+
+        logging.info(f"Wrote {len(df)} {key} rows to {path}")
+
+        return path
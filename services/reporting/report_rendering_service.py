@@ -1,20 +1,55 @@
 import logging
+from tempfile import SpooledTemporaryFile
 
+from utils.tracing import trace_span
 from exceptions.report_exceptions import ReportGenerationError
 
 
 class ReportRenderingService:
 
+    PAGE_BREAK = "<div style='page-break-before: always;'></div>"
+    SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+    @staticmethod
+    def render(templates, store_data, pagination):
+        return ReportRenderingService.PAGE_BREAK.join(
+            ReportRenderingService.render_sections(templates, store_data, pagination)
+        )
+
     @staticmethod
-    def render(templates, store_data, emp_data, zone_data):
+    def render_sections(templates, store_data, pagination):
         try:
             html_fragments = []
 
             for template in templates:
-                html_fragments.append(template.render(store_data=store_data, emp_data=emp_data, zone_data=zone_data))
+                with trace_span("render.template", template=template.name) as span:
+                    html_fragments.append(template.render(store_data=store_data, pagination=pagination))
+                    span.set(bytes=len(html_fragments[-1]))
+
+            return html_fragments
+
+        except Exception as e:
+            logging.exception("Failed to render report templates")
+            raise ReportGenerationError("Report rendering failed") from e
+
+    @staticmethod
+    def render_to_file(templates, store_data, pagination, max_memory: int = SPOOL_MAX_MEMORY):
+        html_file = SpooledTemporaryFile(max_size=max_memory, mode="w+b")
+
+        try:
+            for i, template in enumerate(templates):
+                if i:
+                    html_file.write(ReportRenderingService.PAGE_BREAK.encode("utf-8"))
+
+                with trace_span("render.template", template=template.name):
+                    for chunk in template.generate(store_data=store_data, pagination=pagination):
+                        html_file.write(chunk.encode("utf-8"))
+
+            html_file.seek(0)
 
-            return "<div style='page-break-before: always;'></div>".join(html_fragments)
+            return html_file
 
         except Exception as e:
+            html_file.close()
             logging.exception("Failed to render report templates")
             raise ReportGenerationError("Report rendering failed") from e
\ No newline at end of file
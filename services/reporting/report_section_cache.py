@@ -0,0 +1,56 @@
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+
+from utils.paths import read_config_file
+
+
+class ReportSectionCache:
+
+    DEFAULT_MAX_ENTRIES = 32
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "ReportSectionCache | None":
+        try:
+            config = read_config_file()
+
+        except Exception:
+            config = {}
+
+        if not config.get("report_section_cache", True):
+            return None
+
+        return cls(max_entries=int(config.get("report_section_cache_entries") or cls.DEFAULT_MAX_ENTRIES))
+
+    @staticmethod
+    def key(template_name: str, store_data, section, page_count: int) -> str:
+        payload = pickle.dumps((template_name, store_data, section, page_count), protocol=pickle.HIGHEST_PROTOCOL)
+
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            pdf_bytes = self._entries.get(key)
+
+            if pdf_bytes is not None:
+                self._entries.move_to_end(key)
+
+            return pdf_bytes
+
+    def put(self, key: str, pdf_bytes: bytes):
+        with self._lock:
+            self._entries[key] = pdf_bytes
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
\ No newline at end of file
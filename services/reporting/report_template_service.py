@@ -1,22 +1,57 @@
 import logging
+import threading
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, TemplateNotFound
 
-from utils.paths import resource_path
+from utils.paths import resource_path, get_appdata_root
 from exceptions.report_exceptions import ReportGenerationError
 from exceptions.file_exceptions import FileLoadError, InvalidFileFormatError
 
 
+class _TemplateBytecodeCache(FileSystemBytecodeCache):
+
+    def get_cache_key(self, name, filename=None):
+        return super().get_cache_key(name)
+
+
 class ReportTemplateService:
 
+    _env = None
+    _lock = threading.Lock()
+
     def __init__(self):
+        self.env = self._get_environment()
+
+    @classmethod
+    def _get_environment(cls) -> Environment:
+        with cls._lock:
+            if cls._env is None:
+                cls._env = cls._create_environment()
+
+            return cls._env
+
+    @staticmethod
+    def _create_environment() -> Environment:
         try:
             path = resource_path("assets/templates")
 
             if not path or not Path(path).exists():
                 raise FileLoadError(f"Template directory not found: {path}")
 
-            self.env = Environment(loader=FileSystemLoader(path))
+            try:
+                cache_dir = get_appdata_root() / "template_cache"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = _TemplateBytecodeCache(str(cache_dir))
+
+            except Exception:
+                logging.warning("Template bytecode cache unavailable, compiling templates in memory")
+                bytecode_cache = None
+
+            return Environment(
+                loader=FileSystemLoader(path),
+                bytecode_cache=bytecode_cache,
+                auto_reload=False,
+            )
 
         except FileLoadError:
             raise
@@ -25,6 +60,18 @@ class ReportTemplateService:
             logging.exception("Failed to initialize ReportTemplateService")
             raise ReportGenerationError("Failed to initialize templates") from e
 
+    @classmethod
+    def precompile(cls) -> int:
+        env = cls._get_environment()
+        names = [name for name in env.list_templates() if name.endswith(".html")]
+
+        for name in names:
+            env.get_template(name)
+
+        logging.info(f"Precompiled {len(names)} report templates")
+
+        return len(names)
+
     def get_standard_templates(self):
         try:
             return [
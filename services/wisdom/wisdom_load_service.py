@@ -0,0 +1,169 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from mappers.wisdom.wisdom_store_mapper import WisdomStoreMapper
+from mappers.wisdom.wisdom_employee_mapper import WisdomEmployeeMapper
+from mappers.wisdom.wisdom_zone_mapper import WisdomZoneMapper
+from repositories.wisdom.wisdom_store_repository import WisdomStoreRepository
+from repositories.wisdom.wisdom_employee_repository import WisdomEmployeeRepository
+from repositories.wisdom.wisdom_zone_repository import WisdomZoneRepository
+from utils.paths import read_config_file
+from utils.task_progress import TaskProgress
+from utils.tracing import traced
+from domain.enums.task_stage import TaskStage
+from domain.dto.report_data import StoreReportData
+
+
+class _LazyConnection:
+
+    def __init__(self, connect):
+        self._connect = connect
+
+    def cursor(self):
+        return self._connect().cursor()
+
+
+class WisdomLoadService:
+
+    QUERIES = {
+        "detail_summary": (WisdomEmployeeRepository, "get_detail_summary"),
+        "detail_tags": (WisdomEmployeeRepository, "get_detail_tags"),
+        "zone_errors": (WisdomZoneRepository, "get_zone_errors"),
+        "manual_adjustments": (WisdomEmployeeRepository, "get_manual_adjustments"),
+        "totals": (WisdomZoneRepository, "get_totals"),
+        "terminals": (WisdomEmployeeRepository, "get_terminals"),
+        "employees": (WisdomEmployeeRepository, "get_employees"),
+        "zones": (WisdomZoneRepository, "get_zones"),
+        "wise_info": (WisdomStoreRepository, "get_wise_info"),
+    }
+
+    DETAIL_QUERIES = ("detail_summary", "detail_tags")
+
+    def __init__(self, factory, max_connections: int = 3, cache=None, aggregate_in_database: bool = True):
+        self.factory = factory
+        self.max_connections = max_connections
+        self.cache = cache
+        self.aggregate_in_database = aggregate_in_database
+
+        self.store_mapper = WisdomStoreMapper()
+        self.emp_mapper = WisdomEmployeeMapper()
+        self.zone_mapper = WisdomZoneMapper()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    @classmethod
+    def from_config(cls, factory, cache=None):
+        try:
+            config = read_config_file()
+
+        except Exception:
+            config = {}
+
+        return cls(factory, cache=cache, aggregate_in_database=bool(config.get("wisdom_aggregate_in_database", True)))
+
+    @traced("wisdom.load")
+    def load(self, progress: TaskProgress | None = None) -> StoreReportData:
+        progress = progress or TaskProgress()
+        progress.update(TaskStage.CONNECT)
+
+        start = time.perf_counter()
+
+        mappings = {
+            "context": (("wise_info",), self._map_store),
+            "employees": (("terminals", "employees", "detail_summary", "detail_tags", "zone_errors", "manual_adjustments"), self._map_employees),
+            "zones": (("zones", "totals", "zone_errors"), self._map_zones),
+        }
+
+        frames = {}
+        results = {}
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix="wisdom-load") as executor:
+                futures = {
+                    executor.submit(self._fetch, repo_class, method): name
+                    for name, (repo_class, method) in self.QUERIES.items()
+                    if self.aggregate_in_database or name not in self.DETAIL_QUERIES
+                }
+
+                if not self.aggregate_in_database:
+                    futures[executor.submit(self._fetch_detail_totals)] = self.DETAIL_QUERIES
+
+                try:
+                    for future in as_completed(futures):
+                        name = futures[future]
+
+                        if name == self.DETAIL_QUERIES:
+                            frames.update(zip(name, future.result()))
+
+                        else:
+                            frames[name] = future.result()
+
+                        progress.update(TaskStage.FETCH, len(frames), len(self.QUERIES))
+
+                        for target, (inputs, mapper) in mappings.items():
+                            if target not in results and all(name in frames for name in inputs):
+                                progress.update(TaskStage.MAP, len(results), len(mappings))
+                                results[target] = mapper(frames)
+
+                except Exception:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+        finally:
+            self._close_connections()
+            self.factory.close_pool()
+
+        logging.info(f"Wisdom data loaded in {time.perf_counter() - start:.2f}s ({self.max_connections} connections)")
+
+        return StoreReportData(results["context"], results["employees"], results["zones"])
+
+    def _fetch(self, repo_class, method):
+        return getattr(repo_class(_LazyConnection(self._connection), cache=self.cache), method)()
+
+    def _fetch_detail_totals(self):
+        repo = WisdomEmployeeRepository(_LazyConnection(self._connection), cache=self.cache)
+
+        return self.emp_mapper.summarize_details(repo.iter_details())
+
+    def _connection(self):
+        conn = getattr(self._local, "connection", None)
+
+        if conn is None:
+            conn = self.factory.create()
+            self._local.connection = conn
+
+            with self._lock:
+                self._connections.append(conn)
+
+        return conn
+
+    def _close_connections(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        for conn in connections:
+            try:
+                conn.close()
+
+            except Exception:
+                logging.exception("Failed to close Wisdom database connection")
+
+    def _map_store(self, frames):
+        return self.store_mapper.to_store_context(frames["wise_info"])
+
+    def _map_employees(self, frames):
+        return self.emp_mapper.to_employee_models_from_summary(
+            frames["terminals"],
+            frames["employees"],
+            frames["detail_summary"],
+            frames["detail_tags"],
+            frames["zone_errors"],
+            frames["manual_adjustments"],
+        )
+
+    def _map_zones(self, frames):
+        return self.zone_mapper.to_zone_models(frames["zones"], frames["totals"], frames["zone_errors"])
\ No newline at end of file
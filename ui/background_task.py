@@ -0,0 +1,72 @@
+from PyQt6 import QtCore, QtWidgets
+
+from utils.task_progress import TaskProgress
+
+
+PROGRESS_DIALOG_DELAY_MS = 300
+
+
+class TaskSignals(QtCore.QObject):
+
+    progress = QtCore.pyqtSignal(str, int, int)
+    succeeded = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class BackgroundTask(QtCore.QRunnable):
+
+    def __init__(self, work):
+        super().__init__()
+
+        self.work = work
+        self.signals = TaskSignals()
+        self.progress = TaskProgress(self._emit_progress)
+
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self.progress.cancel()
+
+    def run(self):
+        try:
+            result = self.work(self.progress)
+
+        except Exception as e:
+            self.signals.failed.emit(e)
+
+        else:
+            self.signals.succeeded.emit(result)
+
+    def _emit_progress(self, stage, current, total):
+        self.signals.progress.emit(stage.value, current, total)
+
+
+def start_background_task(parent: QtWidgets.QWidget, title: str, work, on_success, on_failure) -> BackgroundTask:
+    task = BackgroundTask(work)
+
+    progress_dialog = QtWidgets.QProgressDialog(title, "Cancel", 0, 0, parent)
+    progress_dialog.setWindowTitle(title)
+    progress_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+    progress_dialog.setMinimumDuration(PROGRESS_DIALOG_DELAY_MS)
+    progress_dialog.setAutoReset(False)
+    progress_dialog.setAutoClose(False)
+    progress_dialog.canceled.connect(task.cancel)
+
+    def update(label, current, total):
+        progress_dialog.setLabelText(label)
+        progress_dialog.setMaximum(total)
+        progress_dialog.setValue(current)
+
+    def finish(callback, value):
+        progress_dialog.canceled.disconnect(task.cancel)
+        progress_dialog.reset()
+        progress_dialog.deleteLater()
+        callback(value)
+
+    task.signals.progress.connect(update)
+    task.signals.succeeded.connect(lambda result: finish(on_success, result))
+    task.signals.failed.connect(lambda error: finish(on_failure, error))
+
+    QtCore.QThreadPool.globalInstance().start(task)
+
+    return task
\ No newline at end of file
@@ -0,0 +1,55 @@
+from PyQt6 import QtCore, QtWidgets
+from PyQt6.QtCore import Qt
+
+
+class CheckBoxDelegate(QtWidgets.QStyledItemDelegate):
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+
+        opt.features &= ~QtWidgets.QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+        indicator = QtWidgets.QStyleOptionViewItem(option)
+        indicator.rect = self._indicator_rect(option, style)
+        indicator.state = (option.state & ~(QtWidgets.QStyle.StateFlag.State_On | QtWidgets.QStyle.StateFlag.State_Off)) | (
+            QtWidgets.QStyle.StateFlag.State_On if checked else QtWidgets.QStyle.StateFlag.State_Off
+        )
+
+        style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_IndicatorItemViewItemCheck, indicator, painter, opt.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if not index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            return False
+
+        if event.type() == QtCore.QEvent.Type.MouseButtonRelease:
+            if event.button() != Qt.MouseButton.LeftButton or not option.rect.contains(event.position().toPoint()):
+                return False
+
+        elif event.type() == QtCore.QEvent.Type.MouseButtonDblClick:
+            return True
+
+        elif event.type() == QtCore.QEvent.Type.KeyPress:
+            if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                return False
+
+        else:
+            return False
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+        return model.setData(index, Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+
+    @staticmethod
+    def _indicator_rect(option, style) -> QtCore.QRect:
+        size = QtCore.QSize(
+            style.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_IndicatorWidth, option, option.widget),
+            style.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_IndicatorHeight, option, option.widget),
+        )
+
+        return QtWidgets.QStyle.alignedRect(option.direction, Qt.AlignmentFlag.AlignCenter, size, option.rect)
\ No newline at end of file
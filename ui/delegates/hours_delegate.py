@@ -0,0 +1,45 @@
+from PyQt6 import QtCore, QtGui, QtWidgets
+from PyQt6.QtCore import Qt
+
+
+class HoursDelegate(QtWidgets.QStyledItemDelegate):
+
+    NEXT_KEYS = (Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Down)
+    PREVIOUS_KEYS = (Qt.Key.Key_Up,)
+    FIELD_MARGIN = 5
+    FIELD_RADIUS = 6
+    FIELD_BACKGROUND = QtGui.QColor("#e0e0e0")
+    FIELD_BORDER = QtGui.QColor("#bbbbbb")
+
+    navigate = QtCore.pyqtSignal(int)
+
+    def paint(self, painter, option, index):
+        field = option.rect.adjusted(self.FIELD_MARGIN, self.FIELD_MARGIN, -self.FIELD_MARGIN, -self.FIELD_MARGIN)
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.FIELD_BORDER)
+        painter.setBrush(self.FIELD_BACKGROUND)
+        painter.drawRoundedRect(QtCore.QRectF(field), self.FIELD_RADIUS, self.FIELD_RADIUS)
+        painter.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        painter.drawText(field, Qt.AlignmentFlag.AlignCenter, str(index.data(Qt.ItemDataRole.DisplayRole) or ""))
+        painter.restore()
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect.adjusted(self.FIELD_MARGIN, self.FIELD_MARGIN, -self.FIELD_MARGIN, -self.FIELD_MARGIN))
+
+    def createEditor(self, parent, option, index):
+        editor = QtWidgets.QLineEdit(parent)
+        editor.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        return editor
+
+    def eventFilter(self, editor, event):
+        if event.type() == QtCore.QEvent.Type.KeyPress and event.key() in self.NEXT_KEYS + self.PREVIOUS_KEYS:
+            self.commitData.emit(editor)
+            self.closeEditor.emit(editor, QtWidgets.QAbstractItemDelegate.EndEditHint.NoHint)
+            self.navigate.emit(1 if event.key() in self.NEXT_KEYS else -1)
+
+            return True
+
+        return super().eventFilter(editor, event)
\ No newline at end of file
@@ -1,14 +1,51 @@
+import logging
 from PyQt6 import QtWidgets
 
+from ui.background_task import BackgroundTask, start_background_task
+from utils.ui import show_error_message
 from domain.dto.report_data import StoreReportData, AggregateReportData
+from exceptions.task_exceptions import TaskCancelledError
 
 
 class BaseDataDialog(QtWidgets.QDialog):
 
+    ERROR_MESSAGES: tuple = ()
+    FALLBACK_ERROR = ("Unexpected Error", "Failed to load data.")
+
     def __init__(self):
         super().__init__()
 
         self.result_data: StoreReportData | AggregateReportData | None = None
+        self._task: BackgroundTask | None = None
 
     def _set_result_data(self, data: StoreReportData | AggregateReportData):
-        self.result_data = data
\ No newline at end of file
+        self.result_data = data
+
+    def _start_load(self, load):
+        self.btnLoad.setEnabled(False)
+        self._task = start_background_task(self, "Loading Data", load, self._on_load_succeeded, self._on_load_failed)
+
+    def _on_load_succeeded(self, data: StoreReportData | AggregateReportData):
+        self._task = None
+
+        self._set_result_data(data)
+        self.accept()
+
+    def _on_load_failed(self, error: Exception):
+        self._task = None
+        self.btnLoad.setEnabled(True)
+
+        if isinstance(error, TaskCancelledError):
+            logging.info("Data load cancelled")
+            return
+
+        self._handle_load_error(error)
+
+    def _handle_load_error(self, error: Exception):
+        show_error_message(self, error, self.ERROR_MESSAGES, self.FALLBACK_ERROR, type(self).__name__)
+
+    def reject(self):
+        if self._task is not None:
+            self._task.cancel()
+
+        super().reject()
\ No newline at end of file
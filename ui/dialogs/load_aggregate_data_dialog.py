@@ -1,9 +1,8 @@
-import logging
 from datetime import date
+from typing import TYPE_CHECKING
 
 from PyQt6 import QtWidgets, QtCore, uic
 
-from controllers.local_aggregate_data_controller import LocalAggregateDataController
 from ui.dialogs.base_data_dialog import BaseDataDialog
 from utils.paths import resource_path
 from utils.ui import center_on_screen
@@ -11,10 +10,19 @@ from exceptions.database_exceptions import DatabaseQueryError
 from exceptions.validation_exceptions import ValidationError
 from exceptions.wisdom_exceptions import WisdomDataError
 
+if TYPE_CHECKING:
+    from controllers.local_aggregate_data_controller import LocalAggregateDataController
+
 
 class LoadAggregateDataDialog(BaseDataDialog):
 
-    def __init__(self, controller: LocalAggregateDataController):
+    ERROR_MESSAGES = (
+        (ValidationError, QtWidgets.QMessageBox.warning, "Invalid Input", "Please select a valid date range."),
+        (WisdomDataError, QtWidgets.QMessageBox.critical, "Data Error", "Failed to load aggregate data."),
+        (DatabaseQueryError, QtWidgets.QMessageBox.critical, "Database Error", "Database query failed."),
+    )
+
+    def __init__(self, controller: "LocalAggregateDataController"):
         super().__init__()
 
         self.controller = controller
@@ -38,20 +46,7 @@ class LoadAggregateDataDialog(BaseDataDialog):
             start = self.dateStart.date().toPyDate()
             end = self.dateEnd.date().toPyDate()
 
-            data = self.controller.load(start, end)
-
-            self._set_result_data(data)
-            self.accept()
-
-        except ValidationError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Input", "Please select a valid date range.")
-
-        except WisdomDataError:
-            QtWidgets.QMessageBox.critical(self, "Data Error", "Failed to load aggregate data.")
-
-        except DatabaseQueryError:
-            QtWidgets.QMessageBox.critical(self, "Database Error", "Database query failed.")
+            self._start_load(lambda progress: self.controller.load(start, end, progress))
 
-        except Exception:
-            logging.exception("Unhandled error in LoadAggregateDataDialog.load_database")
-            QtWidgets.QMessageBox.critical(self, "Unexpected Error", "Failed to load data.")
\ No newline at end of file
+        except Exception as e:
+            self._handle_load_error(e)
\ No newline at end of file
@@ -1,7 +1,6 @@
-import logging
+from typing import TYPE_CHECKING
 from PyQt6 import QtWidgets, uic
 
-from controllers.local_store_data_controller import LocalStoreDataController
 from ui.dialogs.base_data_dialog import BaseDataDialog
 from utils.paths import resource_path
 from utils.ui import center_on_screen
@@ -9,10 +8,19 @@ from exceptions.database_exceptions import DatabaseQueryError
 from exceptions.validation_exceptions import ValidationError
 from exceptions.wisdom_exceptions import WisdomDataError
 
+if TYPE_CHECKING:
+    from controllers.local_store_data_controller import LocalStoreDataController
+
 
 class LoadLocalDataDialog(BaseDataDialog):
 
-    def __init__(self, controller: LocalStoreDataController):
+    ERROR_MESSAGES = (
+        (ValidationError, QtWidgets.QMessageBox.warning, "Invalid Input", "Please enter a valid store number."),
+        (WisdomDataError, QtWidgets.QMessageBox.critical, "Data Error", "Failed to load store data."),
+        (DatabaseQueryError, QtWidgets.QMessageBox.critical, "Database Error", "Database query failed."),
+    )
+
+    def __init__(self, controller: "LocalStoreDataController"):
         super().__init__()
 
         self.controller = controller
@@ -31,20 +39,7 @@ class LoadLocalDataDialog(BaseDataDialog):
             if not store_number:
                 raise ValidationError("Store number is required")
 
-            data = self.controller.load(store_number)
-
-            self._set_result_data(data)
-            self.accept()
-
-        except ValidationError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Input", "Please enter a valid store number.")
-
-        except WisdomDataError:
-            QtWidgets.QMessageBox.critical(self, "Data Error", "Failed to load store data.")
-
-        except DatabaseQueryError:
-            QtWidgets.QMessageBox.critical(self, "Database Error", "Database query failed.")
+            self._start_load(lambda progress: self.controller.load(store_number, progress))
 
-        except Exception:
-            logging.exception("Unhandled error in LoadLocalDataDialog.load_database")
-            QtWidgets.QMessageBox.critical(self, "Unexpected Error", "Failed to load data.")
\ No newline at end of file
+        except Exception as e:
+            self._handle_load_error(e)
\ No newline at end of file
@@ -1,17 +1,25 @@
-import logging
+from typing import TYPE_CHECKING
 from PyQt6 import QtWidgets, uic
 
-from controllers.wisdom_data_controller import WisdomDataController
 from ui.dialogs.base_data_dialog import BaseDataDialog
 from utils.paths import resource_path
 from utils.ui import center_on_screen
 from exceptions.validation_exceptions import ValidationError
 from exceptions.wisdom_exceptions import WisdomDatabaseNotFoundError, WisdomDataError
 
+if TYPE_CHECKING:
+    from controllers.wisdom_data_controller import WisdomDataController
+
 
 class LoadWisdomDataDynamicDialog(BaseDataDialog):
 
-    def __init__(self, controller: WisdomDataController):
+    ERROR_MESSAGES = (
+        (ValidationError, QtWidgets.QMessageBox.warning, "Invalid Input", "Please enter a valid job number."),
+        (WisdomDatabaseNotFoundError, QtWidgets.QMessageBox.critical, "Not Found", "No data found for the provided job number."),
+        (WisdomDataError, QtWidgets.QMessageBox.critical, "Wisdom Data Error", "Failed to load wisdom data."),
+    )
+
+    def __init__(self, controller: "WisdomDataController"):
         super().__init__()
 
         self.controller = controller
@@ -30,20 +38,7 @@ class LoadWisdomDataDynamicDialog(BaseDataDialog):
             if not job_number:
                 raise ValidationError("Job number is required")
 
-            data = self.controller.load_from_job_number(job_number)
-
-            self._set_result_data(data)
-            self.accept()
-
-        except ValidationError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Input", "Please enter a valid job number.")
-
-        except WisdomDatabaseNotFoundError:
-            QtWidgets.QMessageBox.critical(self, "Not Found", "No data found for the provided job number.")
-
-        except WisdomDataError:
-            QtWidgets.QMessageBox.critical(self, "Wisdom Data Error", "Failed to load wisdom data.")
+            self._start_load(lambda progress: self.controller.load_from_job_number(job_number, progress))
 
-        except Exception:
-            logging.exception("Unhandled error in LoadWisdomDataDynamicDialog.load_database")
-            QtWidgets.QMessageBox.critical(self, "Unexpected Error", "Failed to load data.")
\ No newline at end of file
+        except Exception as e:
+            self._handle_load_error(e)
\ No newline at end of file
@@ -1,7 +1,6 @@
-import logging
+from typing import TYPE_CHECKING
 from PyQt6 import QtWidgets, uic
 
-from controllers.wisdom_data_controller import WisdomDataController
 from ui.dialogs.base_data_dialog import BaseDataDialog
 from utils.paths import resource_path
 from utils.ui import center_on_screen
@@ -9,10 +8,21 @@ from exceptions.file_exceptions import InvalidFileFormatError, FileLoadError
 from exceptions.validation_exceptions import ValidationError
 from exceptions.wisdom_exceptions import WisdomDataError
 
+if TYPE_CHECKING:
+    from controllers.wisdom_data_controller import WisdomDataController
+
 
 class LoadWisdomDataManualDialog(BaseDataDialog):
 
-    def __init__(self, controller: WisdomDataController):
+    ERROR_MESSAGES = (
+        (ValidationError, QtWidgets.QMessageBox.warning, "Invalid Input", "Please provide a database path."),
+        (InvalidFileFormatError, QtWidgets.QMessageBox.warning, "Invalid File", "Please select a valid Access database file (.mdb or .accdb)."),
+        (FileLoadError, QtWidgets.QMessageBox.critical, "File Error", "Failed to load the database file."),
+        (WisdomDataError, QtWidgets.QMessageBox.critical, "Wisdom Error", "Failed to load wisdom data from the selected database."),
+    )
+    FALLBACK_ERROR = ("Unexpected Error", "An unexpected error occurred while loading data.")
+
+    def __init__(self, controller: "WisdomDataController"):
         super().__init__()
 
         self.controller = controller
@@ -46,23 +56,7 @@ class LoadWisdomDataManualDialog(BaseDataDialog):
             if not db_path.endswith((".mdb", ".MDB", ".accdb")):
                 raise InvalidFileFormatError("Invalid database file format")
 
-            data = self.controller.load_from_path(db_path)
-
-            self._set_result_data(data)
-            self.accept()
-
-        except ValidationError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Input", "Please provide a database path.")
-
-        except InvalidFileFormatError:
-            QtWidgets.QMessageBox.warning(self, "Invalid File", "Please select a valid Access database file (.mdb or .accdb).")
-
-        except FileLoadError:
-            QtWidgets.QMessageBox.critical(self, "File Error", "Failed to load the database file.")
-
-        except WisdomDataError:
-            QtWidgets.QMessageBox.critical(self, "Wisdom Error", "Failed to load wisdom data from the selected database.")
+            self._start_load(lambda progress: self.controller.load_from_path(db_path, progress))
 
-        except Exception:
-            logging.exception("Unhandled error in LoadWisdomDataManualDialog.load_database")
-            QtWidgets.QMessageBox.critical(self, "Unexpected Error", "An unexpected error occurred while loading data.")
\ No newline at end of file
+        except Exception as e:
+            self._handle_load_error(e)
\ No newline at end of file
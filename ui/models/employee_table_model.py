@@ -0,0 +1,125 @@
+from PyQt6 import QtCore
+from PyQt6.QtCore import Qt
+
+from domain.dto.employee import Employee, AggregateEmployee
+
+
+class EmployeeTableModel(QtCore.QAbstractTableModel):
+
+    ID_COLUMN = 0
+    NAME_COLUMN = 1
+    INPUT_COLUMN = 2
+    HEADERS = ("Employee ID", "Name", "")
+
+    def __init__(self, employees: list[Employee | AggregateEmployee], parent=None):
+        super().__init__(parent)
+
+        self.employees = employees
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.employees)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        emp = self.employees[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == self.ID_COLUMN:
+                return emp.emp_id
+
+            if index.column() == self.NAME_COLUMN:
+                return emp.emp_name
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if index.column() == self.INPUT_COLUMN:
+                return Qt.AlignmentFlag.AlignCenter
+
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        return Qt.ItemFlag.ItemIsEnabled
+
+
+class EmployeeHoursTableModel(EmployeeTableModel):
+
+    HEADERS = ("Employee ID", "Name", "Hours")
+
+    def __init__(self, employees: list[Employee], parent=None):
+        super().__init__(employees, parent)
+
+        self.hours = ["" if emp.hours is None else str(emp.hours) for emp in employees]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and index.column() == self.INPUT_COLUMN and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.hours[index.row()]
+
+        return super().data(index, role)
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != self.INPUT_COLUMN or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        self.hours[index.row()] = str(value)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+
+        if index.isValid() and index.column() == self.INPUT_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsSelectable
+
+        return flags
+
+
+class EmployeeSelectTableModel(EmployeeTableModel):
+
+    HEADERS = ("Employee ID", "Name", "Include")
+
+    def __init__(self, employees: list[AggregateEmployee], parent=None):
+        super().__init__(employees, parent)
+
+        self.selected = [True] * len(employees)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and index.column() == self.INPUT_COLUMN and role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self.selected[index.row()] else Qt.CheckState.Unchecked
+
+        return super().data(index, role)
+
+    def setData(self, index, value, role=Qt.ItemDataRole.CheckStateRole):
+        if not index.isValid() or index.column() != self.INPUT_COLUMN or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        self.selected[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+
+        if index.isValid() and index.column() == self.INPUT_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsSelectable
+
+        return flags
+
+    def selected_employees(self) -> list[AggregateEmployee]:
+        return [emp for emp, selected in zip(self.employees, self.selected) if selected]
\ No newline at end of file
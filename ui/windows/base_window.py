@@ -1,16 +1,29 @@
+import logging
 from abc import abstractmethod
-from typing import cast
+from typing import TYPE_CHECKING
 from PyQt6 import QtWidgets, uic
 
-from controllers.employee_report_controller import EmpReportController
+from ui.background_task import BackgroundTask, start_background_task
+from ui.models.employee_table_model import EmployeeTableModel
 from domain.dto.report_data import StoreReportData, AggregateReportData
-from utils.ui import center_on_screen, apply_style
+from utils.ui import center_on_screen, apply_style, show_error_message
 from utils.paths import resource_path
+from exceptions.task_exceptions import TaskCancelledError
+
+if TYPE_CHECKING:
+    from controllers.employee_report_controller import EmpReportController
 
 
 class BaseWindow(QtWidgets.QMainWindow):
 
-    def __init__(self, report_data: StoreReportData | AggregateReportData, controller: EmpReportController):
+    ID_COLUMN_WIDTH = 130
+    INPUT_COLUMN_WIDTH = 95
+    ROW_HEIGHT = 40
+
+    ERROR_MESSAGES: tuple = ()
+    FALLBACK_ERROR = ("Unexpected Error", "Failed to generate report.")
+
+    def __init__(self, report_data: StoreReportData | AggregateReportData, controller: "EmpReportController"):
         super().__init__()
 
         ui_path = resource_path("assets/ui/window.ui")
@@ -19,24 +32,30 @@ class BaseWindow(QtWidgets.QMainWindow):
         self.report_data = report_data
         self.controller = controller
 
-        self.rows_widgets: list[QtWidgets.QWidget] = []
+        self._task: BackgroundTask | None = None
 
-        self.empRowsLayout = cast(QtWidgets.QVBoxLayout, self.scrollAreaWidgetContents.layout())
+        self.model = self._create_model(self.report_data.employees)
+        self.empTable.setModel(self.model)
 
-        for emp in self.report_data.employees:
-            row = self._create_row(emp)
+        header = self.empTable.horizontalHeader()
+        header.setSectionResizeMode(EmployeeTableModel.ID_COLUMN, QtWidgets.QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(EmployeeTableModel.NAME_COLUMN, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(EmployeeTableModel.INPUT_COLUMN, QtWidgets.QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(EmployeeTableModel.ID_COLUMN, self.ID_COLUMN_WIDTH)
+        header.resizeSection(EmployeeTableModel.INPUT_COLUMN, self.INPUT_COLUMN_WIDTH)
 
-            self.empRowsLayout.addWidget(row)
-            self.rows_widgets.append(row)
+        rows = self.empTable.verticalHeader()
+        rows.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
 
-        self.empRowsLayout.addStretch()
+        self._configure_table()
 
         self.btnPrint.clicked.connect(self._submit)
 
         self.setWindowTitle("WIS Accuracy Data Analytics")
         self.resize(600, 600)
 
-        apply_style(self.scrollArea, resource_path("assets/styles/scrollbar.qss"))
+        apply_style(self.empTable.verticalScrollBar(), resource_path("assets/styles/scrollbar.qss"))
         center_on_screen(self)
 
     @abstractmethod
@@ -44,28 +63,37 @@ class BaseWindow(QtWidgets.QMainWindow):
         pass
 
     @abstractmethod
-    def _create_row(self, emp):
+    def _create_model(self, employees) -> EmployeeTableModel:
+        pass
+
+    @abstractmethod
+    def _configure_table(self):
         pass
 
-    @staticmethod
-    def _create_base_row(emp) -> tuple[QtWidgets.QWidget, QtWidgets.QHBoxLayout, QtWidgets.QLabel, QtWidgets.QLabel]:
-        row_widget = QtWidgets.QWidget()
+    def _start_report(self, generate):
+        self.btnPrint.setEnabled(False)
+        self._task = start_background_task(self, "Generating Report", generate, self._on_report_succeeded, self._on_report_failed)
+
+    def _on_report_succeeded(self, _):
+        self._task = None
+        self.btnPrint.setEnabled(True)
+
+    def _on_report_failed(self, error: Exception):
+        self._task = None
+        self.btnPrint.setEnabled(True)
 
-        layout = QtWidgets.QHBoxLayout(row_widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(10)
+        if isinstance(error, TaskCancelledError):
+            logging.info("Report generation cancelled")
+            return
 
-        label_id = QtWidgets.QLabel(emp.emp_id)
-        label_id.setFixedWidth(120)
-        layout.addWidget(label_id)
+        self._handle_report_error(error)
 
-        label_name = QtWidgets.QLabel(emp.emp_name)
-        label_name.setSizePolicy(
-            QtWidgets.QSizePolicy.Policy.Expanding,
-            QtWidgets.QSizePolicy.Policy.Fixed
-        )
-        layout.addWidget(label_name)
+    def _handle_report_error(self, error: Exception):
+        show_error_message(self, error, self.ERROR_MESSAGES, self.FALLBACK_ERROR, type(self).__name__)
+        self.close()
 
-        row_widget.setMinimumHeight(40)
+    def closeEvent(self, event):
+        if self._task is not None:
+            self._task.cancel()
 
-        return row_widget, layout, label_id, label_name
\ No newline at end of file
+        super().closeEvent(event)
\ No newline at end of file
@@ -1,8 +1,8 @@
-import logging
-from PyQt6 import QtWidgets, QtGui
-from PyQt6.QtCore import Qt
+from PyQt6 import QtWidgets
 
 from ui.windows.base_window import BaseWindow
+from ui.models.employee_table_model import EmployeeHoursTableModel
+from ui.delegates.hours_delegate import HoursDelegate
 from utils.paths import resource_path
 from utils.ui import apply_style
 from exceptions.database_exceptions import DatabaseConnectionError, DatabaseQueryError
@@ -13,44 +13,29 @@ from exceptions.validation_exceptions import InvalidHoursError
 
 class EmployeeHoursInputWindow(BaseWindow):
 
+    ERROR_MESSAGES = (
+        (InvalidHoursError, QtWidgets.QMessageBox.warning, "Invalid Input", "One or more employee hours are invalid. Please enter numeric values."),
+        (ReportGenerationError, QtWidgets.QMessageBox.critical, "Report Error", "Failed to generate report."),
+        (ReportExportError, QtWidgets.QMessageBox.critical, "Export Error", "Failed to export PDF report."),
+        (DatabaseConnectionError, QtWidgets.QMessageBox.critical, "Database Error", "Database connection failed."),
+        (DatabaseQueryError, QtWidgets.QMessageBox.critical, "Database Error", "Database query failed."),
+        (WisdomDataError, QtWidgets.QMessageBox.critical, "Data Error", "Failed to load wisdom data."),
+    )
+    FALLBACK_ERROR = ("Unexpected Error", "An unexpected error occurred.")
+
     def _submit(self):
         try:
             self.report_data.employees = self._collect_emp_hours()
-            self.controller.generate_current_report(self.report_data)
-
-        except InvalidHoursError as e:
-            logging.warning(str(e))
-            QtWidgets.QMessageBox.warning(self, "Invalid Input", "One or more employee hours are invalid. Please enter numeric values.")
-
-        except ReportGenerationError:
-            QtWidgets.QMessageBox.critical(self, "Report Error", "Failed to generate report.")
-
-        except ReportExportError:
-            QtWidgets.QMessageBox.critical(self, "Export Error", "Failed to export PDF report.")
-
-        except DatabaseConnectionError:
-            QtWidgets.QMessageBox.critical(self, "Database Error", "Database connection failed.")
+            self._start_report(lambda progress: self.controller.generate_current_report(self.report_data, progress=progress))
 
-        except DatabaseQueryError:
-            QtWidgets.QMessageBox.critical(self, "Database Error", "Database query failed.")
-
-        except WisdomDataError:
-            QtWidgets.QMessageBox.critical(self, "Data Error", "Failed to load wisdom data.")
-
-        except Exception:
-            logging.exception("Unhandled error in EmployeeHoursInputWindow.submit")
-            QtWidgets.QMessageBox.critical(self, "Unexpected Error", "An unexpected error occurred.")
-
-        finally:
-            self.close()
+        except Exception as e:
+            self._handle_report_error(e)
 
     def _collect_emp_hours(self):
         updated = []
 
-        for i, row_widget in enumerate(self.rows_widgets):
-            txt_hours = row_widget.txt_hours
-
-            raw = txt_hours.text().strip()
+        for i, raw in enumerate(self.model.hours):
+            raw = raw.strip()
 
             if raw == "":
                 hours = 0.0
@@ -69,28 +54,24 @@ class EmployeeHoursInputWindow(BaseWindow):
 
         return updated
 
-    def _create_row(self, emp):
-        row_widget, layout, label_id, label_name = self._create_base_row(emp)
+    def _create_model(self, employees) -> EmployeeHoursTableModel:
+        return EmployeeHoursTableModel(employees, self)
 
-        txt_hours = QtWidgets.QLineEdit("" if emp.hours is None else str(emp.hours))
-        txt_hours.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        txt_hours.setFixedWidth(75)
-        layout.addWidget(txt_hours)
+    def _configure_table(self):
+        delegate = HoursDelegate(self.empTable)
+        delegate.navigate.connect(self._move_editor)
 
-        def key_handler(event: QtGui.QKeyEvent):
-            if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Down):
-                txt_hours.focusNextChild()
-            elif event.key() == Qt.Key.Key_Up:
-                txt_hours.focusPreviousChild()
-            else:
-                QtWidgets.QLineEdit.keyPressEvent(txt_hours, event)
+        self.empTable.setItemDelegateForColumn(EmployeeHoursTableModel.INPUT_COLUMN, delegate)
+        self.empTable.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.AllEditTriggers)
 
-        txt_hours.keyPressEvent = key_handler
+        apply_style(self.empTable, resource_path("assets/styles/emp_hour_input_row.qss"))
 
-        row_widget.txt_hours = txt_hours
-        row_widget.label_id = label_id
-        row_widget.label_name = label_name
+        if self.model.rowCount():
+            self.empTable.setCurrentIndex(self.model.index(0, EmployeeHoursTableModel.INPUT_COLUMN))
 
-        apply_style(row_widget, resource_path("assets/styles/emp_hour_input_row.qss"))
+    def _move_editor(self, step: int):
+        current = self.empTable.currentIndex()
+        target = current.siblingAtRow(current.row() + step)
 
-        return row_widget
\ No newline at end of file
+        if target.isValid():
+            self.empTable.setCurrentIndex(target)
\ No newline at end of file
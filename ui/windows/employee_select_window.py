@@ -1,8 +1,8 @@
-import logging
-from typing import cast
-from PyQt6 import QtWidgets, QtCore
+from PyQt6 import QtWidgets
 
 from ui.windows.base_window import BaseWindow
+from ui.models.employee_table_model import EmployeeSelectTableModel
+from ui.delegates.check_box_delegate import CheckBoxDelegate
 from domain.dto.report_data import AggregateReportData
 from utils.paths import resource_path, get_installed_image_path
 from utils.ui import apply_qss_with_image
@@ -12,52 +12,38 @@ from exceptions.validation_exceptions import MissingEmployeeDataError
 
 class EmployeeSelectWindow(BaseWindow):
 
+    ERROR_MESSAGES = (
+        (ReportGenerationError, QtWidgets.QMessageBox.critical, "Report Error", "Failed to generate report."),
+    )
+
     def _submit(self):
         try:
-            selected_emp_data = []
-
-            for i, row_widget in enumerate(self.rows_widgets):
-                checkbox = cast(QtWidgets.QCheckBox, getattr(row_widget, "emp_select"))
-
-                if checkbox.checkState() != QtCore.Qt.CheckState.Checked:
-                    continue
-
-                selected_emp_data.append(self.report_data.employees[i])
+            selected_emp_data = self.model.selected_employees()
 
             if not selected_emp_data:
                 raise MissingEmployeeDataError("No employee selected")
 
             filtered_report = AggregateReportData(context=self.report_data.context, employees=selected_emp_data, zones=self.report_data.zones,)
 
-            self.controller.generate_aggregate_report(filtered_report)
+            self._start_report(lambda progress: self.controller.generate_aggregate_report(filtered_report, progress=progress))
 
         except MissingEmployeeDataError:
             QtWidgets.QMessageBox.warning(self, "No Selection", "Select at least one employee.")
-            return
 
-        except ReportGenerationError:
-            QtWidgets.QMessageBox.critical(self, "Report Error", "Failed to generate report.")
+        except Exception as e:
+            self._handle_report_error(e)
 
-        except Exception:
-            logging.exception("Unhandled error in EmployeeSelectWindow")
-            QtWidgets.QMessageBox.critical(self, "Unexpected Error", "Failed to generate report.")
+    def _on_report_succeeded(self, result):
+        super()._on_report_succeeded(result)
+        self.close()
 
-        finally:
-            self.close()
+    def _create_model(self, employees) -> EmployeeSelectTableModel:
+        return EmployeeSelectTableModel(employees, self)
 
-    def _create_row(self, emp):
-        row_widget, layout, label_id, label_name = self._create_base_row(emp)
-
-        emp_select = QtWidgets.QCheckBox()
-        emp_select.setChecked(True)
-        layout.addWidget(emp_select)
-
-        row_widget.emp_select = emp_select
-        row_widget.label_id = label_id
-        row_widget.label_name = label_name
+    def _configure_table(self):
+        self.empTable.setItemDelegateForColumn(EmployeeSelectTableModel.INPUT_COLUMN, CheckBoxDelegate(self.empTable))
+        self.empTable.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 
         qss_file = resource_path("assets/styles/emp_select_row.qss")
         image_path = get_installed_image_path()
-        apply_qss_with_image(row_widget, qss_file, image_path)
-
-        return row_widget
\ No newline at end of file
+        apply_qss_with_image(self.empTable, qss_file, image_path)
\ No newline at end of file
@@ -0,0 +1,16 @@
+import sqlite3
+
+try:
+    import pyodbc
+
+except ImportError:
+    pyodbc = None
+
+
+DRIVER_ERRORS = (sqlite3.Error,) + ((pyodbc.Error,) if pyodbc else ())
+INTEGRITY_ERRORS = (sqlite3.IntegrityError,) + ((pyodbc.IntegrityError,) if pyodbc else ())
+PROGRAMMING_ERRORS = (sqlite3.ProgrammingError, sqlite3.OperationalError) + ((pyodbc.ProgrammingError,) if pyodbc else ())
+
+
+def is_sqlite_connection(connection) -> bool:
+    return isinstance(getattr(connection, "raw_connection", connection), sqlite3.Connection)
\ No newline at end of file
@@ -10,16 +10,23 @@ from exceptions.wisdom_exceptions import WisdomDatabaseNotFoundError
 
 APP_NAME = "Accuracy_Report"
 
+_app_roots: dict[str, Path] = {}
+_config_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
 
 def get_appdata_root() -> Path:
     try:
-        root = Path(os.getenv("LOCALAPPDATA"))
+        root = os.getenv("LOCALAPPDATA") or os.getenv("XDG_DATA_HOME")
 
-        if not root:
+        if not root and sys.platform == "win32":
             raise FileLoadError("LOCALAPPDATA environment variable not set")
 
-        app_root = root / APP_NAME
-        app_root.mkdir(parents=True, exist_ok=True)
+        app_root = _app_roots.get(root or "")
+
+        if app_root is None:
+            app_root = Path(root or Path.home() / ".local" / "share") / APP_NAME
+            app_root.mkdir(parents=True, exist_ok=True)
+            _app_roots[root or ""] = app_root
 
         return app_root
 
@@ -32,11 +39,20 @@ def read_config_file():
     try:
         config_path = os.path.join(get_appdata_root(), "config.json")
 
-        if not os.path.exists(config_path):
+        try:
+            stat = os.stat(config_path)
+
+        except FileNotFoundError:
             raise FileLoadError(f"Config file not found: {config_path}")
 
-        with open(config_path, "r") as file:
-            return json.load(file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _config_cache.get(config_path)
+
+        if cached is None or cached[0] != stamp:
+            with open(config_path, "r") as file:
+                cached = _config_cache[config_path] = (stamp, json.load(file))
+
+        return dict(cached[1])
 
     except json.JSONDecodeError as e:
         logging.exception("Invalid config JSON")
@@ -66,6 +82,30 @@ def get_installed_image_path():
     return os.path.join(base_dir, "assets", "images", "checkmark.png").replace("\\", "/")
 
 
+def get_local_backend() -> str:
+    return read_config_file().get("local_backend", "access").lower()
+
+
+def get_sqlite_db_path() -> Path:
+    try:
+        config = read_config_file()
+        root = Path(os.path.expandvars(config["local_data_path"]))
+        root.mkdir(parents=True, exist_ok=True)
+
+        return root / config.get("sqlite_database_filename", "accuracy.sqlite3")
+
+    except Exception as e:
+        logging.exception("Failed to resolve SQLite database path")
+        raise FileLoadError("Failed to initialize database file") from e
+
+
+def get_legacy_db_path() -> Path | None:
+    config = read_config_file()
+    db_path = Path(os.path.expandvars(config["local_data_path"])) / config["database_filename"]
+
+    return db_path if db_path.exists() else None
+
+
 def get_db_path() -> Path:
     try:
         config = read_config_file()
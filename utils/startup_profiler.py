@@ -0,0 +1,129 @@
+import sys
+import time
+import logging
+import threading
+
+HEAVY_MODULES = ("pandas", "numpy", "pyodbc", "jinja2", "xhtml2pdf", "reportlab", "pypdf")
+
+
+class StartupProfiler:
+
+    REPORT_LIMIT = 25
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings: dict[str, tuple[float, float]] = {}
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def install(cls) -> "StartupProfiler":
+        profiler = cls()
+        sys.meta_path.insert(0, profiler)
+
+        return profiler
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+
+            find_spec = getattr(finder, "find_spec", None)
+            spec = find_spec(fullname, path, target) if find_spec else None
+
+            if spec is not None:
+                self._wrap(spec.loader)
+                return spec
+
+        return None
+
+    def report(self, label: str = "first dialog"):
+        self.uninstall()
+        elapsed = time.perf_counter() - self.started
+
+        with self._lock:
+            timings = dict(self.timings)
+
+        total = sum(own for _, own in timings.values())
+        loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+
+        lines = [
+            f"Startup reached {label} in {elapsed * 1000:.0f}ms, {len(timings)} modules imported in {total * 1000:.0f}ms",
+            f"Heavy modules loaded: {', '.join(loaded) or 'none'}",
+            f"{'module':<60} {'self (ms)':>10} {'cumulative (ms)':>16}",
+        ]
+
+        for name, (cumulative, own) in sorted(timings.items(), key=lambda item: -item[1][1])[:self.REPORT_LIMIT]:
+            lines.append(f"{name:<60} {own * 1000:>10.1f} {cumulative * 1000:>16.1f}")
+
+        for line in lines:
+            logging.info(line)
+
+    def _wrap(self, loader):
+        if loader is None or isinstance(loader, type) or getattr(loader, "_startup_profiler_wrapped", False):
+            return
+
+        exec_module = getattr(loader, "exec_module", None)
+        create_module = getattr(loader, "create_module", None)
+
+        if exec_module is None:
+            return
+
+        def timed_create_module(spec):
+            start = time.perf_counter()
+
+            try:
+                return create_module(spec)
+
+            finally:
+                self._created()[spec.name] = time.perf_counter() - start
+
+        def timed_exec_module(module):
+            stack = self._stack()
+            stack.append(0.0)
+            start = time.perf_counter() - self._created().pop(module.__name__, 0.0)
+
+            try:
+                exec_module(module)
+
+            finally:
+                cumulative = time.perf_counter() - start
+                children = stack.pop()
+
+                if stack:
+                    stack[-1] += cumulative
+
+                with self._lock:
+                    self.timings[module.__name__] = (cumulative, cumulative - children)
+
+        try:
+            loader.exec_module = timed_exec_module
+
+            if create_module is not None:
+                loader.create_module = timed_create_module
+
+            loader._startup_profiler_wrapped = True
+
+        except AttributeError:
+            pass
+
+    def _created(self) -> dict[str, float]:
+        created = getattr(self._local, "created", None)
+
+        if created is None:
+            created = self._local.created = {}
+
+        return created
+
+    def _stack(self) -> list[float]:
+        stack = getattr(self._local, "stack", None)
+
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
\ No newline at end of file
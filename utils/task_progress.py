@@ -0,0 +1,41 @@
+import threading
+from contextlib import contextmanager
+from typing import Callable
+
+from domain.enums.task_stage import TaskStage
+from exceptions.task_exceptions import TaskCancelledError
+
+
+class TaskProgress:
+
+    def __init__(self, on_update: Callable[[TaskStage, int, int], None] | None = None):
+        self.on_update = on_update
+        self._cancelled = threading.Event()
+        self._shielded = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @contextmanager
+    def shielded(self):
+        self._shielded += 1
+
+        try:
+            yield self
+
+        finally:
+            self._shielded -= 1
+
+    def check_cancelled(self):
+        if self._cancelled.is_set() and not self._shielded:
+            raise TaskCancelledError("Task was cancelled")
+
+    def update(self, stage: TaskStage, current: int = 0, total: int = 0):
+        self.check_cancelled()
+
+        if self.on_update is not None:
+            self.on_update(stage, current, total)
\ No newline at end of file
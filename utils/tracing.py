@@ -0,0 +1,237 @@
+import os
+import sys
+import json
+import time
+import uuid
+import atexit
+import logging
+import threading
+import tracemalloc
+from collections.abc import Sized
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+from utils.paths import get_log_path, read_config_file
+
+
+TRACE_ENV_VAR = "WIS_TRACE"
+QUERY_LABEL_LENGTH = 200
+
+_tracer = None
+_setup_lock = threading.Lock()
+
+
+class _NullSpan:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+
+    __slots__ = ("tracer", "name", "attrs", "started_at", "start", "base_memory", "peak_memory")
+
+    def __init__(self, tracer, name: str, attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.base_memory = 0
+        self.peak_memory = 0
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.started_at = datetime.now()
+        self.tracer.enter(self)
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        self.tracer.exit(self, duration, exc_type)
+
+        return False
+
+
+class Tracer:
+
+    def __init__(self, path: Path, trace_memory: bool = True):
+        self.path = path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.trace_memory = trace_memory
+
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+        self._active: set[Span] = set()
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def enter(self, span: Span):
+        with self._lock:
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+
+                for active in self._active:
+                    active.peak_memory = max(active.peak_memory, peak)
+
+                tracemalloc.reset_peak()
+                span.base_memory = span.peak_memory = current
+
+            self._active.add(span)
+
+    def exit(self, span: Span, duration: float, exc_type):
+        with self._lock:
+            self._active.discard(span)
+
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                span.peak_memory = max(span.peak_memory, peak)
+
+                for active in self._active:
+                    active.peak_memory = max(active.peak_memory, peak)
+
+            record = {
+                "run_id": self.run_id,
+                "ts": span.started_at.isoformat(timespec="milliseconds"),
+                "span": span.name,
+                "duration_ms": round(duration * 1000, 3),
+                "pid": os.getpid(),
+                "thread": threading.current_thread().name,
+            }
+
+            if self.trace_memory:
+                record["peak_memory_bytes"] = max(0, span.peak_memory - span.base_memory)
+
+            for key, value in span.attrs.items():
+                record[key] = _format_attr(key, value)
+
+            if exc_type is not None:
+                record["error"] = exc_type.__name__
+
+            try:
+                self._file.write(json.dumps(record, default=str) + "\n")
+
+            except Exception:
+                logging.exception("Failed to write trace record")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def setup_tracing(enabled: bool | None = None) -> Tracer | None:
+    global _tracer
+
+    with _setup_lock:
+        if _tracer is not None:
+            return _tracer
+
+        try:
+            config = read_config_file()
+
+        except Exception:
+            config = {}
+
+        if enabled is None:
+            enabled = os.environ.get(TRACE_ENV_VAR, "") == "1" or bool(config.get("tracing", False))
+
+        if not enabled:
+            return None
+
+        try:
+            path = get_log_path().parent / f"trace_{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}.jsonl"
+            _tracer = Tracer(path, trace_memory=bool(config.get("trace_memory", True)))
+
+        except Exception:
+            logging.exception("Failed to initialize tracing, continuing without it")
+            return None
+
+        atexit.register(shutdown_tracing)
+        logging.info(f"Tracing enabled, writing to {path}")
+
+        return _tracer
+
+
+def shutdown_tracing():
+    global _tracer
+
+    with _setup_lock:
+        tracer, _tracer = _tracer, None
+
+    if tracer is not None:
+        tracer.close()
+
+
+def trace_span(name: str, **attrs):
+    if _tracer is None:
+        return _NULL_SPAN
+
+    return Span(_tracer, name, attrs)
+
+
+def traced(name: str):
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+
+            with Span(_tracer, name, {}) as span:
+                result = fn(*args, **kwargs)
+
+                if isinstance(result, Sized) and not isinstance(result, (str, bytes)):
+                    span.set(rows=len(result))
+
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def summarize_trace(*paths) -> list[dict]:
+    stages = {}
+
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as trace_file:
+            for line in trace_file:
+                record = json.loads(line)
+                stage = stages.setdefault(record["span"], {"span": record["span"], "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "peak_memory_bytes": 0})
+
+                stage["calls"] += 1
+                stage["total_ms"] += record["duration_ms"]
+                stage["max_ms"] = max(stage["max_ms"], record["duration_ms"])
+                stage["rows"] += record.get("rows") or 0
+                stage["peak_memory_bytes"] = max(stage["peak_memory_bytes"], record.get("peak_memory_bytes") or 0)
+
+    return sorted(stages.values(), key=lambda stage: -stage["total_ms"])
+
+
+def _format_attr(key, value):
+    if key == "query" and isinstance(value, str):
+        return " ".join(value.split())[:QUERY_LABEL_LENGTH]
+
+    return value
+
+
+if __name__ == "__main__":
+    print(f"{'span':<60} {'calls':>6} {'total (ms)':>11} {'max (ms)':>10} {'rows':>9} {'peak (MB)':>10}")
+
+    for stage in summarize_trace(*sys.argv[1:]):
+        print(
+            f"{stage['span']:<60} {stage['calls']:>6} {stage['total_ms']:>11.1f} {stage['max_ms']:>10.1f} "
+            f"{stage['rows']:>9} {stage['peak_memory_bytes'] / 1_048_576:>10.1f}"
+        )
\ No newline at end of file
@@ -16,6 +16,17 @@ def center_on_screen(widget):
     widget.move(x, y)
 
 
+def show_error_message(parent, error: Exception, messages, fallback: tuple[str, str], context: str):
+    for error_type, show, title, text in messages:
+        if isinstance(error, error_type):
+            logging.warning(f"{context}: {error}")
+            show(parent, title, text)
+            return
+
+    logging.error(f"Unhandled error in {context}", exc_info=error)
+    QtWidgets.QMessageBox.critical(parent, *fallback)
+
+
 def apply_style(widget, style_path):
     try:
         with open(style_path, "r") as f: